@@ -10,13 +10,90 @@ Usage:
     python stock_analyzer.py 600887 --news --agent  # 使用 coding agent 深度分析
 """
 import argparse
+import heapq
+import math
 import sys
 import os
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from statistics import fmean
+from typing import List
 
 from valueinvest import Stock, StockHistory, ValuationEngine
+from valueinvest.cache import (
+    TTL_FCF,
+    TTL_FUNDAMENTALS,
+    TTL_NEWS,
+    TTL_PRICE,
+    FileCache,
+    cached,
+    set_default_cache,
+)
 from valueinvest.news.base import Market
 
+# 并发数据获取的线程上限，避免对上游数据源造成过大压力
+MAX_FETCH_WORKERS = 4
+
+# 表格行模板：形状固定，预先定义一次，逐行用 % 格式化
+FCF_ROW_FMT = "| %d | %s%.1f%s | %s%.1f%s | %s%.1f%s | %s%.1f%s | %.1f%% |"
+INSIDER_ROW_FMT = "| %s | %s | %s | %s | %s | %s |"
+BUYBACK_ROW_FMT = "| %s | %s | %s | %s |"
+
+# 情绪/质量标签对应的图标，模块加载时构建一次
+DEFAULT_EMOJI = "➡️"
+NEWS_SENTIMENT_EMOJI = {
+    "positive": "📈",
+    "slightly_positive": "↗️",
+    "neutral": "➡️",
+    "slightly_negative": "↘️",
+    "negative": "📉",
+}
+INSIDER_SENTIMENT_EMOJI = {"bullish": "📈", "bearish": "📉", "neutral": "➡️"}
+BUYBACK_SENTIMENT_EMOJI = {
+    "aggressive": "🟢",
+    "moderate": "🟡",
+    "minimal": "⚪",
+    "none": "⚫",
+}
+FCF_QUALITY_EMOJI = {
+    "excellent": "🟢",
+    "good": "🟢",
+    "acceptable": "🟡",
+    "poor": "🟠",
+    "negative": "🔴",
+}
+
+# 内部人交易表列宽 (终端显示宽度, 中文字符占 2 列)
+INSIDER_COL_WIDTHS = (5, 12, 12, 4, 12, 14)
+
+
+def display_width(ch: str) -> int:
+    """单个字符在等宽终端中的显示宽度"""
+    if unicodedata.combining(ch):
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+
+
+def fit_width(text: str, width: int) -> str:
+    """按显示宽度截断并右侧补空格, 保证中英文混排时列对齐"""
+    out = []
+    used = 0
+    for ch in text:
+        w = display_width(ch)
+        if used + w > width:
+            break
+        out.append(ch)
+        used += w
+    return "".join(out) + " " * (width - used)
+
+
+def fit_width_right(text: str, width: int) -> str:
+    """fit_width 的右对齐版本 (用于数字列)"""
+    used = sum(display_width(ch) for ch in text)
+    return " " * (width - used) + text if used < width else text
+
 
 def analyze_stock(
     ticker: str,
@@ -35,32 +112,48 @@ def analyze_stock(
     include_cyclical: bool = False,
     include_peers: bool = False,
 ):
-    print(f"\n正在获取 {ticker} 基本面数据...")
-
-    try:
-        stock = Stock.from_api(ticker)
-    except Exception as e:
-        print(f"错误: 无法获取基本面数据 - {e}")
-        sys.exit(1)
+    # 各数据源相互独立（网络 I/O 为主），并发获取以缩短总耗时；
+    # 进度与警告按固定顺序在取结果时输出
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        stock_future = executor.submit(load_stock, ticker)
+        history_future = executor.submit(load_price_history, ticker, period=history_period)
+        insider_future = (
+            executor.submit(fetch_insider_trades, ticker, days=insider_days)
+            if include_insider
+            else None
+        )
+        buyback_future = (
+            executor.submit(fetch_buyback, ticker, days=buyback_days) if include_buyback else None
+        )
+        fcf_future = executor.submit(fetch_fcf, ticker, years=fcf_years) if include_fcf else None
 
-    print(f"正在获取 {ticker} 价格历史...")
+        print(f"\n正在获取 {ticker} 基本面数据...")
+        try:
+            stock = stock_future.result()
+        except Exception as e:
+            # 取消尚未开始的请求；退出 with 时等待已在运行的请求结束
+            executor.shutdown(cancel_futures=True)
+            print(f"错误: 无法获取基本面数据 - {e}")
+            return False
 
-    try:
-        history = Stock.fetch_price_history(ticker, period=history_period)
-    except Exception as e:
-        print(f"警告: 无法获取价格历史 - {e}")
-        history = StockHistory(ticker=ticker)
+        print(f"正在获取 {ticker} 价格历史...")
+        try:
+            history = history_future.result()
+        except Exception as e:
+            print(f"警告: 无法获取价格历史 - {e}")
+            history = StockHistory(ticker=ticker)
 
-    if company_type == "auto":
-        company_type = detect_company_type(stock, history)
+        if company_type == "auto":
+            company_type = detect_company_type(stock, history)
 
-    set_valuation_params(stock, company_type, history)
+        set_valuation_params(stock, company_type, history)
 
-    news_analysis = None
-    if include_news:
-        print(f"正在获取 {ticker} 新闻数据...")
-        try:
-            news_analysis = fetch_and_analyze_news(
+        # 新闻分析依赖 stock 与 company_type，在基本面就绪后再提交
+        news_analysis = None
+        if include_news:
+            print(f"正在获取 {ticker} 新闻数据...")
+            news_future = executor.submit(
+                fetch_and_analyze_news,
                 ticker,
                 use_llm=use_llm,
                 use_agent=use_agent,
@@ -68,32 +161,38 @@ def analyze_stock(
                 stock=stock,
                 company_type=company_type,
             )
-        except Exception as e:
-            print(f"警告: 无法获取新闻数据 - {e}")
-
-    insider_result = None
-    if include_insider:
-        print(f"正在获取 {ticker} 内部人交易数据...")
-        try:
-            insider_result = fetch_insider_trades(ticker, days=insider_days)
-        except Exception as e:
-            print(f"警告: 无法获取内部人交易数据 - {e}")
-
-    buyback_result = None
-    if include_buyback:
-        print(f"正在获取 {ticker} 回购数据...")
-        try:
-            buyback_result = fetch_buyback(ticker, days=buyback_days)
-        except Exception as e:
-            print(f"警告: 无法获取回购数据 - {e}")
-
-    fcf_result = None
-    if include_fcf:
-        print(f"正在获取 {ticker} 自由现金流数据...")
-        try:
-            fcf_result = fetch_fcf(ticker, years=fcf_years)
-        except Exception as e:
-            print(f"警告: 无法获取自由现金流数据 - {e}")
+            try:
+                news_analysis = news_future.result()
+            except Exception as e:
+                print(f"警告: 无法获取新闻数据 - {e}")
+
+        insider_result = None
+        if insider_future is not None:
+            print(f"正在获取 {ticker} 内部人交易数据...")
+            try:
+                insider_result = insider_future.result()
+            except Exception as e:
+                print(f"警告: 无法获取内部人交易数据 - {e}")
+
+        buyback_result = None
+        if buyback_future is not None:
+            print(f"正在获取 {ticker} 回购数据...")
+            try:
+                buyback_result = buyback_future.result()
+            except Exception as e:
+                print(f"警告: 无法获取回购数据 - {e}")
+            if buyback_result is not None and buyback_result.summary is not None:
+                # 回购收益率用已获取的市值与股息率计算，不随回购数据一起缓存
+                buyback_result.market_cap = stock.market_cap
+                buyback_result.summary.apply_market_data(stock.market_cap, stock.dividend_yield)
+
+        fcf_result = None
+        if fcf_future is not None:
+            print(f"正在获取 {ticker} 自由现金流数据...")
+            try:
+                fcf_result = fcf_future.result()
+            except Exception as e:
+                print(f"警告: 无法获取自由现金流数据 - {e}")
 
     cyclical_result = None
     if include_cyclical:
@@ -156,10 +255,11 @@ def analyze_stock(
             print(f"警告: 无法进行同行对比 - {e}")
 
     print_report(
-        stock, history, company_type, history_period, news_analysis, insider_result, buyback_result, fcf_result, cyclical_result, peer_result
+        stock, history, company_type, history_period, news_analysis, insider_result, buyback_result, fcf_result, cyclical_result, peer_result,
     )
-def detect_company_type(stock: Stock, history: StockHistory) -> str:
-    UTILITIES_TICKERS = {
+    return True
+UTILITIES_TICKERS = frozenset(
+    {
         "600900",
         "601985",
         "600011",
@@ -170,11 +270,10 @@ def detect_company_type(stock: Stock, history: StockHistory) -> str:
         "000600",
         "001896",
     }
+)
 
-    if stock.ticker in UTILITIES_TICKERS:
-        return "dividend"
-
-    BANK_TICKERS = {
+BANK_TICKERS = frozenset(
+    {
         "601398",
         "601288",
         "600036",
@@ -191,14 +290,29 @@ def detect_company_type(stock: Stock, history: StockHistory) -> str:
         "600908",
         "601838",
     }
+)
+
+
+def detect_company_type(stock: Stock, history: StockHistory) -> str:
+    return _detect_company_type(
+        stock.ticker, stock.dividend_yield, history.cagr, history.cagr_hfq
+    )
+
+
+@lru_cache(maxsize=512)
+def _detect_company_type(
+    ticker: str, dividend_yield: float, cagr: float, cagr_hfq: float
+) -> str:
+    if ticker in UTILITIES_TICKERS:
+        return "dividend"
 
-    if stock.ticker in BANK_TICKERS:
+    if ticker in BANK_TICKERS:
         return "bank"
 
-    if stock.dividend_yield and stock.dividend_yield > 3:
+    if dividend_yield and dividend_yield > 3:
         return "dividend"
 
-    real_cagr = history.cagr_hfq if history.cagr_hfq != 0 else history.cagr
+    real_cagr = cagr_hfq if cagr_hfq != 0 else cagr
 
     if real_cagr and real_cagr > 10:
         return "growth"
@@ -209,6 +323,17 @@ def detect_company_type(stock: Stock, history: StockHistory) -> str:
     return "general"
 
 
+@cached(endpoint="quote", ttl=TTL_PRICE)
+def load_stock(ticker: str) -> Stock:
+    return Stock.from_api(ticker)
+
+
+@cached(endpoint="history", ttl=TTL_PRICE)
+def load_price_history(ticker: str, period: str = "5y") -> StockHistory:
+    return Stock.fetch_price_history(ticker, period=period)
+
+
+@cached(endpoint="insider", ttl=TTL_FUNDAMENTALS)
 def fetch_insider_trades(ticker: str, days: int = 90):
     from valueinvest.insider.registry import InsiderRegistry
 
@@ -217,14 +342,17 @@ def fetch_insider_trades(ticker: str, days: int = 90):
     return result
 
 
+@cached(endpoint="buyback", ttl=TTL_FUNDAMENTALS)
 def fetch_buyback(ticker: str, days: int = 365):
     from valueinvest.buyback.registry import BuybackRegistry
 
     fetcher = BuybackRegistry.get_fetcher(ticker)
-    result = fetcher.fetch_buyback(ticker, days=days)
+    # 市值与股息率由调用方在缓存外填入 (summary.apply_market_data)，此处跳过行情查询
+    result = fetcher.fetch_buyback(ticker, days=days, market_cap=0.0, dividend_yield=0.0)
     return result
 
 
+@cached(endpoint="fcf", ttl=TTL_FCF)
 def fetch_fcf(ticker: str, years: int = 5):
     from valueinvest.cashflow.registry import CashFlowRegistry
 
@@ -232,6 +360,18 @@ def fetch_fcf(ticker: str, years: int = 5):
     result = fetcher.fetch_cashflow(ticker, years=years)
     return result
 
+
+@cached(endpoint="news", ttl=TTL_NEWS)
+def fetch_news(ticker: str, days: int = 30):
+    from valueinvest.news.registry import NewsRegistry
+
+    fetcher = NewsRegistry.get_fetcher(ticker)
+    fetch_result = fetcher.fetch_all(ticker, days=days)
+    # 获取时按发布时间倒序排一次，后续分析器保持顺序，报告直接取前几条
+    fetch_result.news.sort(key=lambda n: n.publish_date, reverse=True)
+    return fetch_result
+
+
 def fetch_and_analyze_news(
     ticker: str,
     use_llm: bool = False,
@@ -240,48 +380,41 @@ def fetch_and_analyze_news(
     stock=None,
     company_type: str = "general",
 ):
-    from valueinvest.news.registry import NewsRegistry
-    from valueinvest.news.analyzer.keyword_analyzer import KeywordSentimentAnalyzer
-    from valueinvest.news.analyzer.llm_analyzer import LLMSentimentAnalyzer
-    from valueinvest.news.analyzer.agent_analyzer import (
-        AgentSentimentAnalyzer,
-        create_agent_analysis_prompt,
-        enhance_analysis_with_agent_result,
-    )
-
-    fetcher = NewsRegistry.get_fetcher(ticker)
-    fetch_result = fetcher.fetch_all(ticker, days=days)
+    # 分析器按分支延迟导入，只加载实际使用的那一个
+    fetch_result = fetch_news(ticker, days=days)
 
     if use_agent:
+        from valueinvest.news.analyzer.agent_analyzer import (
+            AgentSentimentAnalyzer,
+            create_agent_analysis_prompt,
+        )
+
         print("  使用 Coding Agent 进行深度分析...")
         analyzer = AgentSentimentAnalyzer()
         analysis_result = analyzer.analyze_batch(fetch_result.news, ticker)
         analysis_result.guidance = fetch_result.guidance
         analysis_result.analyzer_type = "agent"
 
-        if stock:
-            stock_name = stock.name if stock else ticker
-            current_price = stock.current_price if stock else 0.0
-        else:
-            stock_name = ticker
-            current_price = 0.0
-
         analysis_result.agent_prompt = create_agent_analysis_prompt(
             ticker=ticker,
-            stock_name=stock_name,
-            current_price=current_price,
+            stock_name=stock.name if stock else ticker,
+            current_price=stock.current_price if stock else 0.0,
             company_type=company_type,
             news=fetch_result.news,
             days=days,
         )
 
     elif use_llm:
+        from valueinvest.news.analyzer.llm_analyzer import LLMSentimentAnalyzer
+
         api_key = os.environ.get("OPENAI_API_KEY")
         analyzer = LLMSentimentAnalyzer(api_key=api_key)
         analysis_result = analyzer.analyze_batch(fetch_result.news, ticker)
         analysis_result.guidance = fetch_result.guidance
 
     else:
+        from valueinvest.news.analyzer.keyword_analyzer import KeywordSentimentAnalyzer
+
         analyzer = KeywordSentimentAnalyzer()
         analysis_result = analyzer.analyze_batch(fetch_result.news, ticker)
         analysis_result.guidance = fetch_result.guidance
@@ -298,29 +431,47 @@ def set_valuation_params(stock: Stock, company_type: str, history: StockHistory)
     stock.terminal_growth = 2.5
 
     # 使用历史CAGR作为增长率参考（如果为负则使用保守估计）
-    if history.cagr and history.cagr > 0:
-        stock.growth_rate = min(history.cagr, 10)  # 上限10%
-    else:
-        stock.growth_rate = 3.0
-
-    stock.growth_rate_1_5 = stock.growth_rate
-    stock.growth_rate_6_10 = stock.growth_rate * 0.6  # 后期增长放缓
+    # 先在局部变量中算好，最后一次性写回 stock
+    cagr = history.cagr
+    growth = min(cagr, 10) if cagr and cagr > 0 else 3.0  # 上限10%
+    late_growth_factor = 0.6  # 后期增长放缓
 
     # 根据类型调整
     if company_type == "bank":
-        stock.growth_rate = min(stock.growth_rate, 5)
-        stock.growth_rate_1_5 = stock.growth_rate
-        stock.growth_rate_6_10 = stock.growth_rate * 0.5
+        growth = min(growth, 5)
+        late_growth_factor = 0.5
     elif company_type == "dividend":
         # Only use fallback if dividend_growth_rate wasn't fetched from data source
         if stock.dividend_growth_rate == 0:
-            stock.dividend_growth_rate = min(stock.growth_rate, 5)
-        stock.dividend_growth_rate = min(stock.growth_rate, 5)
-    elif company_type == "growth":
+            stock.dividend_growth_rate = min(growth, 5)
+        stock.dividend_growth_rate = min(growth, 5)
+
+    stock.growth_rate = growth
+    stock.growth_rate_1_5 = growth
+    stock.growth_rate_6_10 = growth * late_growth_factor
+
+    if company_type == "growth":
         stock.cost_of_capital = 10.0  # 成长股要求更高回报
         stock.discount_rate = 10.0
 
 
+@lru_cache(maxsize=1)
+def get_valuation_engine() -> ValuationEngine:
+    """进程内共享一个估值引擎 (无状态), 批量模式下避免每只股票重复构建"""
+    return ValuationEngine()
+
+
+def read_ticker_file(path: str) -> List[str]:
+    """读取批量股票列表: 每行一个代码, 忽略空行和 # 注释"""
+    tickers = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            ticker = line.split("#", 1)[0].strip()
+            if ticker:
+                tickers.append(ticker)
+    return tickers
+
+
 def print_report(
     stock: Stock,
     history: StockHistory,
@@ -333,7 +484,7 @@ def print_report(
     cyclical_result=None,
     peer_result=None,
 ):
-    engine = ValuationEngine()
+    engine = get_valuation_engine()
 
     if company_type == "bank":
         results = engine.run_bank(stock)
@@ -348,144 +499,158 @@ def print_report(
         r for r in results if r.fair_value and r.fair_value > 0 and "Error" not in r.assessment
     ]
 
-    print("\n" + "=" * 70)
-    print(f"{stock.name} ({stock.ticker}) - 深度分析报告")
-    print("=" * 70)
+    # 报告中多次用到的字段先绑定为局部变量
+    price = stock.current_price
+    growth = stock.growth_rate
+    div_return = stock.dividend_yield or 0
+
+    # 报告各段先写入缓冲区，最后一次性输出，避免上百次 print 调用
+    buf: List[str] = []
+
+    buf.append("\n" + "=" * 70)
+    buf.append(f"{stock.name} ({stock.ticker}) - 深度分析报告")
+    buf.append("=" * 70)
 
-    print(f"\n【公司概况】")
-    print(f"  公司: {stock.name}")
-    print(f"  代码: {stock.ticker}")
-    print(f"  类型: {get_type_label(company_type)}")
-    print(f"  当前股价: ¥{stock.current_price:.2f}")
-    print(f"  总市值: ¥{stock.current_price * stock.shares_outstanding / 1e8:.0f}亿")
+    buf.append(f"\n【公司概况】")
+    buf.append(f"  公司: {stock.name}")
+    buf.append(f"  代码: {stock.ticker}")
+    buf.append(f"  类型: {get_type_label(company_type)}")
+    buf.append(f"  当前股价: ¥{price:.2f}")
+    buf.append(f"  总市值: ¥{price * stock.shares_outstanding / 1e8:.0f}亿")
 
-    print(f"\n【最新财务数据】")
+    buf.append(f"\n【最新财务数据】")
     if stock.revenue:
-        print(f"  营业收入: ¥{stock.revenue/1e8:.0f}亿")
+        buf.append(f"  营业收入: ¥{stock.revenue/1e8:.0f}亿")
     if stock.net_income:
-        print(f"  净利润: ¥{stock.net_income/1e8:.0f}亿")
-    print(f"  每股收益 (EPS): ¥{stock.eps:.2f}")
-    print(f"  每股净资产 (BVPS): ¥{stock.bvps:.2f}")
-    print(f"  市盈率 (PE): {stock.pe_ratio:.1f}倍")
-    print(f"  市净率 (PB): {stock.pb_ratio:.2f}倍")
+        buf.append(f"  净利润: ¥{stock.net_income/1e8:.0f}亿")
+    buf.append(f"  每股收益 (EPS): ¥{stock.eps:.2f}")
+    buf.append(f"  每股净资产 (BVPS): ¥{stock.bvps:.2f}")
+    buf.append(f"  市盈率 (PE): {stock.pe_ratio:.1f}倍")
+    buf.append(f"  市净率 (PB): {stock.pb_ratio:.2f}倍")
 
-    print(f"\n【历史表现 ({history_period})】")
+    buf.append(f"\n【历史表现 ({history_period})】")
     if history.prices:
-        print(f"  股价CAGR (qfq): {history.cagr:.2f}%")
-        print(f"  真实回报 (hfq): {history.cagr_hfq:.2f}%")
-        print(f"  年化波动率: {history.volatility:.2f}%")
-        print(f"  最大回撤: {history.max_drawdown:.2f}%")
+        buf.append(f"  股价CAGR (qfq): {history.cagr:.2f}%")
+        buf.append(f"  真实回报 (hfq): {history.cagr_hfq:.2f}%")
+        buf.append(f"  年化波动率: {history.volatility:.2f}%")
+        buf.append(f"  最大回撤: {history.max_drawdown:.2f}%")
 
         recent_stats = history.get_price_stats(days=30, adjust="qfq")
         if recent_stats:
-            print()
-            print(f"【近30日价格 (QFQ前复权)】")
-            print(f"  最高: ¥{recent_stats['high']:.2f}")
-            print(f"  最低: ¥{recent_stats['low']:.2f}")
-            print(f"  均价: ¥{recent_stats['avg']:.2f}")
-            print(f"  最新: ¥{recent_stats['latest']:.2f}")
-            print(f"  涨跌幅: {recent_stats['change_pct']:+.2f}%")
+            buf.append("")
+            buf.append(f"【近30日价格 (QFQ前复权)】")
+            buf.append(f"  最高: ¥{recent_stats['high']:.2f}")
+            buf.append(f"  最低: ¥{recent_stats['low']:.2f}")
+            buf.append(f"  均价: ¥{recent_stats['avg']:.2f}")
+            buf.append(f"  最新: ¥{recent_stats['latest']:.2f}")
+            buf.append(f"  涨跌幅: {recent_stats['change_pct']:+.2f}%")
 
         if history.cagr_hfq != 0:
-            print()
-            print(f"【真实投资回报 (HFQ后复权)】")
-            print(f"  含分红再投资CAGR: {history.cagr_hfq:.2f}%")
+            buf.append("")
+            buf.append(f"【真实投资回报 (HFQ后复权)】")
+            buf.append(f"  含分红再投资CAGR: {history.cagr_hfq:.2f}%")
             stats_hfq = history.get_price_stats(days=30, adjust="hfq")
             if stats_hfq:
-                print(f"  (后复权价格: ¥{stats_hfq['latest']:.0f})")
+                buf.append(f"  (后复权价格: ¥{stats_hfq['latest']:.0f})")
 
         recent_prices = history.get_recent_prices(days=10, adjust="qfq")
         if recent_prices:
-            print()
-            print(f"【近10日收盘价 (QFQ)】")
-            for i, p in enumerate(recent_prices[-10:]):
-                change = ""
-                if i > 0:
-                    prev_close = recent_prices[i - 1]["close"]
-                    if prev_close > 0:
-                        change = f" ({(p['close']/prev_close - 1)*100:+.2f}%)"
-                print(f"  {p['date']}: ¥{p['close']:.2f}{change}")
-
-        print()
-        print("  注: QFQ(前复权)用于与估值比较, HFQ(后复权)反映真实含分红回报")
+            import numpy as np  # 有价格数据时 pandas/numpy 必然已安装
+
+            buf.append("")
+            buf.append(f"【近10日收盘价 (QFQ)】")
+            recent_prices = recent_prices[-10:]
+            closes = np.array([p["close"] for p in recent_prices], dtype=np.float64)
+            # 日涨跌幅一次向量计算; 首日及前收盘价 <= 0 时记为 NaN (不显示)
+            pct = np.full_like(closes, np.nan)
+            prev = closes[:-1]
+            np.divide(closes[1:], prev, out=pct[1:], where=prev > 0)
+            pct[1:] = (pct[1:] - 1) * 100
+            for p, c in zip(recent_prices, pct.tolist()):
+                change = "" if math.isnan(c) else f" ({c:+.2f}%)"
+                buf.append(f"  {p['date']}: ¥{p['close']:.2f}{change}")
+
+        buf.append("")
+        buf.append("  注: QFQ(前复权)用于与估值比较, HFQ(后复权)反映真实含分红回报")
     else:
-        print("  (无历史价格数据)")
+        buf.append("  (无历史价格数据)")
 
     if news_analysis and news_analysis.news:
-        print_news_analysis(news_analysis)
+        print_news_analysis(news_analysis, buf)
 
     if insider_result and insider_result.has_trades:
-        print_insider_trades(insider_result)
+        print_insider_trades(insider_result, buf)
 
     if buyback_result and buyback_result.has_records:
-        print_buyback(buyback_result)
+        print_buyback(buyback_result, buf)
 
     if buyback_result and buyback_result.summary and buyback_result.summary.has_buyback:
-        print_shareholder_yield(stock, buyback_result.summary)
+        print_shareholder_yield(stock, buyback_result.summary, buf)
 
     if fcf_result and fcf_result.summary and fcf_result.summary.has_fcf_data:
-        print_fcf_analysis(fcf_result, buyback_result.summary if buyback_result else None)
+        print_fcf_analysis(fcf_result, buf, buyback_result.summary if buyback_result else None)
 
     if peer_result and peer_result.has_sufficient_peers:
-        print_peer_comparison(peer_result, stock)
+        print_peer_comparison(peer_result, stock, buf)
     elif peer_result and not peer_result.has_sufficient_peers:
-        print("\n" + "=" * 70)
-        print("【同行对比】")
-        print("=" * 70)
-        print()
+        buf.append("\n" + "=" * 70)
+        buf.append("【同行对比】")
+        buf.append("=" * 70)
+        buf.append("")
         for w in peer_result.warnings:
-            print(f"  ⚠️ {w}")
+            buf.append(f"  ⚠️ {w}")
 
-    print("\n" + "=" * 70)
-    print("【估值汇总】")
-    print("=" * 70)
-    print()
+    buf.append("\n" + "=" * 70)
+    buf.append("【估值汇总】")
+    buf.append("=" * 70)
+    buf.append("")
 
     sorted_results = sorted(valid_results, key=lambda x: x.fair_value)
-    print("| 方法 | 公允价值 | 溢价/折价 | 评估 |")
-    print("|------|----------|-----------|------|")
+    buf.append("| 方法 | 公允价值 | 溢价/折价 | 评估 |")
+    buf.append("|------|----------|-----------|------|")
     for r in sorted_results:
         name = r.method[:20]
-        print(
+        buf.append(
             f"| {name:20} | ¥{r.fair_value:>7.2f} | {r.premium_discount:>+7.1f}% | {r.assessment[:10]:10} |"
         )
 
-    print()
-    fair_values = [r.fair_value for r in valid_results]
-    avg_value = sum(fair_values) / len(fair_values)
-    median_value = sorted(fair_values)[len(fair_values) // 2]
+    buf.append("")
+    # sorted_results 已按公允价值升序排列，后续中位数/区间统计直接复用，无需重复排序
+    fair_values = [r.fair_value for r in sorted_results]
+    avg_value = fmean(fair_values)
+    median_value = fair_values[len(fair_values) // 2]
 
-    print("【统计汇总】")
-    print(f"  有效估值方法数: {len(valid_results)}")
-    print(f"  公允价值范围: ¥{min(fair_values):.2f} - ¥{max(fair_values):.2f}")
-    print(f"  平均公允价值: ¥{avg_value:.2f}")
-    print(f"  中位数公允价值: ¥{median_value:.2f}")
+    buf.append("【统计汇总】")
+    buf.append(f"  有效估值方法数: {len(valid_results)}")
+    buf.append(f"  公允价值范围: ¥{fair_values[0]:.2f} - ¥{fair_values[-1]:.2f}")
+    buf.append(f"  平均公允价值: ¥{avg_value:.2f}")
+    buf.append(f"  中位数公允价值: ¥{median_value:.2f}")
 
-    avg_premium = ((avg_value - stock.current_price) / stock.current_price) * 100
+    avg_premium = ((avg_value - price) / price) * 100
 
     undervalued = len([r for r in valid_results if r.assessment == "Undervalued"])
     overvalued = len([r for r in valid_results if r.assessment == "Overvalued"])
 
-    print()
-    print(f"  相对平均值: {avg_premium:+.1f}%")
-    print(f"  低估方法数: {undervalued}/{len(valid_results)}")
-    print(f"  高估方法数: {overvalued}/{len(valid_results)}")
+    buf.append("")
+    buf.append(f"  相对平均值: {avg_premium:+.1f}%")
+    buf.append(f"  低估方法数: {undervalued}/{len(valid_results)}")
+    buf.append(f"  高估方法数: {overvalued}/{len(valid_results)}")
 
-    print("\n" + "=" * 70)
-    print("【最终结论】")
-    print("=" * 70)
-    print()
+    buf.append("\n" + "=" * 70)
+    buf.append("【最终结论】")
+    buf.append("=" * 70)
+    buf.append("")
 
-    conservative = sorted(fair_values)[:3]
-    optimistic = sorted(fair_values)[-3:]
+    conservative = fair_values[:3]
+    optimistic = fair_values[-3:]
 
-    cons_avg = sum(conservative) / len(conservative)
-    opt_avg = sum(optimistic) / len(optimistic)
+    cons_avg = fmean(conservative)
+    opt_avg = fmean(optimistic)
 
-    print(
-        f"估值区间: ¥{cons_avg:.0f}-{sorted(fair_values)[len(fair_values)//2]:.0f} (保守) / ¥{stock.current_price:.0f} (现价) / ¥{opt_avg:.0f}+ (乐观)"
+    buf.append(
+        f"估值区间: ¥{cons_avg:.0f}-{median_value:.0f} (保守) / ¥{price:.0f} (现价) / ¥{opt_avg:.0f}+ (乐观)"
     )
-    print()
+    buf.append("")
 
     if avg_premium < -15:
         rating = "低估 (Undervalued)"
@@ -497,201 +662,209 @@ def print_report(
         rating = "合理 (Fair)"
         advice = "当前价格处于合理区间"
 
-    print(f"【综合评级】: {rating}")
-    print()
-    print("投资建议:")
+    buf.append(f"【综合评级】: {rating}")
+    buf.append("")
+    buf.append("投资建议:")
 
     target_price = median_value * 0.85
     stop_loss = cons_avg * 0.9
 
-    print(
-        f"  1. 已持有者: {'继续持有' if stock.dividend_yield and stock.dividend_yield > 3 else '持有观望'}"
+    buf.append(
+        f"  1. 已持有者: {'继续持有' if div_return > 3 else '持有观望'}"
     )
-    print(f"  2. 潜在买入: 等待回调至¥{target_price:.0f}以下")
-    print(f"  3. 目标价位: ¥{target_price:.0f} (提供15%+安全边际)")
-    print(f"  4. 止损位: ¥{stop_loss:.0f}")
-    print()
-
-    if stock.dividend_yield:
-        div_return = stock.dividend_yield
-    else:
-        div_return = 0
-
-    print("预期回报:")
-    print(f"  保守: 股息{div_return:.1f}% + 增长0-2% = {div_return:.1f}-{div_return+2:.1f}%/年")
-    print(
-        f"  中性: 股息{div_return:.1f}% + 增长{stock.growth_rate:.0f}% = {div_return+stock.growth_rate:.1f}%/年"
+    buf.append(f"  2. 潜在买入: 等待回调至¥{target_price:.0f}以下")
+    buf.append(f"  3. 目标价位: ¥{target_price:.0f} (提供15%+安全边际)")
+    buf.append(f"  4. 止损位: ¥{stop_loss:.0f}")
+    buf.append("")
+
+    buf.append("预期回报:")
+    buf.append(f"  保守: 股息{div_return:.1f}% + 增长0-2% = {div_return:.1f}-{div_return+2:.1f}%/年")
+    buf.append(
+        f"  中性: 股息{div_return:.1f}% + 增长{growth:.0f}% = {div_return+growth:.1f}%/年"
     )
-    print(
-        f"  乐观: 股息{div_return:.1f}% + 增长{stock.growth_rate*1.5:.0f}% = {div_return+stock.growth_rate*1.5:.1f}%/年"
+    buf.append(
+        f"  乐观: 股息{div_return:.1f}% + 增长{growth*1.5:.0f}% = {div_return+growth*1.5:.1f}%/年"
     )
-    print()
+    buf.append("")
 
+    sys.stdout.write("\n".join(buf) + "\n")
+    sys.stdout.flush()
 
-def print_news_analysis(analysis):
-    print("\n" + "=" * 70)
-    print("【新闻情感分析】")
-    print("=" * 70)
-    print()
 
-    sentiment_emoji = {
-        "positive": "📈",
-        "slightly_positive": "↗️",
-        "neutral": "➡️",
-        "slightly_negative": "↘️",
-        "negative": "📉",
-    }
-    emoji = sentiment_emoji.get(analysis.sentiment_label, "➡️")
+def print_news_analysis(analysis, buf: List[str]):
+    buf.append("\n" + "=" * 70)
+    buf.append("【新闻情感分析】")
+    buf.append("=" * 70)
+    buf.append("")
 
-    print(f"  情感得分: {emoji} {analysis.sentiment_score:+.2f} ({analysis.sentiment_label})")
-    print(f"  分析新闻数: {len(analysis.news)} 条 (7日内: {analysis.news_count_7d})")
-    print(
+    emoji = NEWS_SENTIMENT_EMOJI.get(analysis.sentiment_label, DEFAULT_EMOJI)
+
+    buf.append(f"  情感得分: {emoji} {analysis.sentiment_score:+.2f} ({analysis.sentiment_label})")
+    buf.append(f"  分析新闻数: {len(analysis.news)} 条 (7日内: {analysis.news_count_7d})")
+    buf.append(
         f"  正面/负面/中性: {analysis.positive_count}/{analysis.negative_count}/{analysis.neutral_count}"
     )
-    print(f"  置信度: {analysis.confidence:.0%}")
+    buf.append(f"  置信度: {analysis.confidence:.0%}")
 
     if analysis.key_themes:
-        print()
-        print("【关键主题】")
+        buf.append("")
+        buf.append("【关键主题】")
         for theme in analysis.key_themes[:5]:
-            print(f"  • {theme}")
+            buf.append(f"  • {theme}")
 
     if analysis.risks:
-        print()
-        print("【风险提示】")
+        buf.append("")
+        buf.append("【风险提示】")
         for risk in analysis.risks[:5]:
-            print(f"  ⚠️ {risk}")
+            buf.append(f"  ⚠️ {risk}")
 
     if analysis.catalysts:
-        print()
-        print("【潜在催化剂】")
+        buf.append("")
+        buf.append("【潜在催化剂】")
         for catalyst in analysis.catalysts[:5]:
-            print(f"  ✅ {catalyst}")
+            buf.append(f"  ✅ {catalyst}")
 
-    recent_news = sorted(analysis.news, key=lambda n: n.publish_date, reverse=True)[:5]
+    # fetch_news 已按发布时间倒序排列
+    recent_news = analysis.news[:5]
     if recent_news:
-        print()
-        print("【近期重要新闻】")
+        buf.append("")
+        buf.append("【近期重要新闻】")
         for news in recent_news:
             sentiment_mark = "+" if news.is_positive else ("-" if news.is_negative else " ")
             date_str = news.publish_date.strftime("%m-%d")
             title = news.title[:40] + "..." if len(news.title) > 40 else news.title
-            print(f"  [{sentiment_mark}] {date_str} {title}")
+            buf.append(f"  [{sentiment_mark}] {date_str} {title}")
 
 
-def print_insider_trades(insider_result):
-    print("\n" + "=" * 70)
-    print("【内部人交易】")
-    print("=" * 70)
-    print()
+def print_insider_trades(insider_result, buf: List[str]):
+    buf.append("\n" + "=" * 70)
+    buf.append("【内部人交易】")
+    buf.append("=" * 70)
+    buf.append("")
 
     summary = insider_result.summary
     if summary:
-        sentiment_emoji = {"bullish": "📈", "bearish": "📉", "neutral": "➡️"}
-        emoji = sentiment_emoji.get(summary.sentiment, "➡️")
+        emoji = INSIDER_SENTIMENT_EMOJI.get(summary.sentiment, DEFAULT_EMOJI)
 
-        print(f"  情绪: {emoji} {summary.sentiment.upper()}")
-        print(
+        buf.append(f"  情绪: {emoji} {summary.sentiment.upper()}")
+        buf.append(
             f"  交易笔数: {summary.total_trades} (买入: {summary.buy_count}, 卖出: {summary.sell_count})"
         )
-        print(f"  净交易: {summary.net_shares:+,.0f} 股 (¥{summary.net_value:+,.0f})")
-        print(f"  参与高管: {summary.unique_insiders} 人")
-        print(f"  CEO/CFO交易: {summary.key_insider_trades} 笔")
+        buf.append(f"  净交易: {summary.net_shares:+,.0f} 股 (¥{summary.net_value:+,.0f})")
+        buf.append(f"  参与高管: {summary.unique_insiders} 人")
+        buf.append(f"  CEO/CFO交易: {summary.key_insider_trades} 笔")
 
         if summary.buy_value > 0 or summary.sell_value > 0:
-            print(f"  买入比例: {summary.buy_ratio:.0%}")
+            buf.append(f"  买入比例: {summary.buy_ratio:.0%}")
 
     recent_trades = insider_result.trades[:10]
     if recent_trades:
-        print()
-        print("【近期交易】")
-        print("| 日期 | 高管 | 职位 | 类型 | 股数 | 金额 |")
-        print("|------|------|------|------|------|------|")
+        buf.append("")
+        buf.append("【近期交易】")
+        w_date, w_name, w_title, w_type, w_shares, w_value = INSIDER_COL_WIDTHS
+        buf.append(
+            INSIDER_ROW_FMT
+            % (
+                fit_width("日期", w_date),
+                fit_width("高管", w_name),
+                fit_width("职位", w_title),
+                fit_width("类型", w_type),
+                fit_width_right("股数", w_shares),
+                fit_width_right("金额", w_value),
+            )
+        )
+        buf.append(INSIDER_ROW_FMT % tuple("-" * w for w in INSIDER_COL_WIDTHS))
+        rows = []
         for trade in recent_trades:
-            date_str = trade.trade_date.strftime("%m-%d")
-            name = trade.insider_name[:6]
-            title = trade.title.value[:6]
             ttype = "买入" if trade.is_buy else ("卖出" if trade.is_sell else "其他")
-            shares = f"{trade.shares:,.0f}"
             value = f"¥{trade.value:,.0f}" if trade.value else "-"
-            print(f"| {date_str} | {name} | {title} | {ttype} | {shares} | {value} |")
+            rows.append(
+                INSIDER_ROW_FMT
+                % (
+                    trade.trade_date.strftime("%m-%d"),
+                    fit_width(trade.insider_name, w_name),
+                    fit_width(trade.title.value, w_title),
+                    ttype,
+                    f"{trade.shares:,.0f}".rjust(w_shares),
+                    value.rjust(w_value),
+                )
+            )
+        buf.append("\n".join(rows))
 
 
-def print_buyback(buyback_result):
-    print("\n" + "=" * 70)
-    print("【回购分析】")
-    print("=" * 70)
-    print()
+def print_buyback(buyback_result, buf: List[str]):
+    buf.append("\n" + "=" * 70)
+    buf.append("【回购分析】")
+    buf.append("=" * 70)
+    buf.append("")
 
     summary = buyback_result.summary
     if summary:
-        sentiment_emoji = {
-            "aggressive": "🟢",
-            "moderate": "🟡",
-            "minimal": "⚪",
-            "none": "⚫",
-        }
-        emoji = sentiment_emoji.get(summary.sentiment.value, "➡️")
-
-        print(f"  回购情绪: {emoji} {summary.sentiment.value.upper()}")
-        print(f"  回购收益率: {summary.buyback_yield:.2f}%")
-        print(f"  总股东收益率: {summary.total_shareholder_yield:.2f}%")
+        emoji = BUYBACK_SENTIMENT_EMOJI.get(summary.sentiment.value, DEFAULT_EMOJI)
+
+        buf.append(f"  回购情绪: {emoji} {summary.sentiment.value.upper()}")
+        buf.append(f"  回购收益率: {summary.buyback_yield:.2f}%")
+        buf.append(f"  总股东收益率: {summary.total_shareholder_yield:.2f}%")
 
         if summary.shares_reduction_rate > 0:
-            print(f"  股份减少率: {summary.shares_reduction_rate:.2f}%/年")
+            buf.append(f"  股份减少率: {summary.shares_reduction_rate:.2f}%/年")
 
         if summary.yearly_amounts:
-            print(f"  年度回购:")
-            for year, amount in sorted(summary.yearly_amounts.items(), reverse=True)[:4]:
+            buf.append(f"  年度回购:")
+            yearly_amounts = summary.yearly_amounts
+            for year in heapq.nlargest(4, yearly_amounts):
+                amount = yearly_amounts[year]
                 if buyback_result.market == Market.US:
-                    print(f"    {year}: ${amount/1e9:.2f}B")
+                    buf.append(f"    {year}: ${amount/1e9:.2f}B")
                 else:
-                    print(f"    {year}: ¥{amount/1e8:.2f}亿")
+                    buf.append(f"    {year}: ¥{amount/1e8:.2f}亿")
 
         if summary.active_programs > 0:
-            print(f"  进行中计划: {summary.active_programs} 个")
+            buf.append(f"  进行中计划: {summary.active_programs} 个")
 
     recent_records = buyback_result.records[:5]
     if recent_records:
-        print()
-        print("【回购记录】")
-        print("| 日期 | 股数 | 金额 | 状态 |")
-        print("|------|------|------|------|")
+        buf.append("")
+        buf.append("【回购记录】")
+        buf.append("| 日期 | 股数 | 金额 | 状态 |")
+        buf.append("|------|------|------|------|")
+        rows = []
         for record in recent_records:
             date_str = record.announce_date.strftime("%m-%d") if record.announce_date else "-"
             shares = f"{record.shares_repurchased:,.0f}" if record.shares_repurchased else "-"
             amount = f"¥{record.amount:,.0f}" if record.amount else "-"
             status = "完成" if record.is_completed else "进行中"
-            print(f"| {date_str} | {shares} | {amount} | {status} |")
+            rows.append(BUYBACK_ROW_FMT % (date_str, shares, amount, status))
+        buf.append("\n".join(rows))
 
 
-def print_shareholder_yield(stock, buyback_summary):
-    print("\n" + "=" * 70)
-    print("【股东回报分析】")
-    print("=" * 70)
-    print()
+def print_shareholder_yield(stock, buyback_summary, buf: List[str]):
+    buf.append("\n" + "=" * 70)
+    buf.append("【股东回报分析】")
+    buf.append("=" * 70)
+    buf.append("")
 
-    print("  ┌─────────────────────────────────────┐")
-    print(f"  │  股息率:      {buyback_summary.dividend_yield:>6.2f}%           │")
-    print(f"  │  回购收益率:  {buyback_summary.buyback_yield:>6.2f}%           │")
-    print("  ├─────────────────────────────────────┤")
-    print(f"  │  总股东收益率: {buyback_summary.total_shareholder_yield:>6.2f}%          │")
-    print("  └─────────────────────────────────────┘")
-    print()
+    buf.append("  ┌─────────────────────────────────────┐")
+    buf.append(f"  │  股息率:      {buyback_summary.dividend_yield:>6.2f}%           │")
+    buf.append(f"  │  回购收益率:  {buyback_summary.buyback_yield:>6.2f}%           │")
+    buf.append("  ├─────────────────────────────────────┤")
+    buf.append(f"  │  总股东收益率: {buyback_summary.total_shareholder_yield:>6.2f}%          │")
+    buf.append("  └─────────────────────────────────────┘")
+    buf.append("")
 
     if buyback_summary.exceeds_dividend:
-        print("  💡 回购收益率 > 股息率，公司更倾向于通过回购回报股东")
+        buf.append("  💡 回购收益率 > 股息率，公司更倾向于通过回购回报股东")
 
     if buyback_summary.is_aggressive:
-        print("  💡 激进回购 (>3%)，公司对自身价值有信心")
+        buf.append("  💡 激进回购 (>3%)，公司对自身价值有信心")
 
 
-def print_fcf_analysis(fcf_result, buyback_summary=None):
+def print_fcf_analysis(fcf_result, buf: List[str], buyback_summary=None):
     """Print Free Cash Flow analysis section."""
-    print("\n" + "=" * 70)
-    print("【自由现金流 (FCF) 分析】")
-    print("=" * 70)
-    print()
+    buf.append("\n" + "=" * 70)
+    buf.append("【自由现金流 (FCF) 分析】")
+    buf.append("=" * 70)
+    buf.append("")
 
     summary = fcf_result.summary
     market = fcf_result.market
@@ -700,169 +873,196 @@ def print_fcf_analysis(fcf_result, buyback_summary=None):
     unit_label = "B" if market == Market.US else "亿"
 
     # Quality indicator
-    quality_emoji = {
-        "excellent": "🟢",
-        "good": "🟢",
-        "acceptable": "🟡",
-        "poor": "🟠",
-        "negative": "🔴",
-    }
     quality = summary.fcf_quality.value
-    emoji = quality_emoji.get(quality, "➡️")
+    emoji = FCF_QUALITY_EMOJI.get(quality, DEFAULT_EMOJI)
 
-    print(f"  FCF 质量: {emoji} {quality.upper()}")
-    print(f"  FCF 趋势: {summary.fcf_trend.value.upper()}")
-    print()
+    buf.append(f"  FCF 质量: {emoji} {quality.upper()}")
+    buf.append(f"  FCF 趋势: {summary.fcf_trend.value.upper()}")
+    buf.append("")
 
     # Key metrics
-    print("【核心指标】")
-    print(f"  最新年度 FCF: {currency}{summary.latest_fcf/unit:.2f}{unit_label}")
-    print(f"  FCF 收益率: {summary.fcf_yield:.2f}%")
-    print(f"  FCF 利润率: {summary.fcf_margin:.2f}%")
-    print(f"  每股 FCF: {currency}{summary.fcf_per_share:.2f}")
-    print()
+    buf.append("【核心指标】")
+    buf.append(f"  最新年度 FCF: {currency}{summary.latest_fcf/unit:.2f}{unit_label}")
+    buf.append(f"  FCF 收益率: {summary.fcf_yield:.2f}%")
+    buf.append(f"  FCF 利润率: {summary.fcf_margin:.2f}%")
+    buf.append(f"  每股 FCF: {currency}{summary.fcf_per_share:.2f}")
+    buf.append("")
 
     # SBC adjustment
     if summary.sbc_as_pct_of_fcf > 0:
-        print("【SBC (股权激励) 调整】")
+        buf.append("【SBC (股权激励) 调整】")
         latest_sbc_year = max(summary.yearly_sbc.keys()) if summary.yearly_sbc else 0
         sbc_amount = summary.yearly_sbc.get(latest_sbc_year, 0) if latest_sbc_year else 0
-        print(f"  SBC 金额: {currency}{sbc_amount/unit:.2f}{unit_label}")
-        print(f"  SBC 占 FCF: {summary.sbc_as_pct_of_fcf:.1f}%")
-        print(f"  真实 FCF (扣除SBC): {currency}{summary.latest_true_fcf/unit:.2f}{unit_label}")
-        print(f"  真实 FCF 收益率: {summary.true_fcf_yield:.2f}%")
-        print(f"  真实 FCF 利润率: {summary.true_fcf_margin:.2f}%")
-        print()
+        buf.append(f"  SBC 金额: {currency}{sbc_amount/unit:.2f}{unit_label}")
+        buf.append(f"  SBC 占 FCF: {summary.sbc_as_pct_of_fcf:.1f}%")
+        buf.append(f"  真实 FCF (扣除SBC): {currency}{summary.latest_true_fcf/unit:.2f}{unit_label}")
+        buf.append(f"  真实 FCF 收益率: {summary.true_fcf_yield:.2f}%")
+        buf.append(f"  真实 FCF 利润率: {summary.true_fcf_margin:.2f}%")
+        buf.append("")
 
     # Quality metrics
-    print("【盈利质量】")
-    print(f"  FCF / 净利润: {summary.fcf_to_net_income:.2f}x")
+    buf.append("【盈利质量】")
+    buf.append(f"  FCF / 净利润: {summary.fcf_to_net_income:.2f}x")
     if summary.fcf_to_net_income >= 1.0:
-        print("    💡 FCF > 净利润，盈利质量优秀")
+        buf.append("    💡 FCF > 净利润，盈利质量优秀")
     elif summary.fcf_to_net_income >= 0.8:
-        print("    💡 FCF 接近净利润，盈利质量良好")
+        buf.append("    💡 FCF 接近净利润，盈利质量良好")
     elif summary.fcf_to_net_income >= 0.5:
-        print("    ⚠️ FCF 显著低于净利润，需关注")
+        buf.append("    ⚠️ FCF 显著低于净利润，需关注")
     else:
-        print("    🚨 FCF 远低于净利润，盈利质量堪忧")
-    print()
+        buf.append("    🚨 FCF 远低于净利润，盈利质量堪忧")
+    buf.append("")
 
     # Historical trend
     if len(summary.yearly_fcf) > 1:
-        print("【历史趋势】")
-        print(f"  FCF CAGR ({len(summary.yearly_fcf)}年): {summary.fcf_cagr:+.1f}%")
-        print(f"  收入 CAGR ({len(summary.yearly_revenue)}年): {summary.revenue_cagr:+.1f}%")
-        print(f"  FCF 为正年数: {summary.positive_fcf_years}/{summary.record_count}")
-        print()
+        buf.append("【历史趋势】")
+        buf.append(f"  FCF CAGR ({len(summary.yearly_fcf)}年): {summary.fcf_cagr:+.1f}%")
+        buf.append(f"  收入 CAGR ({len(summary.yearly_revenue)}年): {summary.revenue_cagr:+.1f}%")
+        buf.append(f"  FCF 为正年数: {summary.positive_fcf_years}/{summary.record_count}")
+        buf.append("")
 
         # Yearly data table
-        print("【年度 FCF 数据】")
-        print("| 年份 | FCF | 真实FCF | 收入 | SBC | FCF利润率 |")
-        print("|------|-----|---------|------|-----|----------|")
-        for year in sorted(summary.yearly_fcf.keys(), reverse=True)[:5]:
+        buf.append("【年度 FCF 数据】")
+        buf.append("| 年份 | FCF | 真实FCF | 收入 | SBC | FCF利润率 |")
+        buf.append("|------|-----|---------|------|-----|----------|")
+        rows = []
+        for year in heapq.nlargest(5, summary.yearly_fcf):
             fcf = summary.yearly_fcf.get(year, 0)
             true_fcf = summary.yearly_true_fcf.get(year, 0)
             revenue = summary.yearly_revenue.get(year, 0)
             sbc = summary.yearly_sbc.get(year, 0)
             margin = (fcf / revenue * 100) if revenue > 0 else 0
-            print(f"| {year} | {currency}{fcf/unit:.1f}{unit_label} | {currency}{true_fcf/unit:.1f}{unit_label} | {currency}{revenue/unit:.1f}{unit_label} | {currency}{sbc/unit:.1f}{unit_label} | {margin:.1f}% |")
-        print()
+            rows.append(
+                FCF_ROW_FMT
+                % (
+                    year,
+                    currency, fcf / unit, unit_label,
+                    currency, true_fcf / unit, unit_label,
+                    currency, revenue / unit, unit_label,
+                    currency, sbc / unit, unit_label,
+                    margin,
+                )
+            )
+        buf.append("\n".join(rows))
+        buf.append("")
 
     # Comparison with shareholder yield
     if buyback_summary and buyback_summary.has_buyback:
-        print("【与股东回报对比】")
-        print(f"  FCF 收益率: {summary.fcf_yield:.2f}%")
-        print(f"  总股东收益率: {buyback_summary.total_shareholder_yield:.2f}%")
+        buf.append("【与股东回报对比】")
+        buf.append(f"  FCF 收益率: {summary.fcf_yield:.2f}%")
+        buf.append(f"  总股东收益率: {buyback_summary.total_shareholder_yield:.2f}%")
         if summary.fcf_yield > buyback_summary.total_shareholder_yield:
-            print("    💡 FCF 收益率 > 股东收益率，公司有充足现金支持回购/分红")
+            buf.append("    💡 FCF 收益率 > 股东收益率，公司有充足现金支持回购/分红")
         elif summary.fcf_yield > 0:
-            print("    ⚠️ FCF 收益率 < 股东收益率，回购/分红可能依赖借贷或储备")
-        print()
+            buf.append("    ⚠️ FCF 收益率 < 股东收益率，回购/分红可能依赖借贷或储备")
+        buf.append("")
 
     # Investment implications
-    print("【投资启示】")
+    buf.append("【投资启示】")
     if summary.fcf_quality.value in ("excellent", "good"):
         if summary.fcf_trend.value == "improving":
-            print("  ✅ 高质量FCF + 改善趋势，现金牛特征明显")
+            buf.append("  ✅ 高质量FCF + 改善趋势，现金牛特征明显")
         else:
-            print("  ✅ 高质量FCF，现金创造能力强")
+            buf.append("  ✅ 高质量FCF，现金创造能力强")
     elif summary.fcf_quality.value == "acceptable":
-        print("  🟡 FCF质量尚可，需持续监控")
+        buf.append("  🟡 FCF质量尚可，需持续监控")
     else:
-        print("  ⚠️ FCF质量堪忧，投资需谨慎")
+        buf.append("  ⚠️ FCF质量堪忧，投资需谨慎")
 
     if summary.sbc_is_material:
-        print(f"  ⚠️ SBC 占 FCF {summary.sbc_as_pct_of_fcf:.0f}%，股权稀释显著")
+        buf.append(f"  ⚠️ SBC 占 FCF {summary.sbc_as_pct_of_fcf:.0f}%，股权稀释显著")
 
-def print_peer_comparison(peer_result, stock):
+def print_peer_comparison(peer_result, stock, buf: List[str]):
     """Print peer comparison analysis section."""
-    print("\n" + "=" * 70)
-    print("【同行对比分析】")
-    print("=" * 70)
-    print()
+    buf.append("\n" + "=" * 70)
+    buf.append("【同行对比分析】")
+    buf.append("=" * 70)
+    buf.append("")
 
-    print(f"  行业: {peer_result.industry_name}")
-    print(f"  同行数量: {peer_result.peer_count}")
-    print(f"  市值排名: #{peer_result.rank_in_peers} / {peer_result.peer_count + 1}")
-    print(f"  综合评分: {peer_result.composite_score:.0f}/100 ({peer_result.rating.value.upper()})")
-    print()
+    buf.append(f"  行业: {peer_result.industry_name}")
+    buf.append(f"  同行数量: {peer_result.peer_count}")
+    buf.append(f"  市值排名: #{peer_result.rank_in_peers} / {peer_result.peer_count + 1}")
+    buf.append(f"  综合评分: {peer_result.composite_score:.0f}/100 ({peer_result.rating.value.upper()})")
+    buf.append("")
 
     # Metric comparison table
-    print("【指标对比】")
-    print("| 指标 | 当前值 | 同行均值 | 同行中位 | 百分位 | 评估 |")
-    print("|------|--------|----------|----------|--------|------|")
+    buf.append("【指标对比】")
+    buf.append("| 指标 | 当前值 | 同行均值 | 同行中位 | 百分位 | 评估 |")
+    buf.append("|------|--------|----------|----------|--------|------|")
     for mc in peer_result.metric_comparisons:
         if not mc.is_available:
             continue
         direction = "\u2191" if mc.direction.value == "higher_better" else "\u2193"
         assessment = mc.assessment
-        print(
+        buf.append(
             f"| {direction} {mc.metric_name:18} | {mc.target_value:>8.1f} | {mc.peer_avg:>8.1f} | {mc.peer_median:>8.1f} | {mc.percentile:>5.0f}th | {assessment:20} |"
         )
-    print()
+    buf.append("")
 
     # Category scores
-    print("【分类评分】")
+    buf.append("【分类评分】")
     if peer_result.valuation_score > 0:
         label = "低估值" if peer_result.valuation_score <= 30 else ("合理" if peer_result.valuation_score <= 60 else "偏高")
-        print(f"  估值评分: {peer_result.valuation_score:.0f}/100 ({label})")
+        buf.append(f"  估值评分: {peer_result.valuation_score:.0f}/100 ({label})")
     if peer_result.profitability_score > 0:
         label = "优秀" if peer_result.profitability_score >= 70 else ("一般" if peer_result.profitability_score >= 40 else "偏弱")
-        print(f"  盈利评分: {peer_result.profitability_score:.0f}/100 ({label})")
+        buf.append(f"  盈利评分: {peer_result.profitability_score:.0f}/100 ({label})")
     if peer_result.growth_score > 0:
         label = "高增长" if peer_result.growth_score >= 70 else ("一般" if peer_result.growth_score >= 40 else "低增长")
-        print(f"  增长评分: {peer_result.growth_score:.0f}/100 ({label})")
-    print()
+        buf.append(f"  增长评分: {peer_result.growth_score:.0f}/100 ({label})")
+    buf.append("")
 
     # Strengths and weaknesses
     if peer_result.strengths:
-        print("【相对优势】")
+        buf.append("【相对优势】")
         for s in peer_result.strengths[:3]:
-            print(f"  ✅ {s}")
-        print()
+            buf.append(f"  ✅ {s}")
+        buf.append("")
     if peer_result.weaknesses:
-        print("【相对劣势】")
+        buf.append("【相对劣势】")
         for w in peer_result.weaknesses[:3]:
-            print(f"  ⚠️ {w}")
-        print()
+            buf.append(f"  ⚠️ {w}")
+        buf.append("")
 
     # Analysis summary
     if peer_result.analysis:
-        print("【分析要点】")
+        buf.append("【分析要点】")
         for a in peer_result.analysis:
-            print(f"  • {a}")
-        print()
+            buf.append(f"  • {a}")
+        buf.append("")
+
+
+TYPE_LABELS = {
+    "bank": "银行/金融",
+    "dividend": "分红股",
+    "growth": "成长股",
+    "value": "价值股",
+    "general": "一般",
+}
 
 
 def get_type_label(company_type: str) -> str:
-    labels = {
-        "bank": "银行/金融",
-        "dividend": "分红股",
-        "growth": "成长股",
-        "value": "价值股",
-        "general": "一般",
-    }
-    return labels.get(company_type, "一般")
+    return TYPE_LABELS.get(company_type, "一般")
+
+
+def run_analysis(ticker: str, args) -> bool:
+    return analyze_stock(
+        ticker,
+        args.type,
+        args.period,
+        include_news=args.news,
+        use_llm=args.llm,
+        use_agent=args.agent,
+        news_days=args.news_days,
+        include_insider=args.insider,
+        insider_days=args.insider_days,
+        include_buyback=args.buyback,
+        buyback_days=args.buyback_days,
+        include_fcf=args.fcf,
+        fcf_years=args.fcf_years,
+        include_peers=args.peers,
+    )
+
 
 
 def main():
@@ -884,10 +1084,15 @@ def main():
   python stock_analyzer.py 600887 --buyback # 包含回购分析 (A股)
   python stock_analyzer.py AAPL --fcf       # 包含自由现金流分析
   python stock_analyzer.py PYPL --buyback --fcf  # 回购+FCF综合分析
+  python stock_analyzer.py AAPL --no-cache  # 跳过本地缓存，强制重新获取
+  python stock_analyzer.py --batch watchlist.txt  # 批量分析 (每行一个代码)
         """,
     )
 
-    parser.add_argument("ticker", help="股票代码 (如 600887, AAPL)")
+    parser.add_argument("ticker", nargs="?", help="股票代码 (如 600887, AAPL)")
+    parser.add_argument(
+        "--batch", metavar="FILE", help="批量分析: 从文件读取股票代码 (每行一个), 在同一进程内依次分析"
+    )
     parser.add_argument(
         "--type",
         "-t",
@@ -915,8 +1120,16 @@ def main():
     parser.add_argument("--fcf-years", type=int, default=5, help="FCF分析年数 (默认5)")
     parser.add_argument("--cyclical", "-c", action="store_true", help="周期股分析 (航运、钢铁、有色、能源等)")
     parser.add_argument("--peers", action="store_true", help="包含同行对比分析")
+    parser.add_argument("--no-cache", action="store_true", help="禁用本地磁盘缓存 (~/.valueinvest/cache)")
+    parser.add_argument(
+        "--cache-ttl", type=int, default=None, help="统一覆盖缓存有效期 (秒, 默认按数据类型)"
+    )
 
     args = parser.parse_args()
+    if not args.ticker and not args.batch:
+        parser.error("需要提供股票代码或 --batch FILE")
+
+    set_default_cache(FileCache(enabled=not args.no_cache, ttl_override=args.cache_ttl))
 
     if args.bank:
         args.type = "bank"
@@ -927,22 +1140,31 @@ def main():
     elif args.cyclical:
         args.type = "cyclical"
 
-    analyze_stock(
-        args.ticker,
-        args.type,
-        args.period,
-        include_news=args.news,
-        use_llm=args.llm,
-        use_agent=args.agent,
-        news_days=args.news_days,
-        include_insider=args.insider,
-        insider_days=args.insider_days,
-        include_buyback=args.buyback,
-        buyback_days=args.buyback_days,
-        include_fcf=args.fcf,
-        fcf_years=args.fcf_years,
-        include_peers=args.peers,
-    )
+    if args.batch:
+        tickers = read_ticker_file(args.batch)
+        if args.ticker:
+            tickers.insert(0, args.ticker)
+    else:
+        tickers = [args.ticker]
+
+    # 批量模式下导入、缓存与估值引擎在同一进程内复用
+    failed = []
+    for ticker in tickers:
+        try:
+            ok = run_analysis(ticker, args)
+        except Exception as e:
+            if len(tickers) == 1:
+                raise
+            print(f"错误: {ticker} 分析失败 - {e}")
+            ok = False
+        if not ok:
+            failed.append(ticker)
+    if len(tickers) > 1:
+        print(f"\n批量分析完成: {len(tickers) - len(failed)}/{len(tickers)} 成功")
+        if failed:
+            print(f"  失败: {', '.join(failed)}")
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
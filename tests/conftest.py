@@ -0,0 +1,169 @@
+"""
+Shared pytest fixtures.
+
+Network-backed fetcher tests hit the live data source, so the parsing code
+stays under test. For quick local iteration set ``VALUEINVEST_TEST_REPLAY=1``
+to store successful results under ``.cache/tests`` (repo root) and replay
+them for ``TEST_CACHE_TTL``.
+
+The network-bound tests parallelize well with pytest-xdist (``dev`` extra)::
+
+    pytest -n auto --dist=loadfile
+
+``loadfile`` keeps each module on one worker so module-scoped fixtures are
+fetched once. Concurrent workers can share the cache safely because
+``FileCache.set`` writes to a temp file and renames it into place.
+"""
+import functools
+import json
+import math
+import os
+from pathlib import Path
+
+import pytest
+
+from valueinvest.cache import FileCache, make_key
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+TEST_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "tests"
+TEST_CACHE_TTL = 3600
+
+_CACHED_METHODS = ("fetch_quote", "fetch_fundamentals", "fetch_all", "fetch_history")
+
+
+def _fetcher_classes():
+    """Fetcher classes whose modules import cleanly (pandas is required)."""
+    classes = []
+    try:
+        from valueinvest.data.fetcher.akshare import AKShareFetcher
+        from valueinvest.data.fetcher.tushare import TushareFetcher
+        from valueinvest.data.fetcher.yfinance import YFinanceFetcher
+    except ImportError:
+        return classes
+    classes.extend([AKShareFetcher, TushareFetcher, YFinanceFetcher])
+    return classes
+
+
+def _cached_method(method, cache: FileCache):
+    @functools.wraps(method)
+    def wrapper(self, ticker, *args, **kwargs):
+        endpoint = f"{self.source_name}_{method.__name__}"
+        key = make_key(*args, **kwargs)
+
+        result = cache.get(ticker, endpoint, key, TEST_CACHE_TTL)
+        if result is not None:
+            return result
+
+        result = method(self, ticker, *args, **kwargs)
+        if result.success:
+            cache.set(ticker, endpoint, key, result)
+        return result
+
+    return wrapper
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fetcher_file_cache():
+    """Replay fetch_quote/fetch_fundamentals/fetch_all/fetch_history from disk (opt-in)."""
+    cache = FileCache(
+        cache_dir=TEST_CACHE_DIR,
+        enabled=os.environ.get("VALUEINVEST_TEST_REPLAY") == "1",
+    )
+    if not cache.enabled:
+        yield cache
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        for cls in _fetcher_classes():
+            for name in _CACHED_METHODS:
+                mp.setattr(cls, name, _cached_method(getattr(cls, name), cache))
+        yield cache
+
+
+@pytest.fixture(scope="session")
+def ashare_fetcher(fetcher_file_cache):
+    """A-share fetcher built once per session."""
+    from valueinvest.data.fetcher import get_fetcher
+
+    return get_fetcher("600000")
+
+
+@pytest.fixture(scope="session")
+def history_1y(ashare_fetcher):
+    """One 1y history fetch of 600000 shared by every test that needs it."""
+    return ashare_fetcher.fetch_history("600000", period="1y")
+
+
+@pytest.fixture(scope="session")
+def history_3y(ashare_fetcher):
+    """One 3y history fetch of 600000 shared by every test that needs it."""
+    return ashare_fetcher.fetch_history("600000", period="3y")
+
+
+@pytest.fixture(scope="session")
+def canned_fetcher():
+    """
+    Offline fetcher replaying ``tests/fixtures/akshare/<ticker>.json``.
+
+    The JSON files hold representative payloads in the shape returned by
+    ``AKShareFetcher.fetch_all``. Price history is a deterministic synthetic
+    series (about 252 trading days per year of ``period``) so history-derived
+    metrics are non-zero without a network round-trip.
+    """
+    pytest.importorskip("pandas")
+    import pandas as pd
+
+    from valueinvest.data.fetcher.base import BaseFetcher, FetchResult, HistoryResult
+
+    class CannedFetcher(BaseFetcher):
+        @property
+        def source_name(self) -> str:
+            return "akshare"
+
+        def _payload(self, ticker: str) -> dict:
+            path = FIXTURES_DIR / "akshare" / f"{ticker}.json"
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+
+        def fetch_quote(self, ticker: str) -> FetchResult:
+            return self.fetch_all(ticker)
+
+        def fetch_fundamentals(self, ticker: str) -> FetchResult:
+            return self.fetch_all(ticker)
+
+        def fetch_all(self, ticker: str) -> FetchResult:
+            return FetchResult(success=True, data=self._payload(ticker), source=self.source_name)
+
+        def fetch_history(
+            self,
+            ticker: str,
+            start_date=None,
+            end_date=None,
+            period: str = "5y",
+            adjust: str = "qfq",
+        ) -> HistoryResult:
+            years = int(period.lower().rstrip("y"))
+            index = pd.bdate_range(end="2025-12-31", periods=years * 252, name="date")
+            base = self._payload(ticker)["current_price"] * (1.5 if adjust == "hfq" else 1.0)
+            closes = [
+                base * 0.8 * 1.0004**i * (1 + 0.03 * math.sin(i / 15)) for i in range(len(index))
+            ]
+            df = pd.DataFrame(
+                {
+                    "open": closes,
+                    "high": [c * 1.01 for c in closes],
+                    "low": [c * 0.99 for c in closes],
+                    "close": closes,
+                    "volume": [1_000_000] * len(closes),
+                },
+                index=index,
+            )
+            return HistoryResult(
+                success=True,
+                ticker=ticker,
+                source=self.source_name,
+                df=df,
+                start_date=index[0].date(),
+                end_date=index[-1].date(),
+            )
+
+    return CannedFetcher()
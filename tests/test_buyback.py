@@ -0,0 +1,481 @@
+"""
+Tests for buyback module.
+
+The fetchers are exercised offline: ``akshare.stock_repurchase_em`` is
+replaced by a canned frame in the shape 东方财富 returns, and ``yfinance.Ticker``
+by an object serving canned annual statements.
+"""
+import sys
+import types
+from datetime import date, timedelta
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from valueinvest.buyback import (
+    BuybackFetchResult,
+    BuybackRecord,
+    BuybackRegistry,
+    BuybackSentiment,
+    BuybackStatus,
+    BuybackSummary,
+)
+from valueinvest.buyback.fetcher.akshare_buyback import AKShareBuybackFetcher
+from valueinvest.buyback.fetcher.yfinance_buyback import (
+    YFinanceBuybackFetcher,
+    _shares_reduction_rate,
+)
+from valueinvest.news.base import Market
+
+
+def _repurchase_frame() -> "pd.DataFrame":
+    today = date.today()
+    rows = [
+        # (股票代码, 实施进度, 已回购股份数量, 已回购金额, 最新公告日期)
+        (600887, "完成实施", 1.0e6, 3.0e7, today - timedelta(days=30)),
+        ("600887", "实施中", 5.0e5, 1.5e7, today - timedelta(days=10)),
+        ("600887", "完成实施", 2.0e6, 5.0e7, today - timedelta(days=800)),
+        ("600887", "股东大会通过", None, None, None),
+        ("000001", "实施中", 1.0e6, 1.0e7, today - timedelta(days=5)),
+    ]
+    return pd.DataFrame(
+        {
+            "序号": range(1, len(rows) + 1),
+            "股票代码": [r[0] for r in rows],
+            "股票简称": ["伊利股份"] * 4 + ["平安银行"],
+            "计划回购金额区间-下限": [5.0e7] * len(rows),
+            "计划回购金额区间-上限": [1.0e8] * len(rows),
+            "计划回购数量区间-下限": ["-", None, "1e6", None, float("inf")],
+            "计划回购数量区间-上限": [None] * len(rows),
+            "实施进度": [r[1] for r in rows],
+            "已回购股份价格区间-下限": [28.0] * len(rows),
+            "已回购股份价格区间-上限": [31.0] * len(rows),
+            "已回购股份数量": [r[2] for r in rows],
+            "已回购金额": [r[3] for r in rows],
+            "最新公告日期": [r[4].isoformat() if r[4] else None for r in rows],
+        }
+    )
+
+
+@pytest.fixture
+def fake_akshare(monkeypatch):
+    """Serve stock_repurchase_em from a canned frame; count calls."""
+    calls = []
+
+    def stock_repurchase_em():
+        calls.append(1)
+        return _repurchase_frame()
+
+    monkeypatch.setitem(sys.modules, "akshare", types.SimpleNamespace(stock_repurchase_em=stock_repurchase_em))
+    AKShareBuybackFetcher.clear_cache()
+
+    from valueinvest import Stock
+
+    def no_quote(ticker):
+        raise RuntimeError("offline")
+
+    monkeypatch.setattr(Stock, "from_api", staticmethod(no_quote))
+    yield calls
+    AKShareBuybackFetcher.clear_cache()
+
+
+class TestAKShareBuybackFetcher:
+
+    def test_filters_ticker_and_window(self, fake_akshare):
+        result = AKShareBuybackFetcher().fetch_buyback("600887", days=365)
+
+        assert result.success is True
+        # Two dated rows in the window plus the undated plan; the 800-day row is dropped
+        assert len(result.records) == 3
+        assert {r.ticker for r in result.records} == {"600887"}
+        assert result.summary.total_amount == pytest.approx(4.5e7)
+        assert result.summary.total_shares == pytest.approx(1.5e6)
+        assert result.summary.active_programs == 1
+        assert result.summary.sentiment == BuybackSentiment.NONE
+
+    def test_record_fields(self, fake_akshare):
+        result = AKShareBuybackFetcher().fetch_buyback("600887", days=365)
+        completed = next(r for r in result.records if r.status == BuybackStatus.COMPLETED)
+
+        assert completed.announce_date == date.today() - timedelta(days=30)
+        assert completed.avg_price == pytest.approx(30.0)
+        assert completed.planned_amount_high == pytest.approx(1.0e8)
+        assert completed.price_low == pytest.approx(28.0)
+
+        undated = result.records[-1]
+        assert undated.announce_date is None
+        assert undated.amount == 0.0
+        # Newest announcement first
+        assert result.records[0].announce_date == date.today() - timedelta(days=10)
+
+    @pytest.mark.parametrize("ticker", ["600887", "000001", "601398"])
+    def test_summary_only_matches_records(self, fake_akshare, ticker):
+        fetcher = AKShareBuybackFetcher()
+        full = fetcher.fetch_buyback(ticker, days=365)
+        fast = fetcher.fetch_buyback(ticker, days=365, summary_only=True)
+
+        assert fast.success is True
+        assert fast.records == []
+        assert fast.summary == full.summary
+
+    def test_caller_supplied_quote(self, fake_akshare):
+        result = AKShareBuybackFetcher().fetch_buyback(
+            "600887", days=365, market_cap=2.25e9, dividend_yield=2.0
+        )
+
+        assert result.market_cap == 2.25e9
+        assert result.summary.buyback_yield == pytest.approx(2.0)
+        assert result.summary.total_shareholder_yield == pytest.approx(4.0)
+        assert result.summary.sentiment == BuybackSentiment.MODERATE
+
+    def test_quote_memoized(self, fake_akshare, monkeypatch):
+        from valueinvest import Stock
+
+        quotes = []
+
+        def from_api(ticker):
+            quotes.append(ticker)
+            return types.SimpleNamespace(current_price=10.0, shares_outstanding=1.0e8, dividend_yield=3.0)
+
+        monkeypatch.setattr(Stock, "from_api", staticmethod(from_api))
+        fetcher = AKShareBuybackFetcher()
+        first = fetcher.fetch_buyback("600887", days=365)
+        second = fetcher.fetch_buyback("600887", days=30)
+
+        assert quotes == ["600887"]
+        assert first.market_cap == second.market_cap == 1.0e9
+        assert first.summary.dividend_yield == 3.0
+
+        # A refreshed repurchase table also refreshes the quote
+        df, index, _, windows = AKShareBuybackFetcher._cache
+        AKShareBuybackFetcher._cache = (df, index, 0.0, windows)
+        fetcher.fetch_buyback("600887", days=365)
+        assert len(quotes) == 2
+
+    def test_table_refetched_after_ttl(self, fake_akshare, monkeypatch):
+        AKShareBuybackFetcher().fetch_buyback("600887")
+        AKShareBuybackFetcher().fetch_buyback("600887")
+        assert len(fake_akshare) == 1
+
+        monkeypatch.setattr(AKShareBuybackFetcher, "CACHE_TTL", -1)
+        AKShareBuybackFetcher.clear_cache()
+        AKShareBuybackFetcher().fetch_buyback("600887")
+        AKShareBuybackFetcher().fetch_buyback("600887")
+        assert len(fake_akshare) == 3
+
+    def test_window_filtered_once_per_cutoff(self, fake_akshare):
+        fetcher = AKShareBuybackFetcher()
+        fetcher.fetch_buyback("600887", days=365)
+        fetcher.fetch_buyback("000001", days=365)
+        fetcher.fetch_buyback("600887", days=1000)
+
+        windows = AKShareBuybackFetcher._cache[3]
+        assert sorted(windows) == [
+            date.today() - timedelta(days=1000),
+            date.today() - timedelta(days=365),
+        ]
+        assert len(windows[date.today() - timedelta(days=1000)][0]) == 5
+        assert len(fetcher.fetch_buyback("600887", days=1000).records) == 4
+
+    def test_numeric_columns_coerced_once(self, fake_akshare):
+        data = AKShareBuybackFetcher()._get_repurchase_data()
+
+        for column in ("已回购股份数量", "已回购金额", "计划回购数量区间-下限"):
+            assert data[column].dtype == "float64"
+            assert not data[column].isna().any()
+        assert data["计划回购数量区间-下限"].tolist() == [0.0, 0.0, 1.0e6, 0.0, 0.0]
+
+    @pytest.mark.parametrize(
+        "progress, status",
+        [
+            ("完成实施", BuybackStatus.COMPLETED),
+            ("实施中", BuybackStatus.IN_PROGRESS),
+            ("实施中(已完成)", BuybackStatus.COMPLETED),
+            ("董事会预案公告", BuybackStatus.ANNOUNCED),
+            ("取消实施", BuybackStatus.CANCELLED),
+            ("股东大会通过", BuybackStatus.UNKNOWN),
+            ("", BuybackStatus.UNKNOWN),
+            (None, BuybackStatus.UNKNOWN),
+        ],
+    )
+    def test_parse_status(self, progress, status):
+        assert AKShareBuybackFetcher()._parse_status(progress) == status
+
+    def test_status_column(self, fake_akshare):
+        data = AKShareBuybackFetcher()._get_repurchase_data()
+
+        assert data["_status"].tolist() == [
+            AKShareBuybackFetcher()._parse_status(p) for p in data["实施进度"]
+        ]
+
+    def test_raw_data_opt_in(self, fake_akshare):
+        plain = AKShareBuybackFetcher().fetch_buyback("000001")
+        assert plain.records[0].raw_data == {}
+
+        raw = AKShareBuybackFetcher(include_raw=True).fetch_buyback("000001")
+        assert raw.records[0].raw_data["实施进度"] == "实施中"
+        assert raw.records[0].raw_data["已回购金额"] == pytest.approx(1.0e7)
+        assert "_status" not in raw.records[0].raw_data
+
+    def test_unpadded_ticker(self, fake_akshare):
+        result = AKShareBuybackFetcher().fetch_buyback("1", days=365)
+
+        assert result.ticker == "000001"
+        assert len(result.records) == 1
+
+    def test_unknown_ticker(self, fake_akshare):
+        result = AKShareBuybackFetcher().fetch_buyback("601398")
+
+        assert result.success is True
+        assert result.records == []
+        assert result.summary.has_buyback is False
+
+    def test_source_shared_across_fetchers(self, fake_akshare):
+        AKShareBuybackFetcher().fetch_buyback("600887")
+        AKShareBuybackFetcher().fetch_buyback("000001")
+        assert len(fake_akshare) == 1
+
+        AKShareBuybackFetcher.clear_cache()
+        AKShareBuybackFetcher().fetch_buyback("600887")
+        assert len(fake_akshare) == 2
+
+
+FISCAL_YEARS = pd.to_datetime(["2024-09-30", "2023-09-30", "2022-09-30", "2021-09-30"])
+
+
+class _FakeTicker:
+    def __init__(self, ticker, session=None):
+        self.ticker = ticker
+        self.info = {"marketCap": 3.0e12, "sharesOutstanding": 1.5e10, "dividendYield": 0.5}
+        self.cashflow = pd.DataFrame(
+            [[-9.5e10, -7.7e10, None, -8.5e10]],
+            index=["Repurchase Of Capital Stock"],
+            columns=FISCAL_YEARS,
+        )
+        self.balance_sheet = pd.DataFrame(
+            [[1.5e10, 1.55e10, None, 1.65e10]],
+            index=["Share Issued"],
+            columns=FISCAL_YEARS,
+        )
+
+
+@pytest.fixture
+def fake_yfinance(monkeypatch):
+    """Serve yfinance.Ticker from canned annual statements."""
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(Ticker=_FakeTicker))
+
+
+class TestYFinanceBuybackFetcher:
+
+    def test_yearly_amounts(self, fake_yfinance):
+        result = YFinanceBuybackFetcher().fetch_buyback("AAPL")
+
+        assert result.success is True
+        assert result.summary.yearly_amounts == {2024: 9.5e10, 2023: 7.7e10, 2021: 8.5e10}
+        assert result.summary.total_amount == pytest.approx(2.57e11)
+        assert result.summary.record_count == 3
+        assert {r.execution_date for r in result.records} == {
+            date(2024, 12, 31),
+            date(2023, 12, 31),
+            date(2021, 12, 31),
+        }
+        # Latest fiscal year against market cap
+        assert result.summary.buyback_yield == pytest.approx(9.5e10 / 3.0e12 * 100)
+        assert result.summary.sentiment == BuybackSentiment.AGGRESSIVE
+
+    def test_summary_only_matches_records(self, fake_yfinance):
+        fetcher = YFinanceBuybackFetcher()
+        full = fetcher.fetch_buyback("AAPL")
+        fast = fetcher.fetch_buyback("AAPL", summary_only=True)
+
+        assert fast.records == []
+        assert fast.summary == full.summary
+
+    def test_string_year_columns(self, fake_yfinance):
+        cashflow = pd.DataFrame(
+            [[-2.0e9, 0.0, -1.0e9]],
+            index=["Repurchase Of Capital Stock"],
+            columns=["2024-12-31", "2023-12-31", "2022-12-31"],
+        )
+        fetcher = YFinanceBuybackFetcher()
+        fetcher._get_ticker_obj("AAPL").cashflow = cashflow
+
+        result = fetcher.fetch_buyback("AAPL")
+
+        assert result.summary.yearly_amounts == {2024: 2.0e9, 2022: 1.0e9}
+        assert result.records[0].raw_data == {"fiscal_year": 2024, "raw_value": -2.0e9}
+
+    def test_shares_reduction_rate(self, fake_yfinance):
+        result = YFinanceBuybackFetcher().fetch_buyback("AAPL")
+
+        # 1.65e10 -> 1.5e10 over the three reported years, skipping the gap
+        expected = (1.65e10 - 1.5e10) / 1.65e10 / 2 * 100
+        assert result.summary.shares_reduction_rate == pytest.approx(expected)
+
+
+class TestSharesReductionRate:
+
+    def test_unsorted_columns(self):
+        row = pd.Series([110.0, 100.0, 120.0], index=pd.to_datetime(["2023-12-31", "2024-12-31", "2022-12-31"]))
+        assert _shares_reduction_rate(row) == pytest.approx((120 - 100) / 120 / 2 * 100)
+
+    def test_share_growth_is_negative(self):
+        row = pd.Series([110.0, 100.0], index=pd.to_datetime(["2024-12-31", "2023-12-31"]))
+        assert _shares_reduction_rate(row) == pytest.approx(-10.0)
+
+    @pytest.mark.parametrize("values", [[100.0], [None, 100.0], [100.0, 0.0]])
+    def test_insufficient_data(self, values):
+        row = pd.Series(values, index=pd.to_datetime(["2024-12-31", "2023-12-31"][: len(values)]))
+        assert _shares_reduction_rate(row) == 0.0
+
+
+@pytest.fixture
+def fresh_registry():
+    """Start from an uninitialized registry; restore the defaults afterwards."""
+    BuybackRegistry.reset()
+    yield BuybackRegistry
+    BuybackRegistry.reset()
+
+
+class TestBuybackRegistry:
+
+    @pytest.mark.parametrize(
+        "ticker, market",
+        [
+            ("600887", Market.A_SHARE),
+            ("000001", Market.A_SHARE),
+            ("300750", Market.A_SHARE),
+            (" aapl ", Market.US),
+            ("BRKB", Market.US),
+            ("00700", Market.HK),
+        ],
+    )
+    def test_detect_market(self, fresh_registry, ticker, market):
+        assert fresh_registry.detect_market(ticker) == market
+
+    @pytest.mark.parametrize("ticker", ["900901", "GOOGLE", "1234567", "BRK.B", ""])
+    def test_detect_market_unknown(self, fresh_registry, ticker):
+        with pytest.raises(ValueError):
+            fresh_registry.detect_market(ticker)
+
+    def test_registered_detector_after_cached_miss(self, fresh_registry):
+        with pytest.raises(ValueError):
+            fresh_registry.detect_market("BRK.B")
+
+        fresh_registry.register_detector(lambda t: Market.US if t == "BRK.B" else None)
+
+        assert fresh_registry.detect_market("brk.b") == Market.US
+
+    def test_get_fetcher_reuses_instance(self, fresh_registry):
+        fetcher = fresh_registry.get_fetcher("600887")
+
+        assert isinstance(fetcher, AKShareBuybackFetcher)
+        assert fresh_registry.get_fetcher("000001") is fetcher
+        assert fresh_registry.get_fetcher("600887", include_raw=True) is not fetcher
+        assert fresh_registry.get_fetcher("600887", include_raw=True).include_raw is True
+
+        fresh_registry.clear_instances()
+        assert fresh_registry.get_fetcher("600887") is not fetcher
+
+    def test_register_fetcher_replaces_instance(self, fresh_registry):
+        fresh_registry.get_fetcher("AAPL")
+
+        class CustomFetcher(YFinanceBuybackFetcher):
+            pass
+
+        fresh_registry.register_fetcher(Market.US, CustomFetcher)
+
+        assert isinstance(fresh_registry.get_fetcher("AAPL"), CustomFetcher)
+
+    def test_shared_instances_keyed_by_market(self, fresh_registry):
+        fetchers = {fresh_registry.get_fetcher(t) for t in ("AAPL", "MSFT", "GOOG", "META")}
+
+        assert len(fetchers) == 1
+        assert list(fresh_registry._instances) == [(Market.US, ())]
+
+    def test_registered_detector_reroutes_cached_ticker(self, fresh_registry):
+        assert isinstance(fresh_registry.get_fetcher("600887"), AKShareBuybackFetcher)
+
+        # Detectors run in registration order, so re-register ahead of the default
+        fresh_registry._market_detectors.clear()
+        fresh_registry.register_detector(lambda t: Market.US if t == "600887" else None)
+
+        assert isinstance(fresh_registry.get_fetcher("600887"), YFinanceBuybackFetcher)
+
+
+def _record(days_ago):
+    announce_date = None if days_ago is None else date.today() - timedelta(days=days_ago)
+    return BuybackRecord(ticker="600887", market=Market.A_SHARE, announce_date=announce_date)
+
+
+class TestBuybackFetchResult:
+
+    def test_recent_records(self):
+        records = [_record(d) for d in (120, 5, None, 90, 30)]
+        result = BuybackFetchResult(True, "600887", Market.A_SHARE, "akshare", records=records)
+
+        assert result.recent_records == [records[1], records[4], records[3]]
+
+    def test_recent_records_follow_changes(self):
+        result = BuybackFetchResult(True, "600887", Market.A_SHARE, "akshare", records=[_record(10)])
+        assert len(result.recent_records) == 1
+
+        result.records.append(_record(1))
+        assert [r.announce_date for r in result.recent_records] == [
+            date.today() - timedelta(days=1),
+            date.today() - timedelta(days=10),
+        ]
+
+        result.records[0].announce_date = date.today() - timedelta(days=100)
+        assert len(result.recent_records) == 1
+        result.records[1] = _record(200)
+        assert result.recent_records == []
+
+
+class TestBuybackRecord:
+
+    @pytest.mark.parametrize(
+        "fields, rate",
+        [
+            (dict(amount=5.0e7, planned_amount_high=1.0e8), 0.5),
+            (dict(amount=2.0e8, planned_amount_high=1.0e8), 1.0),
+            (dict(shares_repurchased=3.0e5, planned_amount_high=0.0, planned_shares_high=1.0e6), 0.3),
+            (dict(amount=1.0e7), None),
+            (dict(amount=1.0e7, planned_amount_high=-1.0, planned_shares_high=0.0), None),
+        ],
+    )
+    def test_completion_rate(self, fields, rate):
+        record = BuybackRecord(ticker="600887", market=Market.A_SHARE, **fields)
+        assert record.completion_rate == (pytest.approx(rate) if rate is not None else None)
+
+
+class TestBuybackSummary:
+
+    def test_avg_annual_amount(self):
+        summary = BuybackSummary("AAPL", Market.US, 365, total_amount=9.0e10)
+        assert summary.avg_annual_amount == 9.0e10
+
+        summary.yearly_amounts = {2023: 8.0e10, 2024: 1.0e11}
+        assert summary.avg_annual_amount == pytest.approx(9.0e10)
+
+        summary.yearly_amounts[2022] = 6.0e10
+        assert summary.avg_annual_amount == pytest.approx(8.0e10)
+
+    def test_apply_market_data(self):
+        summary = BuybackSummary("AAPL", Market.US, 365, total_amount=6.0e10)
+        summary.apply_market_data(3.0e12, 0.5)
+        assert summary.buyback_yield == pytest.approx(2.0)
+        assert summary.total_shareholder_yield == pytest.approx(2.5)
+        assert summary.sentiment == BuybackSentiment.MODERATE
+
+        # Latest fiscal year, not the multi-year total
+        summary.yearly_amounts = {2023: 3.0e10, 2024: 1.2e11}
+        summary.apply_market_data(3.0e12, 0.5)
+        assert summary.buyback_yield == pytest.approx(4.0)
+        assert summary.sentiment == BuybackSentiment.AGGRESSIVE
+
+        summary.apply_market_data(None, 0.5)
+        assert summary.buyback_yield == 0.0
+        assert summary.total_shareholder_yield == 0.5
+        assert summary.sentiment == BuybackSentiment.NONE
@@ -0,0 +1,106 @@
+"""Tests for the on-disk fetch cache."""
+import os
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from valueinvest.cache import FileCache, cached, get_default_cache, make_key, set_default_cache
+
+
+@dataclass
+class _Result:
+    success: bool
+    value: int = 0
+
+
+@pytest.fixture
+def file_cache(tmp_path):
+    previous = get_default_cache()
+    cache = FileCache(cache_dir=tmp_path)
+    set_default_cache(cache)
+    yield cache
+    set_default_cache(previous)
+
+
+class TestFileCache:
+    def test_roundtrip(self, file_cache):
+        key = make_key(days=90)
+        file_cache.set("AAPL", "insider", key, {"a": 1})
+        assert file_cache.get("AAPL", "insider", key, ttl=60) == {"a": 1}
+
+    def test_key_includes_format_version(self, monkeypatch):
+        key = make_key(days=90)
+        monkeypatch.setattr("valueinvest.cache.CACHE_FORMAT_VERSION", 0)
+        assert make_key(days=90) != key
+
+    def test_slotted_stock_roundtrip(self, file_cache):
+        from valueinvest import Stock
+
+        stock = Stock(ticker="AAPL", name="Apple", current_price=190.0, warnings=["w"])
+        file_cache.set("AAPL", "quote", make_key(), stock)
+        assert file_cache.get("AAPL", "quote", make_key(), ttl=60) == stock
+
+    def test_miss_returns_default(self, file_cache):
+        assert file_cache.get("AAPL", "insider", make_key(), ttl=60) is None
+        assert file_cache.get("AAPL", "insider", make_key(), ttl=60, default=-1) == -1
+
+    def test_expired_entry(self, file_cache):
+        key = make_key()
+        file_cache.set("AAPL", "fcf", key, 42)
+        path = file_cache._path("AAPL", "fcf", key)
+        old = time.time() - 120
+        os.utime(path, (old, old))
+
+        assert file_cache.get("AAPL", "fcf", key, ttl=60) is None
+        file_cache.ttl_override = 600
+        assert file_cache.get("AAPL", "fcf", key, ttl=60) == 42
+
+    def test_disabled(self, tmp_path):
+        cache = FileCache(cache_dir=tmp_path, enabled=False)
+        cache.set("AAPL", "quote", make_key(), 1)
+        assert cache.get("AAPL", "quote", make_key(), ttl=60) is None
+        assert not any(tmp_path.iterdir())
+
+    def test_clear_ticker(self, file_cache):
+        file_cache.set("AAPL", "quote", make_key(), 1)
+        file_cache.set("MSFT", "quote", make_key(), 2)
+        file_cache.clear("AAPL")
+        assert file_cache.get("AAPL", "quote", make_key(), ttl=60) is None
+        assert file_cache.get("MSFT", "quote", make_key(), ttl=60) == 2
+
+    def test_clear_endpoint(self, file_cache):
+        file_cache.set("AAPL", "quote", make_key(), 1)
+        file_cache.set("AAPL", "quote_history", make_key(), 2)
+        file_cache.set("MSFT", "quote", make_key(), 3)
+        file_cache.clear(endpoint="quote")
+        assert file_cache.get("AAPL", "quote", make_key(), ttl=60) is None
+        assert file_cache.get("MSFT", "quote", make_key(), ttl=60) is None
+        assert file_cache.get("AAPL", "quote_history", make_key(), ttl=60) == 2
+
+
+class TestCachedDecorator:
+    def test_hit_skips_call(self, file_cache):
+        calls = []
+
+        @cached(endpoint="buyback", ttl=60)
+        def fetch(ticker, days=365):
+            calls.append((ticker, days))
+            return _Result(success=True, value=days)
+
+        assert fetch("AAPL", days=30).value == 30
+        assert fetch("AAPL", days=30).value == 30
+        assert fetch("AAPL", days=90).value == 90
+        assert calls == [("AAPL", 30), ("AAPL", 90)]
+
+    def test_failed_result_not_cached(self, file_cache):
+        calls = []
+
+        @cached(endpoint="buyback", ttl=60)
+        def fetch(ticker):
+            calls.append(ticker)
+            return _Result(success=False)
+
+        fetch("AAPL")
+        fetch("AAPL")
+        assert len(calls) == 2
@@ -0,0 +1,301 @@
+"""
+Tests for cashflow module.
+
+The yfinance fetcher is exercised offline: ``yfinance.Ticker`` is replaced by
+an object serving canned annual statements that cover the fallback rows
+(continuing-operations OCF, PP&E + business purchases for CapEx, OCF + CapEx
+for FCF, combined D&A, common-stockholder net income).
+"""
+import sys
+import types
+from datetime import date
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from valueinvest.cache import FileCache, get_default_cache, set_default_cache
+from valueinvest.cashflow import CashFlowFetchResult, CashFlowRecord, FCFQuality, FCFTrend
+from valueinvest.cashflow.fetcher.yfinance_cashflow import YFinanceCashFlowFetcher
+from valueinvest.news.base import Market
+
+NAN = float("nan")
+FISCAL_YEARS = pd.to_datetime(["2024-09-30", "2023-09-30", "2022-09-30", "2021-09-30", "2020-09-30"])
+
+
+class _FakeTicker:
+    def __init__(self, ticker, session=None):
+        self.ticker = ticker
+        self.info = {"marketCap": 2000.0, "sharesOutstanding": 9.8, "currentPrice": 204.0}
+        self.cashflow = pd.DataFrame(
+            {
+                "Operating Cash Flow": [120.0, NAN, 100.0, NAN, 80.0],
+                "Cash Flow From Continuing Operating Activities": [120.0, 110.0, 100.0, NAN, 80.0],
+                "Capital Expenditure": [-20.0, -15.0, NAN, NAN, -10.0],
+                "Purchase Of Ppe": [-20.0, -15.0, -12.0, NAN, -10.0],
+                "Purchase Of Business": [NAN, NAN, -3.0, NAN, NAN],
+                "Free Cash Flow": [100.0, NAN, NAN, NAN, 70.0],
+                "Stock Based Compensation": [10.0, 9.0, 8.0, NAN, 5.0],
+                "Depreciation And Amortization": [30.0, 28.0, 26.0, NAN, 20.0],
+                "Interest Paid": [-4.0, -4.0, -3.0, NAN, -2.0],
+                "Income Tax Paid": [-6.0, -5.0, -5.0, NAN, -4.0],
+            },
+            index=FISCAL_YEARS,
+        ).T
+        # No income statement for 2020
+        self.financials = pd.DataFrame(
+            {
+                "Net Income": [90.0, NAN, 70.0, 60.0],
+                "Net Income Common Stockholders": [90.0, 85.0, 70.0, 60.0],
+                "Total Revenue": [400.0, 380.0, 350.0, 300.0],
+                "EBITDA": [150.0, 140.0, 130.0, 120.0],
+            },
+            index=FISCAL_YEARS[:4],
+        ).T
+        self.balance_sheet = pd.DataFrame(
+            {"Share Issued": [10.0, 10.5, NAN, 11.0, 11.5]},
+            index=FISCAL_YEARS,
+        ).T
+
+
+@pytest.fixture
+def fake_yfinance(monkeypatch, tmp_path):
+    """Serve yfinance.Ticker from canned annual statements, with empty caches."""
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(Ticker=_FakeTicker))
+    previous = get_default_cache()
+    set_default_cache(FileCache(cache_dir=tmp_path))
+    YFinanceCashFlowFetcher.clear_cache()
+    yield
+    YFinanceCashFlowFetcher.clear_cache()
+    set_default_cache(previous)
+
+
+def _record(fiscal_year=2024, **fields):
+    return CashFlowRecord(ticker="AAPL", market=Market.US, fiscal_year=fiscal_year, **fields)
+
+
+class TestCashFlowRecord:
+
+    def test_ratios(self):
+        record = _record(
+            free_cash_flow=100.0,
+            true_fcf=90.0,
+            capital_expenditure=-20.0,
+            stock_based_comp=10.0,
+            net_income=80.0,
+            revenue=400.0,
+            shares_outstanding=10.0,
+        )
+
+        assert record.fcf_per_share == 10.0
+        assert record.true_fcf_per_share == 9.0
+        assert record.fcf_margin == 25.0
+        assert record.true_fcf_margin == 22.5
+        assert record.fcf_to_net_income == 1.25
+        assert record.sbc_as_pct_of_fcf == 10.0
+        assert record.sbc_as_pct_of_revenue == 2.5
+        assert record.capex_as_pct_of_revenue == 5.0
+
+    def test_ratios_without_denominators(self):
+        record = _record(free_cash_flow=-5.0, stock_based_comp=1.0)
+
+        assert record.fcf_per_share == 0.0
+        assert record.fcf_margin == 0.0
+        assert record.fcf_to_net_income == 0.0
+        assert record.sbc_as_pct_of_fcf == 0.0
+
+    def test_ratios_follow_field_changes(self):
+        record = _record(free_cash_flow=100.0, revenue=400.0)
+        assert record.fcf_margin == 25.0
+
+        record.revenue = 500.0
+        assert record.fcf_margin == 20.0
+
+
+class TestCashFlowFetchResult:
+
+    def test_latest_and_trend_records(self):
+        records = [_record(fiscal_year=year) for year in (2022, 2024, 2023)]
+        result = CashFlowFetchResult(
+            success=True, ticker="AAPL", market=Market.US, source="test", records=records
+        )
+
+        assert result.latest_record.fiscal_year == 2024
+        assert [r.fiscal_year for r in result.fcf_trend_records] == [2022, 2023, 2024]
+
+        result.records.append(_record(fiscal_year=2025))
+        assert [r.fiscal_year for r in result.fcf_trend_records] == [2022, 2023, 2024, 2025]
+        result.records[0].fiscal_year = 2026
+        assert result.latest_record.fiscal_year == 2026
+        assert [r.fiscal_year for r in result.fcf_trend_records][-1] == 2026
+
+    def test_slotted(self, fake_yfinance):
+        result = YFinanceCashFlowFetcher().fetch_cashflow("AAPL")
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(result.summary, "__dict__")
+        with pytest.raises(AttributeError):
+            result.summary.note = "x"
+
+    def test_no_records(self):
+        result = CashFlowFetchResult(success=False, ticker="AAPL", market=Market.US, source="test")
+
+        assert result.latest_record is None
+        assert result.fcf_trend_records == []
+
+
+class TestYFinanceCashFlowFetcher:
+
+    def test_records(self, fake_yfinance):
+        result = YFinanceCashFlowFetcher().fetch_cashflow("AAPL", years=5)
+
+        assert result.success is True
+        # 2021 has no cash flow data and is skipped; newest first
+        assert [r.fiscal_year for r in result.records] == [2024, 2023, 2022, 2020]
+
+        latest, y2023, y2022, y2020 = result.records
+        assert latest.report_date == date(2024, 9, 30)
+        assert (latest.operating_cash_flow, latest.capital_expenditure, latest.free_cash_flow) == (120.0, -20.0, 100.0)
+        assert latest.true_fcf == 90.0
+        assert (latest.depreciation, latest.amortization) == (30.0, 0)
+        assert (latest.interest_paid, latest.taxes_paid) == (4.0, 6.0)
+        assert (latest.net_income, latest.revenue, latest.ebitda) == (90.0, 400.0, 150.0)
+        assert latest.shares_outstanding == 10.0
+
+        # OCF from continuing operations, FCF = OCF + CapEx, common-stockholder net income
+        assert (y2023.operating_cash_flow, y2023.free_cash_flow, y2023.net_income) == (110.0, 95.0, 85.0)
+        # CapEx from PP&E + business purchases; shares fall back to info
+        assert (y2022.capital_expenditure, y2022.free_cash_flow) == (-15.0, 85.0)
+        assert y2022.shares_outstanding == 9.8
+        # No income statement column
+        assert (y2020.net_income, y2020.revenue, y2020.ebitda) == (0.0, 0.0, 0.0)
+
+    def test_summary(self, fake_yfinance):
+        summary = YFinanceCashFlowFetcher().fetch_cashflow("AAPL", years=5).summary
+
+        assert summary.latest_fcf == 100.0
+        assert summary.fcf_yield == pytest.approx(5.0)
+        assert summary.true_fcf_yield == pytest.approx(4.5)
+        assert summary.fcf_margin == pytest.approx(25.0)
+        assert summary.fcf_per_share == pytest.approx(10.0)
+        assert summary.fcf_quality == FCFQuality.EXCELLENT
+        assert summary.fcf_trend == FCFTrend.IMPROVING
+        assert summary.fcf_cagr == pytest.approx(((100.0 / 70.0) ** 0.25 - 1) * 100)
+        assert summary.revenue_cagr == 0.0  # 2020 revenue missing
+        assert summary.yearly_fcf == {2024: 100.0, 2023: 95.0, 2022: 85.0, 2020: 70.0}
+        assert summary.yearly_capex == {2024: 20.0, 2023: 15.0, 2022: 15.0, 2020: 10.0}
+        assert (summary.record_count, summary.positive_fcf_years, summary.negative_fcf_years) == (4, 4, 0)
+        assert summary.avg_fcf == pytest.approx(87.5)
+        assert summary.fcf_consistency == 100.0
+
+    @pytest.mark.parametrize(
+        "fcf, net_income, quality",
+        [
+            (-1.0, 100.0, FCFQuality.NEGATIVE),
+            (111.0, 100.0, FCFQuality.EXCELLENT),
+            (110.0, 100.0, FCFQuality.GOOD),
+            (80.0, 100.0, FCFQuality.GOOD),
+            (79.0, 100.0, FCFQuality.ACCEPTABLE),
+            (50.0, 100.0, FCFQuality.ACCEPTABLE),
+            (49.0, 100.0, FCFQuality.POOR),
+            (10.0, 0.0, FCFQuality.POOR),
+        ],
+    )
+    def test_fcf_quality(self, fcf, net_income, quality):
+        record = _record(free_cash_flow=fcf, net_income=net_income)
+        assert YFinanceCashFlowFetcher()._determine_fcf_quality(record) == quality
+
+    @pytest.mark.parametrize(
+        "values, trend",
+        [
+            ([70.0, 85.0, 95.0, 100.0], FCFTrend.IMPROVING),
+            ([100.0, 95.0, 0.0, 85.0, 70.0], FCFTrend.DECLINING),
+            ([10.0, 20.0, 10.0, 20.0, 10.0], FCFTrend.STABLE),
+            ([10.0, 20.0, 30.0, 25.0], FCFTrend.VOLATILE),
+            ([10.0, 10.0, 10.0], FCFTrend.STABLE),
+            ([10.0, 0.0, 20.0], FCFTrend.STABLE),
+        ],
+    )
+    def test_fcf_trend(self, values, trend):
+        assert YFinanceCashFlowFetcher()._determine_fcf_trend(values) == trend
+
+    def test_years_limit(self, fake_yfinance):
+        result = YFinanceCashFlowFetcher().fetch_cashflow("AAPL", years=2)
+
+        assert [r.fiscal_year for r in result.records] == [2024, 2023]
+
+    def test_string_columns(self, fake_yfinance):
+        fetcher = YFinanceCashFlowFetcher()
+        stock = fetcher._get_ticker_obj("AAPL")
+        labels = ["2024", "2023", "2022", "2021", "2020"]
+        stock.cashflow.columns = labels
+        stock.financials.columns = labels[:4]
+        stock.balance_sheet.columns = labels
+
+        result = fetcher.fetch_cashflow("AAPL", years=5)
+
+        assert [r.fiscal_year for r in result.records] == [2024, 2023, 2022, 2020]
+        assert result.records[0].report_date == date(2024, 12, 31)
+        assert result.records[0].net_income == 90.0
+
+    def test_no_cashflow(self, fake_yfinance):
+        fetcher = YFinanceCashFlowFetcher()
+        fetcher._get_ticker_obj("AAPL").cashflow = pd.DataFrame()
+
+        result = fetcher.fetch_cashflow("AAPL")
+
+        assert result.success is False
+        assert result.errors == ["No cash flow data available"]
+        assert result.market_cap == 2000.0
+
+    def test_statements_cached_for_the_day(self, fake_yfinance, monkeypatch, tmp_path):
+        cache = FileCache(cache_dir=tmp_path / "fcf")
+        YFinanceCashFlowFetcher(cache).fetch_cashflow("AAPL")
+
+        def unreachable(ticker, session=None):
+            raise AssertionError("yfinance should not be called")
+
+        monkeypatch.setattr(sys.modules["yfinance"], "Ticker", unreachable)
+        # A new fetcher reuses the in-process copy, then the on-disk copy
+        assert YFinanceCashFlowFetcher().fetch_cashflow("AAPL").success is True
+        YFinanceCashFlowFetcher._memory.clear()
+        assert YFinanceCashFlowFetcher(cache).fetch_cashflow("AAPL").success is True
+
+        YFinanceCashFlowFetcher.clear_cache("AAPL", cache=cache)
+        assert YFinanceCashFlowFetcher(cache).fetch_cashflow("AAPL").success is False
+
+    def test_disk_cache_is_opt_in(self, fake_yfinance, tmp_path):
+        YFinanceCashFlowFetcher().fetch_cashflow("AAPL")
+        assert list(tmp_path.rglob("*.pkl")) == []
+
+    def test_disabled_cache_skips_memory(self, fake_yfinance, monkeypatch):
+        calls = []
+
+        class CountingTicker(_FakeTicker):
+            def __init__(self, ticker, session=None):
+                calls.append(ticker)
+                super().__init__(ticker, session)
+
+        monkeypatch.setattr(sys.modules["yfinance"], "Ticker", CountingTicker)
+        set_default_cache(FileCache(enabled=False))
+        YFinanceCashFlowFetcher().fetch_cashflow("AAPL")
+        YFinanceCashFlowFetcher().fetch_cashflow("AAPL")
+
+        assert calls == ["AAPL", "AAPL"]
+        assert YFinanceCashFlowFetcher._memory == {}
+
+    def test_empty_statement_not_cached(self, fake_yfinance):
+        fetcher = YFinanceCashFlowFetcher()
+        fetcher._get_ticker_obj("AAPL").cashflow = pd.DataFrame()
+        assert fetcher.fetch_cashflow("AAPL").success is False
+
+        assert YFinanceCashFlowFetcher().fetch_cashflow("AAPL").success is True
+
+    def test_fetch_many(self, fake_yfinance):
+        results = YFinanceCashFlowFetcher.fetch_many(["MSFT", "AAPL", "MSFT"], years=2, max_workers=4)
+
+        assert list(results) == ["MSFT", "AAPL"]
+        assert all(r.success for r in results.values())
+        assert results["AAPL"].ticker == "AAPL"
+        assert [r.fiscal_year for r in results["MSFT"].records] == [2024, 2023]
+        assert YFinanceCashFlowFetcher.fetch_many([]) == {}
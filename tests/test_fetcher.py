@@ -37,31 +37,27 @@ class TestFetcherCreation:
 
 
 class TestAKShareFetcher:
-    @pytest.fixture
-    def fetcher(self):
-        return get_fetcher("600000")
-
-    def test_fetch_quote(self, fetcher):
-        result = fetcher.fetch_quote("600000")
+    def test_fetch_quote(self, ashare_fetcher):
+        result = ashare_fetcher.fetch_quote("600000")
         assert result.success
         assert result.data["ticker"] == "600000"
         assert result.data["name"] != ""
         assert result.data["current_price"] > 0
         assert result.data["shares_outstanding"] > 0
 
-    def test_fetch_fundamentals(self, fetcher):
-        result = fetcher.fetch_fundamentals("600000")
+    def test_fetch_fundamentals(self, ashare_fetcher):
+        result = ashare_fetcher.fetch_fundamentals("600000")
         assert result.success
         assert result.data["eps"] > 0 or result.data["revenue"] > 0
 
-    def test_fetch_all(self, fetcher):
-        result = fetcher.fetch_all("600000")
+    def test_fetch_all(self, ashare_fetcher):
+        result = ashare_fetcher.fetch_all("600000")
         assert result.success
         assert "name" in result.data
         assert "current_price" in result.data
 
-    def test_fetch_history(self, fetcher):
-        result = fetcher.fetch_history("600000", period="1y")
+    def test_fetch_history(self, history_1y):
+        result = history_1y
         assert result.success
         assert result.df is not None
         assert len(result.df) > 100
@@ -70,76 +66,135 @@ class TestAKShareFetcher:
 
 
 class TestStockFromApi:
-    def test_from_api_ashare(self):
+    def test_from_api_ashare(self, canned_fetcher):
         from valueinvest import Stock
 
-        stock = Stock.from_api("600000")
+        stock = Stock.from_api("600000", fetcher=canned_fetcher)
         assert stock.ticker == "600000"
         assert stock.name != ""
         assert stock.current_price > 0
         assert stock.eps > 0
 
-    def test_from_api_with_source(self):
+    def test_from_api_with_source(self, canned_fetcher):
         from valueinvest import Stock
 
-        stock = Stock.from_api("600887", source="akshare")
+        assert get_fetcher("600887", source="akshare").source_name == "akshare"
+
+        stock = Stock.from_api("600887", source="akshare", fetcher=canned_fetcher)
         assert stock.ticker == "600887"
         assert stock.current_price > 0
 
 
 class TestStockFromApiWithHistory:
-    def test_from_api_separate_history(self):
+    def test_from_api_separate_history(self, canned_fetcher):
         from valueinvest import Stock, StockHistory
 
-        stock = Stock.from_api("600000")
-        history = Stock.fetch_price_history("600000", period="1y")
-        
+        stock = Stock.from_api("600000", fetcher=canned_fetcher)
+        history = Stock.fetch_price_history("600000", fetcher=canned_fetcher, period="1y")
+
         assert stock.ticker == "600000"
         assert stock.current_price > 0
         assert isinstance(history, StockHistory)
         assert history.ticker == "600000"
         assert len(history.prices) > 100
 
-    def test_history_calculates_cagr(self):
+    def test_history_calculates_cagr(self, canned_fetcher):
         from valueinvest import Stock
 
-        history = Stock.fetch_price_history("600000", period="3y")
+        history = Stock.fetch_price_history("600000", fetcher=canned_fetcher, period="3y")
         assert history.cagr != 0 or history.volatility != 0 or history.max_drawdown != 0
 
 
 class TestStockHistoryMethods:
-    def test_get_recent_prices(self):
-        from valueinvest import Stock
+    def test_get_recent_prices(self, history_1y):
+        from valueinvest import StockHistory
 
-        history = Stock.fetch_price_history("600000", period="1y")
+        history = StockHistory.from_history_result(history_1y)
         recent = history.get_recent_prices(days=10)
         
         assert len(recent) > 0
         assert "date" in recent[0]
         assert "close" in recent[0]
 
-    def test_get_price_stats(self):
-        from valueinvest import Stock
+    def test_get_price_stats(self, history_1y):
+        from valueinvest import StockHistory
 
-        history = Stock.fetch_price_history("600000", period="1y")
+        history = StockHistory.from_history_result(history_1y)
         stats = history.get_price_stats(days=30)
         
         assert stats["high"] >= stats["low"]
         assert stats["latest"] > 0
 
 
+class TestStockHistoryOffline:
+    @pytest.fixture
+    def history(self):
+        import pandas as pd
+        from valueinvest import StockHistory
+
+        index = pd.date_range("2024-01-01", periods=40, freq="D")
+        closes = [10.0 + i * 0.5 for i in range(40)]
+        df = pd.DataFrame(
+            {
+                "open": closes,
+                "high": [c + 1 for c in closes],
+                "low": [c - 1 for c in closes],
+                "close": closes,
+                "volume": [1000] * 40,
+            },
+            index=index,
+        )
+        return StockHistory(ticker="TEST", df=df, df_hfq=df * 2)
+
+    def test_get_recent_prices(self, history):
+        recent = history.get_recent_prices(days=10)
+
+        assert len(recent) == 10
+        assert recent[0]["date"] == "2024-01-31"
+        assert recent[-1] == {
+            "date": "2024-02-09",
+            "open": 29.5,
+            "high": 30.5,
+            "low": 28.5,
+            "close": 29.5,
+            "volume": 1000,
+        }
+
+    def test_get_price_stats(self, history):
+        stats = history.get_price_stats(days=30)
+
+        assert stats["period_days"] == 30
+        assert stats["high"] == 29.5
+        assert stats["low"] == 15.0
+        assert stats["latest"] == 29.5
+        assert stats["change_pct"] == pytest.approx((29.5 - 15.0) / 15.0 * 100)
+
+    def test_zero_days_matches_tail(self, history):
+        assert history.get_recent_prices(days=0) == []
+        assert history.get_price_stats(days=0) == {}
+        assert len(history.get_recent_prices(days=-35)) == 5
+
+    def test_adjust_uses_hfq_frame(self, history):
+        assert history.get_price_stats(days=30)["latest"] == 29.5
+        assert history.get_price_stats(days=30, adjust="hfq")["latest"] == 59.0
+
+    def test_columns_refresh_when_frame_replaced(self, history):
+        history.get_price_stats(days=5)
+        history.df = history.df + 1
+
+        assert history.get_price_stats(days=5)["latest"] == 30.5
+
+
 class TestHistoryResult:
-    def test_history_result_properties(self):
-        fetcher = get_fetcher("600000")
-        result = fetcher.fetch_history("600000", period="1y")
-        
+    def test_history_result_properties(self, history_1y):
+        result = history_1y
+
         assert result.success
         assert isinstance(result.prices, list)
         assert len(result.prices) > 0
         
-    def test_history_calculations(self):
-        fetcher = get_fetcher("600000")
-        result = fetcher.fetch_history("600000", period="3y")
+    def test_history_calculations(self, history_3y):
+        result = history_3y
         
         if result.success and len(result.prices) > 1:
             cagr = result.calculate_cagr()
@@ -149,3 +204,24 @@ class TestHistoryResult:
             assert isinstance(cagr, float)
             assert isinstance(volatility, float)
             assert isinstance(max_dd, float)
+
+    def test_history_calculations_offline(self):
+        import pandas as pd
+
+        closes = [100.0, 110.0, 88.0, 99.0, 121.0]
+        result = HistoryResult(
+            success=True, ticker="TEST", source="test", df=pd.DataFrame({"close": closes})
+        )
+        series = pd.Series(closes)
+
+        assert result.calculate_cagr() == pytest.approx(((121.0 / 100.0) ** (252 / 5) - 1) * 100)
+        assert result.calculate_volatility() == pytest.approx(
+            series.pct_change().std() * 252**0.5 * 100
+        )
+        assert result.calculate_max_drawdown() == pytest.approx(-20.0)
+
+    def test_history_calculations_empty(self):
+        result = HistoryResult(success=False, ticker="TEST", source="test")
+        assert result.calculate_cagr() == 0.0
+        assert result.calculate_volatility() == 0.0
+        assert result.calculate_max_drawdown() == 0.0
@@ -9,7 +9,7 @@ from valueinvest.industry.base import (
     IndustryTrend,
     FundFlowSentiment,
 )
-from valueinvest.industry.registry import IndustryRegistry, Market
+from valueinvest.industry.registry import IndustryRegistry, Market, _detect_market_cached
 
 
 class TestPeerCompany:
@@ -90,6 +90,12 @@ class TestIndustryFetchResult:
         top = result.get_top_peers(2)
         assert len(top) == 2
         assert top[0].ticker == "600887"
+        assert [p.ticker for p in result.get_top_peers(10)] == ["600887", "000895", "600873"]
+
+        soa = result.to_soa()
+        assert soa["ticker"] == ["600887", "600873", "000895"]
+        assert soa["market_cap"] == [1000, 200, 800]
+        assert result.to_soa(("roe",)) == {"roe": [0.0, 0.0, 0.0]}
 
     def test_similar_sized_peers(self):
         peers = [
@@ -115,6 +121,10 @@ class TestIndustryRegistry:
         assert IndustryRegistry.detect_market("000001") == Market.A_SHARE
         assert IndustryRegistry.detect_market("300750") == Market.A_SHARE
 
+        hits = _detect_market_cached.cache_info().hits
+        assert IndustryRegistry.detect_market("600887") == Market.A_SHARE
+        assert _detect_market_cached.cache_info().hits == hits + 1
+
     def test_detect_market_us(self):
         assert IndustryRegistry.detect_market("AAPL") == Market.US
         assert IndustryRegistry.detect_market("GOOGL") == Market.US
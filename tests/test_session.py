@@ -0,0 +1,50 @@
+"""Tests for the shared HTTP session used by yfinance fetchers."""
+import sys
+import types
+
+import pytest
+
+from valueinvest.session import get_http_session, set_http_session
+
+
+@pytest.fixture
+def shared_session():
+    session = object()
+    set_http_session(session)
+    yield session
+    set_http_session(None)
+
+
+@pytest.fixture
+def fake_yfinance(monkeypatch):
+    """Minimal yfinance stand-in recording the session each Ticker receives."""
+    calls = []
+
+    class Ticker:
+        def __init__(self, ticker, session=None):
+            calls.append((ticker, session))
+            self.ticker = ticker
+            self.info = {"industry": "Software", "sector": "Technology"}
+
+    module = types.ModuleType("yfinance")
+    module.Ticker = Ticker
+    monkeypatch.setitem(sys.modules, "yfinance", module)
+    return calls
+
+
+class TestHttpSession:
+    def test_default_is_none(self):
+        assert get_http_session() is None
+
+    def test_set_and_reset(self, shared_session):
+        assert get_http_session() is shared_session
+        set_http_session(None)
+        assert get_http_session() is None
+
+    def test_fetchers_pass_shared_session(self, shared_session, fake_yfinance):
+        from valueinvest.industry.fetcher.yfinance_industry import YFinanceIndustryFetcher
+
+        fetcher = YFinanceIndustryFetcher()
+        assert fetcher.get_industry_name("AAPL") == "Software"
+
+        assert fake_yfinance == [("AAPL", shared_session)]
@@ -6,13 +6,14 @@ import pytest
 from valueinvest.stock import Stock
 from valueinvest.valuation.engine import ValuationEngine
 from valueinvest.valuation.quality import OwnerEarnings, AltmanZScore
+from valueinvest.valuation.value_trap import ValueTrapDetector
 from valueinvest.valuation.growth import EVEBITDA
 
 
 class TestOwnerEarnings:
     """Tests for Warren Buffett's Owner Earnings valuation."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def healthy_stock(self):
         """A healthy company with positive owner earnings."""
         return Stock(
@@ -30,7 +31,7 @@ class TestOwnerEarnings:
             eps=1.65,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def value_destructive_stock(self):
         """A company with negative owner earnings."""
         return Stock(
@@ -105,13 +106,13 @@ class TestOwnerEarnings:
         # Should estimate missing values and still calculate
         assert result.method == "Owner Earnings"
         # Should have warnings about estimates
-        assert len([a for a in result.analysis if "estimated" in a.lower() or "Note" in a]) > 0
+        assert any("estimated" in a.lower() or "Note" in a for a in result.analysis)
 
 
 class TestAltmanZScore:
     """Tests for Altman Z-Score bankruptcy prediction."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def safe_company(self):
         """A financially healthy company (Safe Zone)."""
         return Stock(
@@ -130,7 +131,7 @@ class TestAltmanZScore:
             operating_margin=15.0,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def distressed_company(self):
         """A financially distressed company (Distress Zone)."""
         return Stock(
@@ -188,6 +189,14 @@ class TestAltmanZScore:
         # Should identify the weakest factor
         assert "Weakest factor" in str(result.analysis)
 
+    def test_z_shared_with_value_trap(self, safe_company):
+        """Test ValueTrapDetector and AltmanZScore agree via the shared Z helper."""
+        result = AltmanZScore().calculate(safe_company)
+        trap = ValueTrapDetector().detect(safe_company)
+
+        z_indicator = next(i for i in trap.indicators if i.name == "Altman Z-Score")
+        assert round(z_indicator.value, 2) == result.details["z_score"]
+
     def test_missing_data_estimates(self):
         """Test handling of missing data with estimates."""
         stock = Stock(
@@ -211,7 +220,7 @@ class TestAltmanZScore:
 class TestEVEBITDA:
     """Tests for EV/EBITDA valuation."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def typical_company(self):
         """A typical company for EV/EBITDA analysis."""
         return Stock(
@@ -230,7 +239,7 @@ class TestEVEBITDA:
             net_income=0.6e9,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def high_leverage_company(self):
         """A high-leverage company."""
         return Stock(
@@ -322,11 +331,11 @@ class TestEVEBITDA:
 class TestValuationEngineIntegration:
     """Integration tests for ValuationEngine with new methods."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def engine(self):
         return ValuationEngine()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def test_stock(self):
         return Stock(
             ticker="TEST",
@@ -358,45 +367,32 @@ class TestValuationEngineIntegration:
             discount_rate=10.0,
         )
 
-    def test_owner_earnings_in_engine(self, engine, test_stock):
-        """Test Owner Earnings accessible via engine."""
-        result = engine.run_single(test_stock, "owner_earnings")
-        assert result.method == "Owner Earnings"
-
-    def test_altman_z_in_engine(self, engine, test_stock):
-        """Test Altman Z-Score accessible via engine."""
-        result = engine.run_single(test_stock, "altman_z")
-        assert result.method == "Altman Z-Score"
-
-    def test_ev_ebitda_in_engine(self, engine, test_stock):
-        """Test EV/EBITDA accessible via engine."""
-        result = engine.run_single(test_stock, "ev_ebitda")
-        assert result.method == "EV/EBITDA"
-
-    def test_new_methods_in_run_all(self, engine, test_stock):
-        """Test new methods included in run_all."""
-        results = engine.run_all(test_stock)
-        method_names = [r.method for r in results]
-
-        assert "Owner Earnings" in method_names
-        assert "Altman Z-Score" in method_names
-        assert "EV/EBITDA" in method_names
-
-    def test_value_methods_includes_new(self, engine, test_stock):
-        """Test new methods in VALUE_METHODS."""
-        results = engine.run_value(test_stock)
-        method_names = [r.method for r in results]
-
-        # VALUE_METHODS should include owner_earnings and altman_z
-        assert "Owner Earnings" in method_names
-        assert "Altman Z-Score" in method_names
-
-    def test_growth_methods_includes_ev_ebitda(self, engine, test_stock):
-        """Test EV/EBITDA in GROWTH_METHODS."""
-        results = engine.run_growth(test_stock)
-        method_names = [r.method for r in results]
-
-        assert "EV/EBITDA" in method_names
+    @pytest.mark.parametrize(
+        "key,method",
+        [
+            ("owner_earnings", "Owner Earnings"),
+            ("altman_z", "Altman Z-Score"),
+            ("ev_ebitda", "EV/EBITDA"),
+        ],
+    )
+    def test_method_in_engine(self, engine, test_stock, key, method):
+        """Test the new methods are accessible via engine.run_single."""
+        assert engine.run_single(test_stock, key).method == method
+
+    @pytest.mark.parametrize(
+        "runner,expected_methods",
+        [
+            ("run_all", {"Owner Earnings", "Altman Z-Score", "EV/EBITDA"}),
+            ("run_value", {"Owner Earnings", "Altman Z-Score"}),
+            ("run_growth", {"EV/EBITDA"}),
+        ],
+    )
+    def test_new_methods_in_runner(self, engine, test_stock, runner, expected_methods):
+        """Test the new methods are included in run_all/run_value/run_growth."""
+        results = getattr(engine, runner)(test_stock)
+        method_names = {r.method for r in results}
+
+        assert expected_methods <= method_names
 
     def test_get_available_methods(self, engine):
         """Test new methods in available methods list."""
@@ -416,3 +412,38 @@ class TestValuationEngineIntegration:
 
         # Should use the custom multiple
         assert result.details["fair_ev_ebitda_multiple"] == 15.0
+
+    def test_run_batch_columns(self, engine, test_stock):
+        """Test run_batch returns one column per method aligned with the stocks."""
+        from dataclasses import replace
+
+        stocks = [test_stock, replace(test_stock, ticker="TEST2", ebitda=0.4e9)]
+        methods = ["owner_earnings", "altman_z", "ev_ebitda"]
+        columns = engine.run_batch(stocks, methods)
+
+        assert list(columns) == ["ticker", "current_price"] + methods
+        assert columns["ticker"] == ["TEST", "TEST2"]
+        for i, stock in enumerate(stocks):
+            for method in methods:
+                assert columns[method][i] == engine.run_single(stock, method).fair_value
+
+    def test_list_methods_by_type(self, engine):
+        """Test list_methods maps company types to method lists."""
+        assert engine.list_methods("bank") == engine.BANK_METHODS
+        assert engine.list_methods("growth") == engine.GROWTH_METHODS
+        assert engine.list_methods("all") == engine.get_available_methods()
+
+    def test_run_parallel_matches_serial(self, engine, test_stock):
+        """Test run_parallel returns the same results, in order, as run_multiple."""
+        methods = engine.VALUE_METHODS
+        serial = engine.run_multiple(test_stock, methods)
+        parallel = engine.run_parallel(test_stock, methods, max_workers=2)
+
+        assert [r.method for r in parallel] == [r.method for r in serial]
+        assert [r.fair_value for r in parallel] == [r.fair_value for r in serial]
+
+    def test_run_parallel_defaults_to_serial(self, engine, test_stock):
+        """Test run_parallel without max_workers, or with a short list, runs serially."""
+        results = engine.run_parallel(test_stock, ["ev_ebitda"], max_workers=4)
+        assert [r.method for r in results] == ["EV/EBITDA"]
+        assert len(engine.run_parallel(test_stock)) == len(engine.run_multiple(test_stock))
@@ -10,7 +10,7 @@ For US stocks, buyback data comes from cash flow statement (Repurchase of Capita
 For A-shares, buyback data comes from akshare's stock_repurchase_em API.
 """
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import List, Optional, Dict
 from enum import Enum
 
@@ -37,7 +37,7 @@ class BuybackSentiment(Enum):
     NONE = "none"  # 无回购
 
 
-@dataclass
+@dataclass(slots=True)
 class BuybackRecord:
     """Single buyback record (announcement or execution)."""
 
@@ -83,14 +83,18 @@ class BuybackRecord:
     @property
     def completion_rate(self) -> Optional[float]:
         """Calculate completion rate if plan data available."""
-        if self.planned_amount_high and self.planned_amount_high > 0:
-            return min(self.amount / self.planned_amount_high, 1.0)
-        if self.planned_shares_high and self.planned_shares_high > 0:
-            return min(self.shares_repurchased / self.planned_shares_high, 1.0)
-        return None
-
-
-@dataclass
+        planned = self.planned_amount_high
+        if planned and planned > 0:
+            rate = self.amount / planned
+        else:
+            planned = self.planned_shares_high
+            if not (planned and planned > 0):
+                return None
+            rate = self.shares_repurchased / planned
+        return rate if rate < 1.0 else 1.0
+
+
+@dataclass(slots=True)
 class BuybackSummary:
     """Aggregated summary of buyback activity."""
 
@@ -138,12 +142,39 @@ class BuybackSummary:
     @property
     def avg_annual_amount(self) -> float:
         """Calculate average annual buyback amount."""
-        if not self.yearly_amounts:
+        yearly = self.yearly_amounts
+        if not yearly:
             return self.total_amount
-        return sum(self.yearly_amounts.values()) / max(len(self.yearly_amounts), 1)
-
-
-@dataclass
+        return sum(yearly.values()) / len(yearly)
+
+    def apply_market_data(self, market_cap: Optional[float], dividend_yield: float) -> None:
+        """
+        Set buyback yield, total shareholder yield and sentiment from a quote.
+
+        The buyback yield uses the latest fiscal year's amount when yearly
+        amounts are known, else ``total_amount``; it is 0 without a market cap.
+        """
+        yearly = self.yearly_amounts
+        amount = yearly[max(yearly)] if yearly else self.total_amount
+        buyback_yield = 0.0
+        if market_cap and market_cap > 0 and amount > 0:
+            buyback_yield = (amount / market_cap) * 100
+
+        self.buyback_yield = buyback_yield
+        self.dividend_yield = dividend_yield
+        self.total_shareholder_yield = buyback_yield + dividend_yield
+
+        if buyback_yield > 3.0:
+            self.sentiment = BuybackSentiment.AGGRESSIVE
+        elif buyback_yield > 1.0:
+            self.sentiment = BuybackSentiment.MODERATE
+        elif buyback_yield > 0:
+            self.sentiment = BuybackSentiment.MINIMAL
+        else:
+            self.sentiment = BuybackSentiment.NONE
+
+
+@dataclass(slots=True)
 class BuybackFetchResult:
     """Result from buyback data fetch operation."""
 
@@ -167,12 +198,11 @@ class BuybackFetchResult:
 
     @property
     def recent_records(self) -> List[BuybackRecord]:
-        """Get records from the last 90 days."""
-        cutoff = date.today()
-        from datetime import timedelta
-
-        cutoff = cutoff - timedelta(days=90)
-        return [r for r in self.records if r.announce_date and r.announce_date >= cutoff]
+        """Get records from the last 90 days, newest first."""
+        cutoff = date.today() - timedelta(days=90)
+        recent = [r for r in self.records if r.announce_date and r.announce_date >= cutoff]
+        recent.sort(key=lambda r: r.announce_date, reverse=True)
+        return recent
 
     @property
     def active_records(self) -> List[BuybackRecord]:
@@ -3,8 +3,14 @@ Buyback data fetcher for A-shares using akshare.
 
 Data source: akshare.stock_repurchase_em() - 东方财富回购数据
 """
-from datetime import date, datetime, timedelta
-from typing import Optional, Dict, Any, List
+import functools
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 from .base import BaseBuybackFetcher
 from ..base import (
@@ -12,17 +18,78 @@ from ..base import (
     BuybackRecord,
     BuybackSummary,
     BuybackStatus,
-    BuybackSentiment,
     Market,
 )
 
+# Amount/share/price columns coerced to float once when the table is cached;
+# blanks, "-" and other unparseable cells become 0.0
+_NUMERIC_COLUMNS = (
+    "已回购股份数量",
+    "已回购金额",
+    "已回购股份价格区间-下限",
+    "已回购股份价格区间-上限",
+    "计划回购数量区间-下限",
+    "计划回购数量区间-上限",
+    "计划回购金额区间-下限",
+    "计划回购金额区间-上限",
+)
+
+# 实施进度 keywords in priority order; the first group found decides the status
+_STATUS_KEYWORDS = (
+    (("完成",), BuybackStatus.COMPLETED),
+    (("实施中", "进行"), BuybackStatus.IN_PROGRESS),
+    (("计划", "公告"), BuybackStatus.ANNOUNCED),
+    (("取消",), BuybackStatus.CANCELLED),
+)
+_ACTIVE_STATUSES = (BuybackStatus.ANNOUNCED, BuybackStatus.IN_PROGRESS)
+
+
+@functools.lru_cache(maxsize=256)
+def _status_from_progress(progress: str) -> BuybackStatus:
+    """Map a 实施进度 string to BuybackStatus (the column has few distinct values)."""
+    progress = progress.strip()
+    for keywords, status in _STATUS_KEYWORDS:
+        if any(k in progress for k in keywords):
+            return status
+    return BuybackStatus.UNKNOWN
+
+
+@functools.lru_cache(maxsize=2048)
+def _quote_metrics(ticker: str, expiry: float) -> Tuple[Optional[float], float]:
+    """
+    Market cap and dividend yield (%) from ``Stock.from_api``.
+
+    Memoized per ticker and repurchase-table ``expiry``, so quotes are
+    refreshed whenever the table is; failures raise and are not cached.
+    Cleared by ``clear_cache``.
+    """
+    from valueinvest import Stock
+
+    stock = Stock.from_api(ticker)
+    market_cap = None
+    if stock.current_price and stock.shares_outstanding:
+        market_cap = stock.current_price * stock.shares_outstanding
+    return market_cap, stock.dividend_yield or 0.0
+
 
 class AKShareBuybackFetcher(BaseBuybackFetcher):
     """Fetch buyback data for A-shares via akshare."""
 
-    def __init__(self):
-        self._cache = None
-        self._cache_time = None
+    # stock_repurchase_em returns the whole market, so one parsed copy is
+    # shared by every fetcher in the process: (frame, ticker index, expiry on
+    # the time.monotonic() clock, {cutoff date: (frame, ticker index) of rows
+    # announced since then})
+    CACHE_TTL: ClassVar[int] = 300  # seconds
+    _cache: ClassVar[Optional[Tuple[pd.DataFrame, Dict[str, Any], float, Dict[date, Tuple]]]] = None
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, include_raw: bool = False):
+        """
+        Args:
+            include_raw: Attach each source row to ``BuybackRecord.raw_data``
+                (original values, not stringified). Off by default.
+        """
+        self.include_raw = include_raw
 
     @property
     def market(self) -> Market:
@@ -32,68 +99,94 @@ class AKShareBuybackFetcher(BaseBuybackFetcher):
     def source_name(self) -> str:
         return "akshare"
 
-    def _get_repurchase_data(self) -> List[Dict[str, Any]]:
-        """Fetch all repurchase data from akshare (with caching)."""
-        now = datetime.now()
-        if (
-            self._cache is None
-            or self._cache_time is None
-            or (now - self._cache_time).total_seconds() > 300
-        ):
-            try:
-                import akshare as ak
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop the shared repurchase table and memoized quotes so the next fetch reloads them."""
+        with cls._cache_lock:
+            cls._cache = None
+        _quote_metrics.cache_clear()
+
+    @classmethod
+    def _get_cache_entry(cls) -> Tuple:
+        """
+        Fetch all repurchase data from akshare (with caching).
+
+        Returns the cache entry: the frame, with ``股票代码`` zero-padded to
+        six digits, ``最新公告日期`` parsed to timestamps (NaT when missing),
+        the amount/share/price columns as floats (0.0 when missing) and an
+        added ``_status`` column of BuybackStatus parsed from ``实施进度``; a
+        ``股票代码 -> row positions`` index built from it; the expiry; and
+        the per-cutoff windows filled by ``_get_window``. Concurrent callers
+        wait for a single refresh instead of each downloading the table.
+        """
+        with cls._cache_lock:
+            now = time.monotonic()
+            if cls._cache is None or now >= cls._cache[2]:
+                try:
+                    import akshare as ak
+                except ImportError as e:
+                    raise ImportError(
+                        "akshare is required for A-share buyback data. "
+                        "Install with: pip install valueinvest[ashare]"
+                    ) from e
 
                 df = ak.stock_repurchase_em()
-                self._cache = df.to_dict("records")
-                self._cache_time = now
-            except ImportError as e:
-                raise ImportError(
-                    "akshare is required for A-share buyback data. "
-                    "Install with: pip install valueinvest[ashare]"
-                ) from e
-        return self._cache
+                df = df.assign(
+                    股票代码=df["股票代码"].astype(str).str.zfill(6),
+                    最新公告日期=pd.to_datetime(df["最新公告日期"], errors="coerce"),
+                )
+                numeric = [c for c in _NUMERIC_COLUMNS if c in df.columns]
+                df[numeric] = (
+                    df[numeric]
+                    .apply(pd.to_numeric, errors="coerce")
+                    .replace([np.inf, -np.inf], np.nan)
+                    .fillna(0.0)
+                )
+                progress = df["实施进度"].fillna("").astype(str)
+                df["_status"] = progress.map(
+                    {p: _status_from_progress(p) for p in progress.unique()}
+                )
+                cls._cache = (df, df.groupby("股票代码").indices, now + cls.CACHE_TTL, {})
+            return cls._cache
+
+    @classmethod
+    def _get_repurchase_table(cls) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """The cached frame and its ``股票代码 -> row positions`` index."""
+        df, index, _, _ = cls._get_cache_entry()
+        return df, index
+
+    @classmethod
+    def _get_window(cls, cutoff: date) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Rows announced on/after ``cutoff`` (plus undated rows) and their
+        ticker index, filtered once per cutoff and table refresh.
+        """
+        df, _, _, windows = cls._get_cache_entry()
+        window = windows.get(cutoff)
+        if window is None:
+            announced = df["最新公告日期"]
+            sub = df[announced.isna() | (announced >= pd.Timestamp(cutoff))]
+            # Concurrent misses may both compute it; either result is the same
+            window = windows[cutoff] = (sub, sub.groupby("股票代码").indices)
+        return window
+
+    def _get_repurchase_data(self) -> pd.DataFrame:
+        """The full (cached) repurchase table."""
+        return self._get_repurchase_table()[0]
+
+    def _get_rows_for(self, ticker: str, cutoff: Optional[date] = None) -> pd.DataFrame:
+        """Rows for one zero-padded ticker, limited to the window from ``cutoff``."""
+        if cutoff is None:
+            data, index = self._get_repurchase_table()
+        else:
+            data, index = self._get_window(cutoff)
+        return data.iloc[index.get(ticker, [])]
 
     def _parse_status(self, status_str: str) -> BuybackStatus:
         """Parse status string to BuybackStatus enum."""
         if not status_str:
             return BuybackStatus.UNKNOWN
-        status_str = str(status_str).strip()
-        if "完成" in status_str:
-            return BuybackStatus.COMPLETED
-        elif "实施中" in status_str or "进行" in status_str:
-            return BuybackStatus.IN_PROGRESS
-        elif "计划" in status_str or "公告" in status_str:
-            return BuybackStatus.ANNOUNCED
-        elif "取消" in status_str:
-            return BuybackStatus.CANCELLED
-        return BuybackStatus.UNKNOWN
-
-    def _parse_amount(self, value) -> float:
-        """Parse amount value, handling NaN and strings."""
-        if value is None:
-            return 0.0
-        try:
-            import math
-
-            f = float(value)
-            if math.isnan(f) or math.isinf(f):
-                return 0.0
-            return f
-        except (ValueError, TypeError):
-            return 0.0
-
-    def _parse_date(self, value) -> Optional[date]:
-        """Parse date string."""
-        if value is None or str(value) == "nan":
-            return None
-        try:
-            if isinstance(value, str):
-                return datetime.strptime(value, "%Y-%m-%d").date()
-            elif hasattr(value, "date"):
-                return value.date() if callable(getattr(value, "date")) else value
-        except (ValueError, TypeError):
-            pass
-        return None
+        return _status_from_progress(str(status_str))
 
     def fetch_buyback(
         self,
@@ -101,93 +194,86 @@ class AKShareBuybackFetcher(BaseBuybackFetcher):
         days: int = 365,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        summary_only: bool = False,
+        market_cap: Optional[float] = None,
+        dividend_yield: Optional[float] = None,
     ) -> BuybackFetchResult:
         try:
             ticker = ticker.zfill(6)
-            all_data = self._get_repurchase_data()
+            # Rows announced on/after the cutoff (and rows without a date)
+            rows = self._get_rows_for(ticker, cutoff=date.today() - timedelta(days=days))
 
             records = []
             total_amount = 0.0
             total_shares = 0.0
             active_programs = 0
 
-            cutoff_date = date.today() - timedelta(days=days)
-
-            for row in all_data:
-                row_ticker = str(row.get("股票代码", "")).zfill(6)
-                if row_ticker != ticker:
-                    continue
-
-                announce_date = self._parse_date(row.get("最新公告日期"))
-                if announce_date and announce_date < cutoff_date:
-                    continue
-
-                status = self._parse_status(row.get("实施进度", ""))
-
-                shares_repurchased = self._parse_amount(row.get("已回购股份数量", 0))
-                amount = self._parse_amount(row.get("已回购金额", 0))
-
-                price_low = self._parse_amount(row.get("已回购股份价格区间-下限"))
-                price_high = self._parse_amount(row.get("已回购股份价格区间-上限"))
-
-                planned_shares_low = self._parse_amount(row.get("计划回购数量区间-下限"))
-                planned_shares_high = self._parse_amount(row.get("计划回购数量区间-上限"))
-                planned_amount_low = self._parse_amount(row.get("计划回购金额区间-下限"))
-                planned_amount_high = self._parse_amount(row.get("计划回购金额区间-上限"))
-
-                avg_price = 0.0
-                if shares_repurchased > 0 and amount > 0:
-                    avg_price = amount / shares_repurchased
-
-                record = BuybackRecord(
-                    ticker=ticker,
-                    market=self.market,
-                    announce_date=announce_date,
-                    shares_repurchased=shares_repurchased,
-                    amount=amount,
-                    avg_price=avg_price,
-                    planned_shares_low=planned_shares_low,
-                    planned_shares_high=planned_shares_high,
-                    planned_amount_low=planned_amount_low,
-                    planned_amount_high=planned_amount_high,
-                    status=status,
-                    price_low=price_low,
-                    price_high=price_high,
-                    source=self.source_name,
-                    raw_data={k: str(v) for k, v in row.items()},
+            if summary_only:
+                # Same totals as the record loop, computed on the columns
+                total_amount = float(rows["已回购金额"].sum())
+                total_shares = float(rows["已回购股份数量"].sum())
+                active_programs = int(rows["_status"].isin(_ACTIVE_STATUSES).sum())
+            else:
+                rows = rows.sort_values(
+                    "最新公告日期", ascending=False, na_position="last", kind="stable"
                 )
-                records.append(record)
-
-                total_amount += amount
-                total_shares += shares_repurchased
-                if status in (BuybackStatus.ANNOUNCED, BuybackStatus.IN_PROGRESS):
-                    active_programs += 1
-
-            market_cap = None
-            dividend_yield = 0.0
-            try:
-                from valueinvest import Stock
-
-                stock = Stock.from_api(ticker)
-                if stock.current_price and stock.shares_outstanding:
-                    market_cap = stock.current_price * stock.shares_outstanding
-                dividend_yield = stock.dividend_yield or 0.0
-            except Exception:
-                pass
-
-            buyback_yield = 0.0
-            if market_cap and market_cap > 0 and total_amount > 0:
-                buyback_yield = (total_amount / market_cap) * 100
-
-            total_shareholder_yield = buyback_yield + dividend_yield
-
-            sentiment = BuybackSentiment.NONE
-            if buyback_yield > 3.0:
-                sentiment = BuybackSentiment.AGGRESSIVE
-            elif buyback_yield > 1.0:
-                sentiment = BuybackSentiment.MODERATE
-            elif buyback_yield > 0:
-                sentiment = BuybackSentiment.MINIMAL
+                for row in rows.to_dict("records"):
+                    announced_at = row.get("最新公告日期")
+                    announce_date = None if pd.isna(announced_at) else announced_at.date()
+                    status = row.pop("_status")
+
+                    # Numeric columns were coerced when the table was cached
+                    shares_repurchased = row.get("已回购股份数量", 0.0)
+                    amount = row.get("已回购金额", 0.0)
+
+                    price_low = row.get("已回购股份价格区间-下限", 0.0)
+                    price_high = row.get("已回购股份价格区间-上限", 0.0)
+
+                    planned_shares_low = row.get("计划回购数量区间-下限", 0.0)
+                    planned_shares_high = row.get("计划回购数量区间-上限", 0.0)
+                    planned_amount_low = row.get("计划回购金额区间-下限", 0.0)
+                    planned_amount_high = row.get("计划回购金额区间-上限", 0.0)
+
+                    avg_price = 0.0
+                    if shares_repurchased > 0 and amount > 0:
+                        avg_price = amount / shares_repurchased
+
+                    record = BuybackRecord(
+                        ticker=ticker,
+                        market=self.market,
+                        announce_date=announce_date,
+                        shares_repurchased=shares_repurchased,
+                        amount=amount,
+                        avg_price=avg_price,
+                        planned_shares_low=planned_shares_low,
+                        planned_shares_high=planned_shares_high,
+                        planned_amount_low=planned_amount_low,
+                        planned_amount_high=planned_amount_high,
+                        status=status,
+                        price_low=price_low,
+                        price_high=price_high,
+                        source=self.source_name,
+                        raw_data=row if self.include_raw else {},
+                    )
+                    records.append(record)
+
+                    total_amount += amount
+                    total_shares += shares_repurchased
+                    if status in _ACTIVE_STATUSES:
+                        active_programs += 1
+
+            if market_cap is None or dividend_yield is None:
+                try:
+                    # Expiry of the table the rows came from (no refresh here)
+                    entry = type(self)._cache
+                    expiry = entry[2] if entry is not None else 0.0
+                    quoted_cap, quoted_yield = _quote_metrics(ticker, expiry)
+                except Exception:
+                    quoted_cap, quoted_yield = None, 0.0
+                if market_cap is None:
+                    market_cap = quoted_cap
+                if dividend_yield is None:
+                    dividend_yield = quoted_yield
 
             summary = BuybackSummary(
                 ticker=ticker,
@@ -195,13 +281,10 @@ class AKShareBuybackFetcher(BaseBuybackFetcher):
                 period_days=days,
                 total_amount=total_amount,
                 total_shares=total_shares,
-                buyback_yield=buyback_yield,
-                dividend_yield=dividend_yield,
-                total_shareholder_yield=total_shareholder_yield,
-                record_count=len(records),
+                record_count=len(rows),
                 active_programs=active_programs,
-                sentiment=sentiment,
             )
+            summary.apply_market_data(market_cap, dividend_yield)
 
             return BuybackFetchResult(
                 success=True,
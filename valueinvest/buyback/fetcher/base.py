@@ -29,6 +29,9 @@ class BaseBuybackFetcher(ABC):
         days: int = 365,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        summary_only: bool = False,
+        market_cap: Optional[float] = None,
+        dividend_yield: Optional[float] = None,
     ) -> BuybackFetchResult:
         """
         Fetch buyback data for a ticker.
@@ -38,6 +41,10 @@ class BaseBuybackFetcher(ABC):
             days: Number of days to look back (default 365)
             start_date: Optional start date
             end_date: Optional end date
+            summary_only: Compute only the summary; ``records`` is left empty
+            market_cap: Market cap the caller already has; looked up when None
+            dividend_yield: Dividend yield (%) the caller already has; looked
+                up when None
 
         Returns:
             BuybackFetchResult with records and summary
@@ -7,7 +7,10 @@ Data sources:
 - Info: marketCap, sharesOutstanding
 """
 from datetime import date, datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict
+
+import numpy as np
+import pandas as pd
 
 from .base import BaseBuybackFetcher
 from ..base import (
@@ -15,9 +18,26 @@ from ..base import (
     BuybackRecord,
     BuybackSummary,
     BuybackStatus,
-    BuybackSentiment,
     Market,
 )
+from ...session import get_http_session
+
+
+def _shares_reduction_rate(shares_row) -> float:
+    """
+    Average annual reduction in shares issued, in percent.
+
+    ``shares_row`` is the balance-sheet "Share Issued" row (one column per
+    fiscal year end). Missing years are skipped; the change from the oldest
+    to the latest reported count is spread over the remaining years.
+    """
+    shares = shares_row.to_numpy(dtype=np.float64, na_value=np.nan)
+    shares = shares[np.argsort(shares_row.index.to_numpy(), kind="stable")]
+    shares = shares[~np.isnan(shares)]
+    if shares.size < 2 or shares[0] <= 0:
+        return 0.0
+    reduction = (shares[0] - shares[-1]) / shares[0]
+    return float(reduction / (shares.size - 1) * 100)
 
 
 class YFinanceBuybackFetcher(BaseBuybackFetcher):
@@ -25,7 +45,6 @@ class YFinanceBuybackFetcher(BaseBuybackFetcher):
 
     def __init__(self):
         self._ticker_obj = None
-        self._info = None
 
     @property
     def market(self):
@@ -36,24 +55,22 @@ class YFinanceBuybackFetcher(BaseBuybackFetcher):
         return "yfinance"
 
     def _get_ticker_obj(self, ticker: str):
-        if self._ticker_obj is None or self._ticker_obj.ticker != ticker:
+        # Read and replace the cached Ticker in single steps so a fetcher
+        # shared between threads never mixes two tickers' data; yf.Ticker
+        # caches its own info/statements.
+        stock = self._ticker_obj
+        if stock is None or stock.ticker != ticker:
             try:
                 import yfinance as yf
 
-                self._ticker_obj = yf.Ticker(ticker)
-                self._info = None
+                stock = yf.Ticker(ticker, session=get_http_session())
             except ImportError as e:
                 raise ImportError(
                     "yfinance is required for US stock buyback data. "
                     "Install with: pip install valueinvest[us]"
                 ) from e
-        return self._ticker_obj
-
-    def _get_info(self, ticker: str) -> Dict[str, Any]:
-        if self._info is None:
-            stock = self._get_ticker_obj(ticker)
-            self._info = stock.info or {}
-        return self._info
+            self._ticker_obj = stock
+        return stock
 
     def fetch_buyback(
         self,
@@ -61,10 +78,13 @@ class YFinanceBuybackFetcher(BaseBuybackFetcher):
         days: int = 365,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        summary_only: bool = False,
+        market_cap: Optional[float] = None,
+        dividend_yield: Optional[float] = None,
     ) -> BuybackFetchResult:
         try:
             stock = self._get_ticker_obj(ticker)
-            info = self._get_info(ticker)
+            info = stock.info or {}
 
             if not info:
                 return BuybackFetchResult(
@@ -75,9 +95,11 @@ class YFinanceBuybackFetcher(BaseBuybackFetcher):
                     errors=[f"No data found for ticker: {ticker}"],
                 )
 
-            market_cap = info.get("marketCap", 0)
+            if market_cap is None:
+                market_cap = info.get("marketCap", 0)
             shares_outstanding = info.get("sharesOutstanding", 0)
-            dividend_yield = info.get("dividendYield", 0) or 0
+            if dividend_yield is None:
+                dividend_yield = info.get("dividendYield", 0) or 0
 
             cashflow = stock.cashflow
             balance_sheet = stock.balance_sheet
@@ -85,107 +107,62 @@ class YFinanceBuybackFetcher(BaseBuybackFetcher):
             records = []
             yearly_amounts: Dict[int, float] = {}
             total_amount = 0.0
-            shares_data = []
+            record_count = 0
 
             if cashflow is not None and not cashflow.empty:
                 if "Repurchase Of Capital Stock" in cashflow.index:
                     repurchase_row = cashflow.loc["Repurchase Of Capital Stock"]
-
-                    for col_idx, col in enumerate(repurchase_row.index):
-                        try:
-                            value = repurchase_row[col]
-                            if value is None or str(value) == "nan":
-                                continue
-
-                            amount = abs(float(value))
-                            if amount <= 0:
-                                continue
-
-                            col_date = col
-                            if hasattr(col, "year"):
-                                year = col.year
-                            else:
-                                year = int(str(col)[:4])
-
-                            fiscal_year_end = (
-                                date(year, 12, 31) if hasattr(col, "month") else date(year, 12, 31)
-                            )
-
-                            record = BuybackRecord(
+                    values = pd.to_numeric(repurchase_row, errors="coerce").to_numpy(dtype=np.float64)
+                    columns = repurchase_row.index
+                    if hasattr(columns, "year"):
+                        years = np.asarray(columns.year)
+                    else:
+                        years = np.array([int(str(col)[:4]) for col in columns])
+
+                    # Skip missing years and years without repurchases
+                    mask = np.isfinite(values) & (values != 0)
+                    values = values[mask]
+                    amounts = np.abs(values)
+                    total_amount = float(amounts.sum())
+
+                    years = years[mask].tolist()
+                    record_count = len(years)
+
+                    for year, amount, value in zip(
+                        years, amounts.tolist(), values.tolist(), strict=True
+                    ):
+                        yearly_amounts[year] = yearly_amounts.get(year, 0.0) + amount
+                        if summary_only:
+                            continue
+                        records.append(
+                            BuybackRecord(
                                 ticker=ticker,
                                 market=self.market,
-                                execution_date=fiscal_year_end,
+                                execution_date=date(year, 12, 31),
                                 amount=amount,
                                 status=BuybackStatus.COMPLETED,
                                 source=self.source_name,
                                 raw_data={"fiscal_year": year, "raw_value": value},
                             )
-                            records.append(record)
-
-                            if year not in yearly_amounts:
-                                yearly_amounts[year] = 0.0
-                            yearly_amounts[year] += amount
-                            total_amount += amount
-
-                        except (KeyError, TypeError, ValueError):
-                            continue
+                        )
 
+            shares_reduction_rate = 0.0
             if balance_sheet is not None and not balance_sheet.empty:
                 if "Share Issued" in balance_sheet.index:
-                    shares_row = balance_sheet.loc["Share Issued"]
-                    for col in shares_row.index:
-                        try:
-                            val = shares_row[col]
-                            if val is not None and str(val) != "nan":
-                                shares_data.append(
-                                    {
-                                        "date": col,
-                                        "shares": float(val),
-                                    }
-                                )
-                        except (KeyError, TypeError, ValueError):
-                            continue
-
-            shares_reduction_rate = 0.0
-            if len(shares_data) >= 2:
-                shares_data.sort(key=lambda x: x["date"], reverse=True)
-                latest_shares = shares_data[0]["shares"]
-                oldest_shares = shares_data[-1]["shares"]
-                if oldest_shares > 0:
-                    years_diff = len(shares_data) - 1
-                    reduction = (oldest_shares - latest_shares) / oldest_shares
-                    if years_diff > 0:
-                        shares_reduction_rate = (reduction / years_diff) * 100
-
-            buyback_yield = 0.0
-            if market_cap and market_cap > 0 and yearly_amounts:
-                latest_year = max(yearly_amounts.keys())
-                latest_amount = yearly_amounts.get(latest_year, 0)
-                buyback_yield = (latest_amount / market_cap) * 100
-
-            total_shareholder_yield = buyback_yield + dividend_yield
-
-            sentiment = BuybackSentiment.NONE
-            if buyback_yield > 3.0:
-                sentiment = BuybackSentiment.AGGRESSIVE
-            elif buyback_yield > 1.0:
-                sentiment = BuybackSentiment.MODERATE
-            elif buyback_yield > 0:
-                sentiment = BuybackSentiment.MINIMAL
+                    shares_reduction_rate = _shares_reduction_rate(
+                        balance_sheet.loc["Share Issued"]
+                    )
 
             summary = BuybackSummary(
                 ticker=ticker,
                 market=self.market,
                 period_days=days,
                 total_amount=total_amount,
-                buyback_yield=buyback_yield,
                 shares_reduction_rate=shares_reduction_rate,
-                dividend_yield=dividend_yield,
-                total_shareholder_yield=total_shareholder_yield,
                 yearly_amounts=yearly_amounts,
-                record_count=len(records),
-                sentiment=sentiment,
+                record_count=record_count,
             )
+            summary.apply_market_data(market_cap, dividend_yield)
 
             return BuybackFetchResult(
                 success=True,
@@ -10,50 +10,67 @@ Usage:
     # Register a new market fetcher
     BuybackRegistry.register_fetcher(Market.HK, HKBuybackFetcher)
     
-    # Get appropriate fetcher for ticker
+    # Get appropriate fetcher for ticker (one shared instance per market
+    # and constructor arguments)
     fetcher = BuybackRegistry.get_fetcher("00700")
 """
-from typing import Dict, Type, Callable, List, Optional
+import functools
+from typing import Any, Dict, Type, Callable, List, Optional, Tuple
 from valueinvest.news.base import Market
 
 
 class BuybackRegistry:
     _fetchers: Dict[Market, Type] = {}
     _market_detectors: List[Callable[[str], Optional[Market]]] = []
+    _instances: Dict[Tuple[Market, Tuple], Any] = {}
     _initialized: bool = False
 
     @classmethod
     def register_fetcher(cls, market: Market, fetcher_class: Type) -> None:
         cls._fetchers[market] = fetcher_class
+        cls.clear_instances()
 
     @classmethod
     def register_detector(cls, detector: Callable[[str], Optional[Market]]) -> None:
         cls._market_detectors.append(detector)
+        _detect_market_cached.cache_clear()
 
     @classmethod
     def detect_market(cls, ticker: str) -> Market:
         cls._ensure_initialized()
-
-        ticker = ticker.strip().upper()
-
-        for detector in cls._market_detectors:
-            result = detector(ticker)
-            if result is not None:
-                return result
-
-        raise ValueError(f"Cannot detect market for ticker: {ticker}")
+        return _detect_market_cached(ticker.strip().upper())
 
     @classmethod
     def get_fetcher(cls, ticker: str, **kwargs):
-        cls._ensure_initialized()
-
         market = cls.detect_market(ticker)
+        if not kwargs:
+            # Shared instances are keyed by market, so this stays bounded
+            fetcher = cls._instances.get((market, ()))
+            if fetcher is not None:
+                return fetcher
+
         fetcher_class = cls._fetchers.get(market)
 
         if fetcher_class is None:
             raise ValueError(f"No buyback fetcher registered for market: {market}")
 
-        return fetcher_class(**kwargs)
+        # Reuse one instance per market and kwargs so fetcher-level caches
+        # (the yfinance Ticker) stay warm across calls
+        try:
+            key = (market, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return fetcher_class(**kwargs)
+
+        fetcher = cls._instances.get(key)
+        if fetcher is None:
+            fetcher = cls._instances.setdefault(key, fetcher_class(**kwargs))
+        return fetcher
+
+    @classmethod
+    def clear_instances(cls) -> None:
+        """Drop the shared fetcher instances handed out by ``get_fetcher``."""
+        cls._instances = {}
 
     @classmethod
     def get_supported_markets(cls) -> List[Market]:
@@ -89,29 +106,44 @@ class BuybackRegistry:
         except ImportError:
             pass
 
-        def detect_ashare(ticker: str) -> Optional[Market]:
-            if ticker.isdigit() and len(ticker) == 6:
-                first = ticker[0]
-                if first in ("0", "3", "6"):
-                    return Market.A_SHARE
-            return None
-
-        def detect_us(ticker: str) -> Optional[Market]:
-            if ticker.isalpha() and 1 <= len(ticker) <= 5:
-                return Market.US
-            return None
-
-        def detect_hk(ticker: str) -> Optional[Market]:
-            if ticker.isdigit() and len(ticker) == 5:
-                return Market.HK
-            return None
-
-        cls.register_detector(detect_ashare)
-        cls.register_detector(detect_us)
-        cls.register_detector(detect_hk)
+        cls.register_detector(_detect_default)
 
     @classmethod
     def reset(cls) -> None:
         cls._fetchers = {}
         cls._market_detectors = []
+        cls._instances = {}
         cls._initialized = False
+        _detect_market_cached.cache_clear()
+
+
+def _detect_default(ticker: str) -> Optional[Market]:
+    """
+    Built-in detector: A-share (6 digits starting 0/3/6), US (1-5 letters)
+    or HK (5 digits), decided from the length and first character.
+    """
+    n = len(ticker)
+    if n == 6:
+        if ticker[0] in "036" and ticker.isdigit():
+            return Market.A_SHARE
+    elif n == 5 and ticker.isdigit():
+        return Market.HK
+    if 1 <= n <= 5 and ticker.isalpha():
+        return Market.US
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_market_cached(ticker: str) -> Market:
+    """
+    Run the registered detectors for a normalized ticker.
+
+    Memoized for repeated lookups; the cache is cleared whenever detectors
+    change (``register_detector``/``reset``).
+    """
+    for detector in BuybackRegistry._market_detectors:
+        result = detector(ticker)
+        if result is not None:
+            return result
+
+    raise ValueError(f"Cannot detect market for ticker: {ticker}")
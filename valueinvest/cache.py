@@ -0,0 +1,193 @@
+"""
+Persistent on-disk cache with TTL for network-backed data fetches.
+
+Entries are stored under ``~/.valueinvest/cache/<ticker>/<endpoint>_<md5(params)>.pkl``
+(override the root with the ``VALUEINVEST_CACHE_DIR`` environment variable).
+Freshness is judged from the file modification time, so no index file is needed.
+
+Values are pickled rather than JSON-encoded because fetch results are dataclasses
+holding dates, enums and pandas DataFrames.
+
+Usage:
+    from valueinvest.cache import cached, FileCache, set_default_cache
+
+    @cached(endpoint="insider", ttl=86400)
+    def fetch_insider_trades(ticker: str, days: int = 90):
+        ...
+
+    # Disable caching, or force a single TTL for every endpoint
+    set_default_cache(FileCache(enabled=False))
+    set_default_cache(FileCache(ttl_override=3600))
+"""
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Default TTLs (seconds) by data type
+TTL_PRICE = 3600
+TTL_NEWS = 3600
+TTL_FUNDAMENTALS = 86400
+TTL_FCF = 7 * 86400
+
+# Part of every key. Bump when a cached class changes its pickled layout
+# (e.g. Stock/StockHistory or the news/buyback/cash flow dataclasses gaining
+# or losing __slots__ fields) so old entries are never loaded.
+CACHE_FORMAT_VERSION = 6
+
+_MISS = object()
+
+
+def default_cache_dir() -> Path:
+    """Return the cache root, honouring ``VALUEINVEST_CACHE_DIR``."""
+    env_dir = os.environ.get("VALUEINVEST_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir).expanduser()
+    return Path.home() / ".valueinvest" / "cache"
+
+
+def make_key(*args: Any, **kwargs: Any) -> str:
+    """Build a stable md5 key from call arguments and the cache format version."""
+    payload = json.dumps(
+        {"v": CACHE_FORMAT_VERSION, "args": args, "kwargs": kwargs}, sort_keys=True, default=str
+    )
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+
+class FileCache:
+    """
+    File-based cache keyed by (ticker, endpoint, params).
+
+    Args:
+        cache_dir: Cache root directory (default: ``default_cache_dir()``)
+        enabled: When False, every lookup misses and nothing is written
+        ttl_override: If set, replaces the per-endpoint TTL for all lookups
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        enabled: bool = True,
+        ttl_override: Optional[int] = None,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.enabled = enabled
+        self.ttl_override = ttl_override
+
+    def _path(self, ticker: str, endpoint: str, key: str) -> Path:
+        safe_ticker = ticker.strip().upper().replace("/", "_") or "_"
+        return self.cache_dir / safe_ticker / f"{endpoint}_{key}.pkl"
+
+    def get(self, ticker: str, endpoint: str, key: str, ttl: int, default: Any = None) -> Any:
+        """Return the cached value, or ``default`` if absent or older than the TTL."""
+        if not self.enabled:
+            return default
+
+        path = self._path(ticker, endpoint, key)
+        effective_ttl = self.ttl_override if self.ttl_override is not None else ttl
+        try:
+            if time.time() - path.stat().st_mtime > effective_ttl:
+                return default
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+            return default
+
+    def set(self, ticker: str, endpoint: str, key: str, value: Any) -> None:
+        """Store a value. Failures (unpicklable value, read-only disk) are ignored."""
+        if not self.enabled:
+            return
+
+        path = self._path(ticker, endpoint, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so concurrent readers never see partial data
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass
+
+    def clear(self, ticker: Optional[str] = None, endpoint: Optional[str] = None) -> None:
+        """Remove cached entries for one ticker, or the whole cache.
+
+        With ``endpoint``, only that endpoint's entries are removed.
+        """
+        target = self.cache_dir / ticker.strip().upper() if ticker else self.cache_dir
+        if endpoint is None:
+            shutil.rmtree(target, ignore_errors=True)
+            return
+        # Match the md5 key length so "quote" does not also clear "quote_x"
+        pattern = f"{endpoint}_{'?' * 32}.pkl"
+        if not ticker:
+            pattern = f"*/{pattern}"
+        for path in target.glob(pattern):
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+_default_cache = FileCache()
+
+
+def get_default_cache() -> FileCache:
+    return _default_cache
+
+
+def set_default_cache(cache: FileCache) -> None:
+    global _default_cache
+    _default_cache = cache
+
+
+def cached(endpoint: str, ttl: int) -> Callable:
+    """
+    Decorator caching ``func(ticker, *args, **kwargs)`` in the default FileCache.
+
+    The first positional argument must be the ticker. Exceptions and results
+    carrying ``success=False`` are never cached.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(ticker: str, *args: Any, **kwargs: Any) -> Any:
+            cache = get_default_cache()
+            key = make_key(*args, **kwargs)
+
+            value = cache.get(ticker, endpoint, key, ttl, default=_MISS)
+            if value is not _MISS:
+                return value
+
+            value = func(ticker, *args, **kwargs)
+            if getattr(value, "success", True) is not False:
+                cache.set(ticker, endpoint, key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "FileCache",
+    "cached",
+    "default_cache_dir",
+    "get_default_cache",
+    "make_key",
+    "set_default_cache",
+    "TTL_FCF",
+    "TTL_FUNDAMENTALS",
+    "TTL_NEWS",
+    "TTL_PRICE",
+]
@@ -131,7 +131,7 @@ class CashFlowRecord:
         return 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CashFlowSummary:
     """Aggregated summary of cash flow analysis."""
 
@@ -222,7 +222,7 @@ class CashFlowSummary:
         return (self.positive_fcf_years / self.record_count) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class CashFlowFetchResult:
     """Result from cash flow data fetch operation."""
 
@@ -250,7 +250,7 @@ class CashFlowFetchResult:
         """Get the most recent cash flow record."""
         if not self.records:
             return None
-        return sorted(self.records, key=lambda r: r.fiscal_year, reverse=True)[0]
+        return max(self.records, key=lambda r: r.fiscal_year)
 
     @property
     def fcf_trend_records(self) -> List[CashFlowRecord]:
@@ -7,9 +7,15 @@ Data sources:
 - Balance sheet: Shares Outstanding
 - Info: Market Cap, Current Price
 """
+import bisect
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, ClassVar
 import math
+import threading
+
+import numpy as np
+import pandas as pd
 
 from .base import BaseCashFlowFetcher
 from ..base import (
@@ -20,14 +26,90 @@ from ..base import (
     FCFTrend,
     Market,
 )
+from ...cache import TTL_FUNDAMENTALS, FileCache, get_default_cache, make_key
+from ...session import get_http_session
+
+# Statement rows read per fiscal year (primary rows and their fallbacks)
+_CF_ROWS = (
+    "Operating Cash Flow",
+    "Cash Flow From Continuing Operating Activities",
+    "Capital Expenditure",
+    "Purchase Of Ppe",
+    "Purchase Of Business",
+    "Free Cash Flow",
+    "Stock Based Compensation",
+    "Depreciation",
+    "Amortization",
+    "Depreciation And Amortization",
+    "Interest Paid",
+    "Income Tax Paid",
+)
+_FIN_ROWS = ("Net Income", "Net Income Common Stockholders", "Total Revenue", "EBITDA")
+
+# FCF / net income cut-offs, ascending, for bisect_right: at least 0.5 is
+# ACCEPTABLE, at least 0.8 GOOD, strictly above 1.1 EXCELLENT
+_QUALITY_THRESHOLDS = (0.5, 0.8, math.nextafter(1.1, math.inf))
+_QUALITY_TABLE = (FCFQuality.POOR, FCFQuality.ACCEPTABLE, FCFQuality.GOOD, FCFQuality.EXCELLENT)
+
+_MISS = object()
+
+
+def _is_empty(value: Any) -> bool:
+    """True for a missing info dict or statement, which is never cached."""
+    if value is None:
+        return True
+    if hasattr(value, "empty"):
+        return bool(value.empty)
+    return not value
+
+
+def _rows(df, rows, columns, fill: float = 0.0) -> Dict[str, np.ndarray]:
+    """Wanted rows of a statement as float arrays aligned to ``columns``.
+
+    Missing rows/columns and unparseable or NaN cells become ``fill``.
+    """
+    if df is None or df.empty:
+        return {name: np.full(len(columns), fill) for name in rows}
+    if df.index.has_duplicates:
+        df = df[~df.index.duplicated()]
+    if df.columns.has_duplicates:
+        df = df.loc[:, ~df.columns.duplicated()]
+    frame = df.reindex(index=list(rows), columns=columns).apply(pd.to_numeric, errors="coerce")
+    values = frame.to_numpy(dtype=float, na_value=fill)
+    return dict(zip(rows, values, strict=True))
+
+
+def _fiscal_date(col) -> Optional[Tuple[int, date]]:
+    """Fiscal year and report date of a non-datetime statement column, if parseable."""
+    try:
+        if hasattr(col, "year"):
+            return col.year, (
+                col.date() if hasattr(col, "date") else date(col.year, col.month, col.day)
+            )
+        fiscal_year = int(str(col)[:4])
+        return fiscal_year, date(fiscal_year, 12, 31)
+    except Exception:
+        return None
 
 
 class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
-    """Fetch cash flow data for US stocks via yfinance."""
+    """Fetch cash flow data for US stocks via yfinance.
+
+    Args:
+        cache: Optional FileCache that also keeps yfinance data on disk, so
+            later runs on the same day skip the download (default: memory only)
+    """
 
-    def __init__(self):
+    # yf.Ticker attributes (info and the annual statements) memoized per
+    # (ticker, attribute, day) in process, and in ``cache`` when one is given.
+    # Both tiers are skipped while the cache (or the default one) is disabled.
+    MEMORY_CACHE_SIZE = 256
+    _memory: ClassVar[Dict[Tuple[str, str, str], Any]] = {}
+    _memory_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, cache: Optional[FileCache] = None):
         self._ticker_obj = None
-        self._info = None
+        self._cache = cache
 
     @property
     def market(self) -> Market:
@@ -37,13 +119,25 @@ class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
     def source_name(self) -> str:
         return "yfinance"
 
+    @classmethod
+    def clear_cache(cls, ticker: Optional[str] = None, cache: Optional[FileCache] = None) -> None:
+        """Drop memoized yfinance data for one ticker, or all (and its entries in ``cache``)."""
+        with cls._memory_lock:
+            if ticker is None:
+                cls._memory.clear()
+            else:
+                for key in [k for k in cls._memory if k[0] == ticker]:
+                    del cls._memory[key]
+        if cache is not None:
+            for kind in ("info", "cashflow", "financials", "balance_sheet"):
+                cache.clear(ticker, endpoint=f"yfinance_{kind}")
+
     def _get_ticker_obj(self, ticker: str):
         if self._ticker_obj is None or getattr(self._ticker_obj, "ticker", None) != ticker:
             try:
                 import yfinance as yf
 
-                self._ticker_obj = yf.Ticker(ticker)
-                self._info = None
+                self._ticker_obj = yf.Ticker(ticker, session=get_http_session())
             except ImportError as e:
                 raise ImportError(
                     "yfinance is required for US stock cash flow data. "
@@ -51,11 +145,41 @@ class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
                 ) from e
         return self._ticker_obj
 
+    def _cached_fetch(self, ticker: str, kind: str) -> Any:
+        """``yf.Ticker(ticker).<kind>``, memoized for the day; empty results are not kept."""
+        cache = self._cache
+        if not (cache or get_default_cache()).enabled:
+            return getattr(self._get_ticker_obj(ticker), kind)
+
+        day = date.today().isoformat()
+        memory_key = (ticker, kind, day)
+        cls = type(self)
+        with cls._memory_lock:
+            value = cls._memory.get(memory_key, _MISS)
+        if value is not _MISS:
+            return value
+
+        endpoint = f"yfinance_{kind}"
+        disk_key = make_key(day)
+        value = _MISS
+        if cache is not None:
+            value = cache.get(ticker, endpoint, disk_key, TTL_FUNDAMENTALS, default=_MISS)
+        if value is _MISS:
+            value = getattr(self._get_ticker_obj(ticker), kind)
+            if _is_empty(value):
+                return value
+            if cache is not None:
+                cache.set(ticker, endpoint, disk_key, value)
+
+        with cls._memory_lock:
+            if len(cls._memory) >= cls.MEMORY_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                cls._memory.pop(next(iter(cls._memory)))
+            cls._memory[memory_key] = value
+        return value
+
     def _get_info(self, ticker: str) -> Dict[str, Any]:
-        if self._info is None:
-            stock = self._get_ticker_obj(ticker)
-            self._info = stock.info or {}
-        return self._info
+        return self._cached_fetch(ticker, "info") or {}
 
     def fetch_cashflow(
         self,
@@ -65,7 +189,6 @@ class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
         end_date: Optional[date] = None,
     ) -> CashFlowFetchResult:
         try:
-            stock = self._get_ticker_obj(ticker)
             info = self._get_info(ticker)
 
             if not info:
@@ -85,9 +208,9 @@ class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
             current_price = info.get("currentPrice", 0) or info.get("regularMarketPrice", 0) or 0
 
             # Get financial statements
-            cashflow = stock.cashflow
-            financials = stock.financials
-            balance_sheet = stock.balance_sheet
+            cashflow = self._cached_fetch(ticker, "cashflow")
+            financials = self._cached_fetch(ticker, "financials")
+            balance_sheet = self._cached_fetch(ticker, "balance_sheet")
 
             records: List[CashFlowRecord] = []
             yearly_fcf: Dict[int, float] = {}
@@ -95,7 +218,6 @@ class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
             yearly_revenue: Dict[int, float] = {}
             yearly_sbc: Dict[int, float] = {}
             yearly_capex: Dict[int, float] = {}
-            yearly_net_income: Dict[int, float] = {}
 
             if cashflow is None or cashflow.empty:
                 return CashFlowFetchResult(
@@ -109,133 +231,105 @@ class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
                     current_price=current_price,
                 )
 
-            # Extract data from cash flow statement
-            for col in cashflow.columns[:years]:
-                try:
-                    # Get fiscal year
-                    if hasattr(col, "year"):
-                        fiscal_year = col.year
-                        report_date = (
-                            col.date()
-                            if hasattr(col, "date")
-                            else date(col.year, col.month, col.day)
-                        )
-                    else:
-                        fiscal_year = int(str(col)[:4])
-                        report_date = date(fiscal_year, 12, 31)
-
-                    # Helper to safely get value
-                    def get_value(row_name: str, df=cashflow) -> float:
-                        try:
-                            if row_name in df.index:
-                                val = df.loc[row_name, col]
-                                if val is not None and str(val) != "nan":
-                                    return float(val)
-                        except (KeyError, TypeError, ValueError):
-                            pass
-                        return 0.0
-
-                    # Cash flow data
-                    operating_cf = get_value("Operating Cash Flow")
-                    if operating_cf == 0:
-                        operating_cf = get_value("Cash Flow From Continuing Operating Activities")
-
-                    capex = get_value("Capital Expenditure")
-                    if capex == 0:
-                        capex = get_value("Purchase Of Ppe") + get_value("Purchase Of Business")
-
-                    fcf = get_value("Free Cash Flow")
-                    if fcf == 0 and operating_cf != 0:
-                        fcf = operating_cf + capex  # CapEx is usually negative
-
-                    sbc = get_value("Stock Based Compensation")
-
-                    # Depreciation & Amortization
-                    depreciation = get_value("Depreciation")
-                    amortization = get_value("Amortization")
-                    if depreciation == 0:
-                        depreciation = get_value("Depreciation And Amortization")
-                        amortization = 0
-
-                    # Interest and taxes
-                    interest_paid = abs(get_value("Interest Paid"))
-                    taxes_paid = abs(get_value("Income Tax Paid"))
-
-                    # Income statement data
-                    net_income = 0.0
-                    revenue = 0.0
-                    ebitda = 0.0
-
-                    if financials is not None and not financials.empty:
-                        if col in financials.columns:
-
-                            def get_fin_value(row_name: str) -> float:
-                                try:
-                                    if row_name in financials.index:
-                                        val = financials.loc[row_name, col]
-                                        if val is not None and str(val) != "nan":
-                                            return float(val)
-                                except (KeyError, TypeError, ValueError):
-                                    pass
-                                return 0.0
-
-                            net_income = get_fin_value("Net Income")
-                            if net_income == 0:
-                                net_income = get_fin_value("Net Income Common Stockholders")
-                            revenue = get_fin_value("Total Revenue")
-                            ebitda = get_fin_value("EBITDA")
-
-                    # Shares outstanding for this year
-                    year_shares = shares_outstanding
-                    if balance_sheet is not None and not balance_sheet.empty:
-                        if col in balance_sheet.columns:
-                            try:
-                                if "Share Issued" in balance_sheet.index:
-                                    val = balance_sheet.loc["Share Issued", col]
-                                    if val is not None and str(val) != "nan":
-                                        year_shares = float(val)
-                            except (KeyError, TypeError, ValueError):
-                                pass
-
-                    # Calculate true FCF (SBC-adjusted)
-                    true_fcf = fcf - sbc
-
-                    # Skip if no meaningful data
-                    if fcf == 0 and operating_cf == 0:
-                        continue
-
-                    record = CashFlowRecord(
-                        ticker=ticker,
-                        market=self.market,
-                        fiscal_year=fiscal_year,
-                        operating_cash_flow=operating_cf,
-                        capital_expenditure=capex,
-                        free_cash_flow=fcf,
-                        stock_based_comp=sbc,
-                        true_fcf=true_fcf,
-                        net_income=net_income,
-                        revenue=revenue,
-                        ebitda=ebitda,
-                        depreciation=depreciation,
-                        amortization=amortization,
-                        interest_paid=interest_paid,
-                        taxes_paid=taxes_paid,
-                        shares_outstanding=year_shares,
-                        source=self.source_name,
-                        report_date=report_date,
-                    )
-                    records.append(record)
-
-                    # Store yearly data
-                    yearly_fcf[fiscal_year] = fcf
-                    yearly_true_fcf[fiscal_year] = true_fcf
-                    yearly_revenue[fiscal_year] = revenue
-                    yearly_sbc[fiscal_year] = sbc
-                    yearly_capex[fiscal_year] = abs(capex)
-                    yearly_net_income[fiscal_year] = net_income
-
-                except Exception as e:
+            # Per-year metrics as vector ops across the year axis
+            columns = cashflow.columns[:years]
+            cf = _rows(cashflow, _CF_ROWS, columns)
+            fin = _rows(financials, _FIN_ROWS, columns)
+            year_shares = _rows(balance_sheet, ("Share Issued",), columns, shares_outstanding)[
+                "Share Issued"
+            ]
+
+            operating_cf = cf["Operating Cash Flow"]
+            operating_cf = np.where(
+                operating_cf != 0,
+                operating_cf,
+                cf["Cash Flow From Continuing Operating Activities"],
+            )
+            capex = cf["Capital Expenditure"]
+            capex = np.where(capex != 0, capex, cf["Purchase Of Ppe"] + cf["Purchase Of Business"])
+            fcf = cf["Free Cash Flow"]
+            # CapEx is usually negative
+            fcf = np.where(fcf != 0, fcf, np.where(operating_cf != 0, operating_cf + capex, 0.0))
+            sbc = cf["Stock Based Compensation"]
+            true_fcf = fcf - sbc
+
+            # Depreciation & Amortization
+            has_depreciation = cf["Depreciation"] != 0
+            depreciation = np.where(
+                has_depreciation, cf["Depreciation"], cf["Depreciation And Amortization"]
+            )
+            amortization = np.where(has_depreciation, cf["Amortization"], 0.0)
+
+            net_income = fin["Net Income"]
+            net_income = np.where(
+                net_income != 0, net_income, fin["Net Income Common Stockholders"]
+            )
+
+            # Skip years with no meaningful data
+            keep = (fcf != 0) | (operating_cf != 0)
+
+            # Fiscal years and report dates, in one pass for a DatetimeIndex
+            kept = columns[keep]
+            if isinstance(kept, pd.DatetimeIndex):
+                fiscal_dates = list(zip(kept.year.tolist(), kept.date.tolist(), strict=True))
+            else:
+                fiscal_dates = [_fiscal_date(col) for col in kept]
+
+            per_year = zip(
+                fiscal_dates,
+                operating_cf[keep].tolist(),
+                capex[keep].tolist(),
+                fcf[keep].tolist(),
+                sbc[keep].tolist(),
+                true_fcf[keep].tolist(),
+                net_income[keep].tolist(),
+                fin["Total Revenue"][keep].tolist(),
+                fin["EBITDA"][keep].tolist(),
+                depreciation[keep].tolist(),
+                amortization[keep].tolist(),
+                np.abs(cf["Interest Paid"][keep]).tolist(),
+                np.abs(cf["Income Tax Paid"][keep]).tolist(),
+                year_shares[keep].tolist(),
+                strict=True,
+            )
+
+            # Build records from the precomputed per-year values
+            for (
+                fiscal_date, ocf_y, capex_y, fcf_y, sbc_y, true_fcf_y, net_income_y, revenue_y,
+                ebitda_y, depreciation_y, amortization_y, interest_y, taxes_y, shares_y,
+            ) in per_year:
+                if fiscal_date is None:
                     continue
+                fiscal_year, report_date = fiscal_date
+
+                record = CashFlowRecord(
+                    ticker=ticker,
+                    market=self.market,
+                    fiscal_year=fiscal_year,
+                    operating_cash_flow=ocf_y,
+                    capital_expenditure=capex_y,
+                    free_cash_flow=fcf_y,
+                    stock_based_comp=sbc_y,
+                    true_fcf=true_fcf_y,
+                    net_income=net_income_y,
+                    revenue=revenue_y,
+                    ebitda=ebitda_y,
+                    depreciation=depreciation_y,
+                    amortization=amortization_y,
+                    interest_paid=interest_y,
+                    taxes_paid=taxes_y,
+                    shares_outstanding=shares_y,
+                    source=self.source_name,
+                    report_date=report_date,
+                )
+                records.append(record)
+
+                # Store yearly data
+                yearly_fcf[fiscal_year] = fcf_y
+                yearly_true_fcf[fiscal_year] = true_fcf_y
+                yearly_revenue[fiscal_year] = revenue_y
+                yearly_sbc[fiscal_year] = sbc_y
+                yearly_capex[fiscal_year] = abs(capex_y)
 
             if not records:
                 return CashFlowFetchResult(
@@ -275,7 +369,7 @@ class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
             fcf_quality = self._determine_fcf_quality(latest)
 
             # Determine FCF trend
-            fcf_trend = self._determine_fcf_trend(list(yearly_fcf.values()))
+            fcf_trend = self._determine_fcf_trend([yearly_fcf[y] for y in sorted(yearly_fcf)])
 
             # Count positive/negative years
             positive_years = sum(1 for f in yearly_fcf.values() if f > 0)
@@ -335,6 +429,40 @@ class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
                 errors=[str(e)],
             )
 
+    @classmethod
+    def fetch_many(
+        cls,
+        tickers: List[str],
+        years: int = 5,
+        max_workers: int = 16,
+        cache: Optional[FileCache] = None,
+    ) -> Dict[str, CashFlowFetchResult]:
+        """
+        Fetch cash flow data for several tickers concurrently.
+
+        Each ticker gets its own fetcher on a worker thread; the downloads
+        are I/O bound, so threads overlap the round trips to Yahoo.
+
+        Args:
+            tickers: Ticker symbols (duplicates are fetched once)
+            years: Number of years of historical data
+            max_workers: Max concurrent downloads
+            cache: Passed to each fetcher (see the class docstring)
+
+        Returns:
+            Results keyed by ticker, in input order
+        """
+        unique = list(dict.fromkeys(tickers))
+        if not unique:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+            futures = {
+                ticker: executor.submit(cls(cache).fetch_cashflow, ticker, years)
+                for ticker in unique
+            }
+            return {ticker: future.result() for ticker, future in futures.items()}
+
     def _calculate_cagr(self, yearly_data: Dict[int, float]) -> float:
         """Calculate compound annual growth rate."""
         if len(yearly_data) < 2:
@@ -366,29 +494,21 @@ class YFinanceCashFlowFetcher(BaseCashFlowFetcher):
             return FCFQuality.NEGATIVE
 
         fcf_to_ni = record.fcf_to_net_income
-
-        if fcf_to_ni > 1.1:
-            return FCFQuality.EXCELLENT
-        elif fcf_to_ni >= 0.8:
-            return FCFQuality.GOOD
-        elif fcf_to_ni >= 0.5:
-            return FCFQuality.ACCEPTABLE
-        else:
+        if fcf_to_ni != fcf_to_ni:  # NaN
             return FCFQuality.POOR
+        return _QUALITY_TABLE[bisect.bisect_right(_QUALITY_THRESHOLDS, fcf_to_ni)]
 
     def _determine_fcf_trend(self, fcf_values: List[float]) -> FCFTrend:
-        """Determine FCF trend over time."""
-        if len(fcf_values) < 3:
-            return FCFTrend.STABLE
-
-        # Remove zeros and sort chronologically
-        values = [v for v in fcf_values if v != 0]
-        if len(values) < 3:
+        """Determine FCF trend from values in chronological order."""
+        values = np.asarray(fcf_values, dtype=np.float64)
+        values = values[values != 0]
+        if values.size < 3:
             return FCFTrend.STABLE
 
-        # Check for consistent growth/decline
-        increases = sum(1 for i in range(1, len(values)) if values[i] > values[i - 1])
-        decreases = sum(1 for i in range(1, len(values)) if values[i] < values[i - 1])
+        # Count year-over-year increases/decreases from the step signs
+        steps = np.sign(np.diff(values))
+        increases = int(np.count_nonzero(steps > 0))
+        decreases = int(np.count_nonzero(steps < 0))
 
         total = increases + decreases
         if total == 0:
@@ -8,7 +8,8 @@ Supported sources:
 """
 import os
 import re
-from typing import Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, Tuple, TYPE_CHECKING
 
 from .base import BaseFetcher, FetchResult, HistoryResult
 
@@ -21,6 +22,16 @@ if TYPE_CHECKING:
 # Ticker patterns
 ASHARE_PATTERN = re.compile(r"^\d{6}$")  # 6 digits only
 ASHARE_WITH_SUFFIX = re.compile(r"^(\d{6})\.(SH|SZ|BJ)$")
+_ASHARE_RE = re.compile(r"^(\d{6})(\.(?:SH|SZ|BJ))?$")
+
+
+@lru_cache(maxsize=8192)
+def _parse_ashare(ticker: str) -> Optional[Tuple[str, bool]]:
+    """Return (6-digit code, has_suffix) for A-share tickers, else None."""
+    match = _ASHARE_RE.match(ticker)
+    if match is None:
+        return None
+    return match.group(1), match.group(2) is not None
 
 
 def detect_source(ticker: str, prefer_tushare: bool = False) -> str:
@@ -33,19 +44,19 @@ def detect_source(ticker: str, prefer_tushare: bool = False) -> str:
     Returns:
         Source name: 'yfinance', 'akshare', or 'tushare'
     """
-    # A-share with suffix -> could be Tushare or AKShare
-    match = ASHARE_WITH_SUFFIX.match(ticker)
-    if match:
-        if prefer_tushare and os.environ.get("TUSHARE_TOKEN"):
-            return "tushare"
-        return "akshare"
-
-    # Pure 6-digit -> AKShare (A-shares)
-    if ASHARE_PATTERN.match(ticker):
-        return "akshare"
+    parsed = _parse_ashare(ticker)
 
     # Default to yfinance for US/International
-    return "yfinance"
+    if parsed is None:
+        return "yfinance"
+
+    # A-share with suffix -> could be Tushare or AKShare
+    _, has_suffix = parsed
+    if has_suffix and prefer_tushare and os.environ.get("TUSHARE_TOKEN"):
+        return "tushare"
+
+    # Pure 6-digit or no Tushare token -> AKShare (A-shares)
+    return "akshare"
 
 
 def normalize_ashare_ticker(ticker: str) -> str:
@@ -57,9 +68,9 @@ def normalize_ashare_ticker(ticker: str) -> str:
     Returns:
         6-digit ticker code
     """
-    match = ASHARE_WITH_SUFFIX.match(ticker)
-    if match:
-        return match.group(1)
+    parsed = _parse_ashare(ticker)
+    if parsed is not None and parsed[1]:
+        return parsed[0]
     return ticker
 
 
@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -37,34 +38,41 @@ class HistoryResult:
             return []
         return [d.date() if hasattr(d, "date") else d for d in self.df.index.tolist()]
 
+    def _closes(self) -> np.ndarray:
+        """Close prices as a float64 array (empty when there is no data)."""
+        if self.df is None or self.df.empty:
+            return np.empty(0)
+        return self.df["close"].to_numpy(dtype=np.float64)
+
     def calculate_cagr(self, years: int = 5) -> float:
-        if self.df is None or len(self.df) < 2:
+        closes = self._closes()
+        if len(closes) < 2:
             return 0.0
-        start_price = float(self.df["close"].iloc[0])
-        end_price = float(self.df["close"].iloc[-1])
+        start_price = float(closes[0])
+        end_price = float(closes[-1])
         if start_price <= 0:
             return 0.0
-        actual_years = len(self.df) / 252
-        if actual_years <= 0:
-            return 0.0
+        actual_years = len(closes) / 252
         cagr = (end_price / start_price) ** (1 / actual_years) - 1
         return cagr * 100
 
     def calculate_volatility(self) -> float:
-        if self.df is None or len(self.df) < 2:
+        closes = self._closes()
+        if len(closes) < 2:
             return 0.0
-        returns = self.df["close"].pct_change().dropna()
-        if returns.empty:
+        returns = closes[1:] / closes[:-1] - 1
+        returns = returns[~np.isnan(returns)]
+        if returns.size == 0:
             return 0.0
-        return float(returns.std() * (252**0.5) * 100)
+        return float(np.std(returns, ddof=1) * (252**0.5) * 100)
 
     def calculate_max_drawdown(self) -> float:
-        if self.df is None or self.df.empty:
+        closes = self._closes()
+        if closes.size == 0:
             return 0.0
-        prices = self.df["close"]
-        rolling_max = prices.cummax()
-        drawdown = (prices - rolling_max) / rolling_max
-        return float(drawdown.min() * 100)
+        rolling_max = np.fmax.accumulate(closes)
+        drawdown = (closes - rolling_max) / rolling_max
+        return float(np.nanmin(drawdown) * 100)
 
 
 class BaseFetcher(ABC):
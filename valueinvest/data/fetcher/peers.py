@@ -2,6 +2,7 @@
 Industry Peer Comparison Data
 """
 from typing import List, Dict, Any, Optional
+from ...session import get_http_session
 
 
 def get_industry_peers(ticker: str, source: str = "yfinance") -> List[str]:
@@ -12,7 +13,7 @@ def get_industry_peers(ticker: str, source: str = "yfinance") -> List[str]:
     """
     try:
         import yfinance as yf
-        stock = yf.Ticker(ticker)
+        stock = yf.Ticker(ticker, session=get_http_session())
         info = stock.info
 
         # Get industry and sector
@@ -44,7 +45,7 @@ def fetch_peer_metrics(tickers: List[str]) -> List[Dict[str, Any]]:
     peers = []
     for ticker in tickers[:10]:  # Limit to 10 peers
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=get_http_session())
             info = stock.info
 
             if not info:
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
 from .base import BaseFetcher, FetchResult, HistoryResult
+from ...session import get_http_session
 
 
 class YFinanceFetcher(BaseFetcher):
@@ -19,7 +20,7 @@ class YFinanceFetcher(BaseFetcher):
         try:
             import yfinance as yf
 
-            return yf.Ticker(ticker)
+            return yf.Ticker(ticker, session=get_http_session())
         except ImportError as e:
             raise ImportError(
                 "yfinance is required for US stock data. "
@@ -8,9 +8,10 @@ This module provides dataclasses for:
 - IndustrySummary: Aggregated industry analysis
 - IndustryFetchResult: Complete fetch result
 """
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from enum import Enum
 
 
@@ -32,7 +33,7 @@ class FundFlowSentiment(Enum):
     BALANCED = "balanced"  # Balanced flow
 
 
-@dataclass
+@dataclass(slots=True)
 class PeerCompany:
     """Single peer company in the same industry."""
 
@@ -201,10 +202,20 @@ class IndustryFetchResult:
         """Check if comparison data is available."""
         return self.ticker_rank_in_peers > 0
 
+    def to_soa(
+        self, fields: Sequence[str] = ("ticker", "market_cap", "pe_ratio", "net_income")
+    ) -> Dict[str, List]:
+        """
+        Peer data as parallel columns (structure of arrays).
+
+        Each field maps to a list aligned with ``peers``, ready for
+        ``numpy.asarray``/``pandas.DataFrame`` in bulk peer analytics.
+        """
+        return {name: [getattr(p, name) for p in self.peers] for name in fields}
+
     def get_top_peers(self, n: int = 5) -> List[PeerCompany]:
         """Get top N peers by market cap."""
-        sorted_peers = sorted(self.peers, key=lambda x: x.market_cap, reverse=True)
-        return sorted_peers[:n]
+        return heapq.nlargest(n, self.peers, key=lambda x: x.market_cap)
 
     def get_similar_sized_peers(
         self, market_cap: float, tolerance: float = 0.3
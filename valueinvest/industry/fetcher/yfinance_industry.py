@@ -15,6 +15,7 @@ from ..base import (
 )
 from ..registry import Market
 from .base import BaseIndustryFetcher
+from ...session import get_http_session
 
 
 class YFinanceIndustryFetcher(BaseIndustryFetcher):
@@ -75,7 +76,7 @@ class YFinanceIndustryFetcher(BaseIndustryFetcher):
         """Get industry name from yfinance."""
         import yfinance as yf
 
-        stock = yf.Ticker(ticker)
+        stock = yf.Ticker(ticker, session=get_http_session())
         info = stock.info
         return info.get("industry", "")
 
@@ -83,7 +84,7 @@ class YFinanceIndustryFetcher(BaseIndustryFetcher):
         """Get sector name from yfinance."""
         import yfinance as yf
 
-        stock = yf.Ticker(ticker)
+        stock = yf.Ticker(ticker, session=get_http_session())
         info = stock.info
         return info.get("sector", "")
 
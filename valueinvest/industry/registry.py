@@ -13,6 +13,7 @@ Usage:
     # Get appropriate fetcher for ticker
     fetcher = IndustryRegistry.get_fetcher("00700")
 """
+import functools
 from typing import Dict, Type, Callable, List, Optional
 
 
@@ -44,20 +45,13 @@ class IndustryRegistry:
     def register_detector(cls, detector: Callable[[str], Optional[str]]) -> None:
         """Register a function that detects market from ticker string."""
         cls._market_detectors.append(detector)
+        _detect_market_cached.cache_clear()
 
     @classmethod
     def detect_market(cls, ticker: str) -> str:
         """Detect which market a ticker belongs to."""
         cls._ensure_initialized()
-
-        ticker = ticker.strip().upper()
-
-        for detector in cls._market_detectors:
-            result = detector(ticker)
-            if result is not None:
-                return result
-
-        raise ValueError(f"Cannot detect market for ticker: {ticker}")
+        return _detect_market_cached(ticker.strip().upper())
 
     @classmethod
     def get_fetcher(cls, ticker: str, **kwargs):
@@ -149,3 +143,20 @@ class IndustryRegistry:
         cls._fetchers = {}
         cls._market_detectors = []
         cls._initialized = False
+        _detect_market_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_market_cached(ticker: str) -> str:
+    """
+    Run the registered detectors for a normalized ticker.
+
+    Memoized because the same tickers recur across peer universes; the cache
+    is cleared whenever detectors change (``register_detector``/``reset``).
+    """
+    for detector in IndustryRegistry._market_detectors:
+        result = detector(ticker)
+        if result is not None:
+            return result
+
+    raise ValueError(f"Cannot detect market for ticker: {ticker}")
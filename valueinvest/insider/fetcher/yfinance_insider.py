@@ -9,6 +9,7 @@ from typing import List, Optional
 from .base import BaseInsiderFetcher
 from ..base import InsiderTrade, InsiderFetchResult, InsiderSummary, TradeType, InsiderTitle
 from valueinvest.news.base import Market
+from ...session import get_http_session
 
 
 class YFinanceInsiderFetcher(BaseInsiderFetcher):
@@ -35,7 +36,7 @@ class YFinanceInsiderFetcher(BaseInsiderFetcher):
         errors = []
         
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=get_http_session())
             insider_purchases = stock.insider_purchases
             insider_roster = stock.insider_roster_holders
             
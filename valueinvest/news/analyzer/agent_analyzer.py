@@ -8,7 +8,7 @@ import json
 from typing import List, Optional
 from datetime import datetime
 
-from .base import BaseSentimentAnalyzer
+from .base import BaseSentimentAnalyzer, loads_json, strip_json_fences
 from ..base import NewsItem, NewsAnalysisResult, Sentiment, NewsCategory
 
 
@@ -101,11 +101,12 @@ class AgentSentimentAnalyzer(BaseSentimentAnalyzer):
         self, 
         news: List[NewsItem],
         ticker: str,
+        now: Optional[datetime] = None,
     ) -> NewsAnalysisResult:
         from valueinvest.news.analyzer.keyword_analyzer import KeywordSentimentAnalyzer
         
         keyword_analyzer = KeywordSentimentAnalyzer()
-        initial_result = keyword_analyzer.analyze_batch(news, ticker)
+        initial_result = keyword_analyzer.analyze_batch(news, ticker, now=now)
         
         return initial_result
     
@@ -185,15 +186,8 @@ def parse_agent_analysis_result(response_text: str) -> dict:
     Handles various response formats including markdown code blocks.
     """
     try:
-        if "```json" in response_text:
-            json_str = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            json_str = response_text.split("```")[1].split("```")[0]
-        else:
-            json_str = response_text
-        
-        return json.loads(json_str.strip())
-    except (json.JSONDecodeError, IndexError):
+        return loads_json(strip_json_fences(response_text))
+    except json.JSONDecodeError:
         return {}
 
 
@@ -3,10 +3,48 @@ Base class for sentiment analyzers.
 
 All sentiment analyzers should inherit from BaseSentimentAnalyzer.
 """
+import json
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime, timedelta
+from typing import List, Optional
 
-from ..base import NewsItem, NewsAnalysisResult
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from ..base import NewsItem, NewsAnalysisResult, Sentiment
+
+
+# Markdown code fences around JSON replies; an unclosed fence runs to the end
+_JSON_FENCE_RE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+
+def strip_json_fences(text: str) -> str:
+    """Return the JSON payload of a model reply, unwrapping ```json fences."""
+    if text.lstrip().startswith("{"):
+        return text.strip()
+    match = _JSON_FENCE_RE.search(text) or _FENCE_RE.search(text)
+    return (match.group(1) if match else text).strip()
+
+
+def loads_json(text: str):
+    """
+    Decode JSON with orjson when installed, else the stdlib.
+    
+    Inputs orjson rejects (NaN/Infinity, >64-bit ints) are retried with
+    json.loads; genuinely invalid JSON raises json.JSONDecodeError either way.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
 
 class BaseSentimentAnalyzer(ABC):
@@ -24,6 +62,7 @@ class BaseSentimentAnalyzer(ABC):
         self, 
         news: List[NewsItem],
         ticker: str,
+        now: Optional[datetime] = None,
     ) -> NewsAnalysisResult:
         """Analyze a batch of news and return aggregated result."""
         pass
@@ -32,8 +71,14 @@ class BaseSentimentAnalyzer(ABC):
         self,
         news: List[NewsItem],
         ticker: str,
+        now: Optional[datetime] = None,
     ) -> NewsAnalysisResult:
-        """Create aggregated result from analyzed news items."""
+        """
+        Create aggregated result from analyzed news items.
+        
+        ``now`` is the reference time for the 7d/30d news counts
+        (defaults to the current time, read once per batch).
+        """
         if not news:
             return NewsAnalysisResult(
                 ticker=ticker,
@@ -41,28 +86,28 @@ class BaseSentimentAnalyzer(ABC):
                 analyzer_type=self.analyzer_type,
             )
         
-        positive = sum(1 for n in news if n.is_positive)
-        negative = sum(1 for n in news if n.is_negative)
-        neutral = len(news) - positive - negative
-        
-        sentiment_scores = []
-        for n in news:
-            if n.sentiment.value == "positive":
-                sentiment_scores.append(n.impact_score if n.impact_score else 0.5)
-            elif n.sentiment.value == "negative":
-                sentiment_scores.append(-(n.impact_score if n.impact_score else 0.5))
-            else:
-                sentiment_scores.append(0)
-        
-        avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
-        
-        from datetime import datetime, timedelta
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         week_ago = now - timedelta(days=7)
         month_ago = now - timedelta(days=30)
         
-        news_7d = [n for n in news if n.publish_date >= week_ago]
-        news_30d = [n for n in news if n.publish_date >= month_ago]
+        # Single pass over the batch for counts, score and recency
+        positive = negative = news_7d = news_30d = 0
+        score_total = 0.0
+        for n in news:
+            if n.sentiment == Sentiment.POSITIVE:
+                positive += 1
+                score_total += n.impact_score if n.impact_score else 0.5
+            elif n.sentiment == Sentiment.NEGATIVE:
+                negative += 1
+                score_total -= n.impact_score if n.impact_score else 0.5
+            if n.publish_date >= month_ago:
+                news_30d += 1
+                if n.publish_date >= week_ago:
+                    news_7d += 1
+        
+        neutral = len(news) - positive - negative
+        avg_sentiment = score_total / len(news)
         
         return NewsAnalysisResult(
             ticker=ticker,
@@ -70,8 +115,8 @@ class BaseSentimentAnalyzer(ABC):
             news=news,
             sentiment_score=avg_sentiment,
             confidence=self._calculate_confidence(news),
-            news_count_7d=len(news_7d),
-            news_count_30d=len(news_30d),
+            news_count_7d=news_7d,
+            news_count_30d=news_30d,
             positive_count=positive,
             negative_count=negative,
             neutral_count=neutral,
@@ -85,8 +130,12 @@ class BaseSentimentAnalyzer(ABC):
         if not news:
             return 0.0
         
-        total_confidence = sum(n.confidence for n in news if n.confidence > 0)
-        count = sum(1 for n in news if n.confidence > 0)
+        total_confidence = 0.0
+        count = 0
+        for n in news:
+            if n.confidence > 0:
+                total_confidence += n.confidence
+                count += 1
         
         return total_confidence / count if count > 0 else 0.5
     
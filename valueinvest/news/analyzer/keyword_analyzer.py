@@ -3,10 +3,22 @@ Keyword-based sentiment analyzer.
 
 Analyzes sentiment using predefined positive/negative word lists.
 Supports both Chinese and English.
+
+When ``pyahocorasick`` is installed (``news`` extra), all lexicon words are
+found in a single Aho-Corasick pass over the text instead of one substring
+scan per word.
 """
 import re
-from typing import List, Set, Dict
 from collections import Counter
+from datetime import datetime
+from typing import List, Set, Dict, Optional, Tuple
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from .base import BaseSentimentAnalyzer
 from ..base import NewsItem, NewsAnalysisResult, Sentiment, NewsCategory
@@ -46,6 +58,32 @@ NEGATIVE_EN: Set[str] = {
     "decrease", "reduce", "cut", "layoff", "shutdown", "default",
 }
 
+# Subset of the Loughran-McDonald (2011) financial sentiment word lists.
+# Generic lists misread finance text ("liability", "tax" are not negative;
+# "impairment", "restatement" are), so these are preferred for filings/news.
+# Matching is by substring, so stems ("deteriorat", "penalt") cover inflections.
+LM_POSITIVE: Set[str] = {
+    "achieve", "attractive", "beneficial", "benefit", "boost", "breakthrough",
+    "effective", "efficiency", "enhance", "excellent", "exceptional",
+    "favorable", "improve", "improvement", "innovative", "leadership",
+    "opportunities", "outperform", "profitability", "profitable", "progress",
+    "rebound", "strength", "strong", "success", "surpass", "upturn",
+}
+
+LM_NEGATIVE: Set[str] = {
+    "adverse", "bankrupt", "breach", "closure", "decline", "deficit", "delay",
+    "deteriorat", "difficult", "downgrade", "downturn", "failure", "fraud",
+    "impairment", "investigation", "layoff", "litigation", "loss", "lost",
+    "negative", "penalt", "restatement", "restructuring", "shortfall",
+    "shutdown", "slowdown", "suspension", "termination", "unfavorable",
+    "violation", "weak", "writedown", "writeoff",
+}
+
+EN_LEXICONS: Dict[str, Tuple[Set[str], Set[str]]] = {
+    "generic": (POSITIVE_EN, NEGATIVE_EN),
+    "lm": (LM_POSITIVE, LM_NEGATIVE),
+}
+
 RISK_KEYWORDS_CN: Set[str] = {
     "风险", "诉讼", "调查", "处罚", "违约", "质押", "减持",
     "竞争加剧", "成本上升", "下滑", "压力", "不确定性",
@@ -93,6 +131,15 @@ CATEGORY_PATTERNS: Dict[NewsCategory, List[str]] = {
     ],
 }
 
+# Compiled once at import: one alternation per category, same priority order
+_CATEGORY_REGEXES: List[Tuple[NewsCategory, re.Pattern]] = [
+    (category, re.compile("|".join(patterns), re.IGNORECASE))
+    for category, patterns in CATEGORY_PATTERNS.items()
+]
+
+_RISK_WORDS = frozenset(RISK_KEYWORDS_CN | RISK_KEYWORDS_EN)
+_CATALYST_WORDS = frozenset(CATALYST_KEYWORDS_CN | CATALYST_KEYWORDS_EN)
+
 
 class KeywordSentimentAnalyzer(BaseSentimentAnalyzer):
     """Analyze sentiment using keyword matching."""
@@ -103,15 +150,43 @@ class KeywordSentimentAnalyzer(BaseSentimentAnalyzer):
         self,
         positive_words: Set[str] = None,
         negative_words: Set[str] = None,
+        en_lexicon: str = "generic",
     ):
-        self.positive_words = positive_words or (POSITIVE_CN | POSITIVE_EN)
-        self.negative_words = negative_words or (NEGATIVE_CN | NEGATIVE_EN)
+        """
+        Args:
+            positive_words: Override the positive word list entirely
+            negative_words: Override the negative word list entirely
+            en_lexicon: English word list combined with the Chinese one,
+                "generic" or "lm" (Loughran-McDonald financial lexicon)
+        """
+        if en_lexicon not in EN_LEXICONS:
+            raise ValueError(
+                f"Unknown en_lexicon: {en_lexicon}. Available: {list(EN_LEXICONS)}"
+            )
+        positive_en, negative_en = EN_LEXICONS[en_lexicon]
+        self.en_lexicon = en_lexicon
+        self.positive_words = positive_words or (POSITIVE_CN | positive_en)
+        self.negative_words = negative_words or (NEGATIVE_CN | negative_en)
+        self._all_words = frozenset(self.positive_words | self.negative_words)
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self._all_words:
+            self._automaton = ahocorasick.Automaton()
+            for word in self._all_words:
+                self._automaton.add_word(word, word)
+            self._automaton.make_automaton()
+    
+    def _find_words(self, text: str) -> Set[str]:
+        """Distinct lexicon words occurring in text (overlaps included)."""
+        if self._automaton is not None:
+            return {word for _, word in self._automaton.iter(text)}
+        return {word for word in self._all_words if word in text}
     
     def analyze_single(self, item: NewsItem) -> NewsItem:
         text = f"{item.title} {item.content}"
+        found = self._find_words(text)
         
-        positive_count = sum(1 for word in self.positive_words if word in text)
-        negative_count = sum(1 for word in self.negative_words if word in text)
+        positive_count = len(found.intersection(self.positive_words))
+        negative_count = len(found.intersection(self.negative_words))
         
         total = positive_count + negative_count
         
@@ -135,7 +210,7 @@ class KeywordSentimentAnalyzer(BaseSentimentAnalyzer):
                 item.confidence = 0.4
                 item.impact_score = positive_ratio - 0.5
         
-        item.keywords = self._extract_keywords(text)
+        item.keywords = self._extract_keywords(found)
         item.category = self._classify_category(text)
         
         return item
@@ -144,34 +219,31 @@ class KeywordSentimentAnalyzer(BaseSentimentAnalyzer):
         self, 
         news: List[NewsItem],
         ticker: str,
+        now: Optional[datetime] = None,
     ) -> NewsAnalysisResult:
         analyzed_news = [self.analyze_single(item) for item in news]
         
-        result = self.aggregate_results(analyzed_news, ticker)
+        result = self.aggregate_results(analyzed_news, ticker, now=now)
         result.risks = self._extract_risks(analyzed_news)
         result.catalysts = self._extract_catalysts(analyzed_news)
         
         return result
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        all_keywords = self.positive_words | self.negative_words
-        found = [word for word in all_keywords if word in text]
-        return list(set(found))[:10]
+    def _extract_keywords(self, found: Set[str]) -> List[str]:
+        return list(found)[:10]
     
     def _classify_category(self, text: str) -> NewsCategory:
-        for category, patterns in CATEGORY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return category
+        for category, regex in _CATEGORY_REGEXES:
+            if regex.search(text):
+                return category
         return NewsCategory.COMPANY
     
     def _extract_risks(self, news: List[NewsItem]) -> List[str]:
         risks = []
-        risk_words = RISK_KEYWORDS_CN | RISK_KEYWORDS_EN
         
         for item in news:
             text = f"{item.title} {item.content}"
-            for word in risk_words:
+            for word in _RISK_WORDS:
                 if word in text and word not in risks:
                     risks.append(word)
         
@@ -179,12 +251,11 @@ class KeywordSentimentAnalyzer(BaseSentimentAnalyzer):
     
     def _extract_catalysts(self, news: List[NewsItem]) -> List[str]:
         catalysts = []
-        catalyst_words = CATALYST_KEYWORDS_CN | CATALYST_KEYWORDS_EN
         
         for item in news:
             if item.is_positive:
                 text = f"{item.title} {item.content}"
-                for word in catalyst_words:
+                for word in _CATALYST_WORDS:
                     if word in text and word not in catalysts:
                         catalysts.append(word)
         
@@ -7,7 +7,7 @@ import json
 from typing import List, Optional
 from datetime import datetime
 
-from .base import BaseSentimentAnalyzer
+from .base import BaseSentimentAnalyzer, loads_json, strip_json_fences
 from ..base import NewsItem, NewsAnalysisResult, Sentiment, NewsCategory
 
 
@@ -121,12 +121,13 @@ class LLMSentimentAnalyzer(BaseSentimentAnalyzer):
         self,
         news: List[NewsItem],
         ticker: str,
+        now: Optional[datetime] = None,
     ) -> NewsAnalysisResult:
         analyzed_news = []
         for item in news:
             analyzed_news.append(self.analyze_single(item))
         
-        result = self.aggregate_results(analyzed_news, ticker)
+        result = self.aggregate_results(analyzed_news, ticker, now=now)
         
         if len(analyzed_news) > 0:
             batch_summary = self._get_batch_summary(analyzed_news, ticker)
@@ -170,11 +171,6 @@ class LLMSentimentAnalyzer(BaseSentimentAnalyzer):
     
     def _parse_json_response(self, content: str) -> dict:
         try:
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            
-            return json.loads(content.strip())
+            return loads_json(strip_json_fences(content))
         except json.JSONDecodeError:
             return {}
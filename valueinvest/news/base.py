@@ -48,7 +48,7 @@ class AnalystRating(Enum):
     STRONG_SELL = "strong_sell"
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """Single news item with sentiment analysis."""
     ticker: str
@@ -77,10 +77,14 @@ class NewsItem:
     @property
     def age_days(self) -> int:
         """Days since publication."""
-        return (datetime.now() - self.publish_date).days
+        return self.age_days_at(datetime.now())
+    
+    def age_days_at(self, now: datetime) -> int:
+        """Days since publication as of ``now`` (share one clock read per batch)."""
+        return (now - self.publish_date).days
 
 
-@dataclass
+@dataclass(slots=True)
 class Guidance:
     """Company guidance and analyst expectations."""
     ticker: str
@@ -148,7 +152,7 @@ class Guidance:
         return "insufficient_data"
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsAnalysisResult:
     """Aggregated news analysis result."""
     ticker: str
@@ -211,7 +215,7 @@ class NewsAnalysisResult:
         return max(self.guidance, key=lambda g: g.updated_date or datetime.min)
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsFetchResult:
     """Result from news fetching operation."""
     success: bool
@@ -8,6 +8,7 @@ from typing import List, Optional, Dict, Any
 
 from .base import BaseNewsFetcher
 from ..base import Market, NewsItem, Guidance, AnalystRating
+from ...session import get_http_session
 
 
 class YFinanceNewsFetcher(BaseNewsFetcher):
@@ -32,7 +33,7 @@ class YFinanceNewsFetcher(BaseNewsFetcher):
         news_items = []
         
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=get_http_session())
             news_list = stock.news
             
             if not news_list:
@@ -69,7 +70,7 @@ class YFinanceNewsFetcher(BaseNewsFetcher):
         guidance_list = []
         
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=get_http_session())
             
             recommendations = self._fetch_recommendations(stock)
             earnings_trend = self._fetch_earnings_trend(stock)
@@ -12,6 +12,7 @@ Usage:
     # Get appropriate fetcher for ticker
     fetcher = NewsRegistry.get_fetcher("00700")
 """
+import functools
 from typing import Dict, Type, Callable, List, Optional
 from .base import Market
 
@@ -36,20 +37,13 @@ class NewsRegistry:
     def register_detector(cls, detector: Callable[[str], Optional[Market]]) -> None:
         """Register a function that detects market from ticker string."""
         cls._market_detectors.append(detector)
+        _detect_market_cached.cache_clear()
     
     @classmethod
     def detect_market(cls, ticker: str) -> Market:
         """Detect which market a ticker belongs to."""
         cls._ensure_initialized()
-        
-        ticker = ticker.strip().upper()
-        
-        for detector in cls._market_detectors:
-            result = detector(ticker)
-            if result is not None:
-                return result
-        
-        raise ValueError(f"Cannot detect market for ticker: {ticker}")
+        return _detect_market_cached(ticker.strip().upper())
     
     @classmethod
     def get_fetcher(cls, ticker: str, **kwargs):
@@ -142,3 +136,20 @@ class NewsRegistry:
         cls._fetchers = {}
         cls._market_detectors = []
         cls._initialized = False
+        _detect_market_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_market_cached(ticker: str) -> Market:
+    """
+    Run the registered detectors for a normalized ticker.
+    
+    Memoized for repeated lookups; the cache is cleared whenever detectors
+    change (``register_detector``/``reset``).
+    """
+    for detector in NewsRegistry._market_detectors:
+        result = detector(ticker)
+        if result is not None:
+            return result
+    
+    raise ValueError(f"Cannot detect market for ticker: {ticker}")
@@ -12,6 +12,36 @@ from ..valuation.base import ValuationResult
 from ..news.base import NewsAnalysisResult, Guidance, AnalystRating
 
 
+_TYPE_LABELS = {
+    "bank": "银行/金融",
+    "dividend": "分红股",
+    "growth": "成长股",
+    "value": "价值股",
+    "general": "一般",
+}
+
+_TREND_LABELS = {
+    "improving": "📈 改善中",
+    "deteriorating": "📉 恶化中",
+    "stable": "➡️ 稳定",
+}
+
+_DIFF_LABELS = {
+    "above_consensus": "高于预期",
+    "below_consensus": "低于预期",
+    "in_line": "符合预期",
+    "insufficient_data": "-",
+}
+
+_RATING_LABELS = {
+    AnalystRating.STRONG_BUY: "强力买入",
+    AnalystRating.BUY: "买入",
+    AnalystRating.HOLD: "持有",
+    AnalystRating.SELL: "卖出",
+    AnalystRating.STRONG_SELL: "强力卖出",
+}
+
+
 class EnhancedReporter:
     """Generate enhanced reports with news sentiment analysis."""
     
@@ -334,41 +364,16 @@ class EnhancedReporter:
         return lines
     
     def _get_type_label(self, company_type: str) -> str:
-        labels = {
-            "bank": "银行/金融",
-            "dividend": "分红股",
-            "growth": "成长股",
-            "value": "价值股",
-            "general": "一般",
-        }
-        return labels.get(company_type, "一般")
+        return _TYPE_LABELS.get(company_type, "一般")
     
     def _get_trend_label(self, trend: str) -> str:
-        labels = {
-            "improving": "📈 改善中",
-            "deteriorating": "📉 恶化中",
-            "stable": "➡️ 稳定",
-        }
-        return labels.get(trend, trend)
+        return _TREND_LABELS.get(trend, trend)
     
     def _get_diff_label(self, diff: str) -> str:
-        labels = {
-            "above_consensus": "高于预期",
-            "below_consensus": "低于预期",
-            "in_line": "符合预期",
-            "insufficient_data": "-",
-        }
-        return labels.get(diff, diff)
+        return _DIFF_LABELS.get(diff, diff)
     
     def _get_rating_label(self, rating: AnalystRating) -> str:
-        labels = {
-            AnalystRating.STRONG_BUY: "强力买入",
-            AnalystRating.BUY: "买入",
-            AnalystRating.HOLD: "持有",
-            AnalystRating.SELL: "卖出",
-            AnalystRating.STRONG_SELL: "强力卖出",
-        }
-        return labels.get(rating, str(rating.value))
+        return _RATING_LABELS.get(rating, str(rating.value))
     
     def _format_range(
         self, 
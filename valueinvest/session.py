@@ -0,0 +1,34 @@
+"""
+Process-wide HTTP session shared by the yfinance-backed fetchers.
+
+Every ``yf.Ticker`` created by valueinvest (quotes, history, news, insider,
+buyback, cash flow, industry, peers) is given the session returned by
+``get_http_session()``. By default this is ``None``, which lets yfinance use
+its own shared, connection-pooled session. Install a session once to control
+pooling, proxies or retries for all fetchers at the same time.
+
+Usage:
+    from curl_cffi import requests
+    from valueinvest.session import set_http_session
+
+    set_http_session(requests.Session(impersonate="chrome"))
+
+AKShare does not accept a session object, so A-share fetchers are unaffected.
+"""
+from typing import Any, Optional
+
+_http_session: Optional[Any] = None
+
+
+def get_http_session() -> Optional[Any]:
+    """Return the shared session, or None to use yfinance's default."""
+    return _http_session
+
+
+def set_http_session(session: Optional[Any]) -> None:
+    """Install (or with None, remove) the session used by all yfinance fetchers."""
+    global _http_session
+    _http_session = session
+
+
+__all__ = ["get_http_session", "set_http_session"]
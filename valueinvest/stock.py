@@ -7,7 +7,12 @@ if TYPE_CHECKING:
     import pandas as pd
 
 
-@dataclass
+def _tail(days: int) -> slice:
+    """Slice selecting the rows ``DataFrame.tail(days)`` would (none for 0)."""
+    return slice(-days, None) if days else slice(0, 0)
+
+
+@dataclass(slots=True)
 class StockHistory:
     ticker: str
     df: Optional["pd.DataFrame"] = None
@@ -22,6 +27,9 @@ class StockHistory:
     prices_hfq: List[float] = field(default_factory=list)
     adjust_type: str = "qfq"
 
+    # Column arrays extracted from df/df_hfq, keyed by (adjust, column)
+    _columns: Dict[tuple, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     @classmethod
     def from_history_result(
         cls, result: "HistoryResult", result_hfq: Optional["HistoryResult"] = None
@@ -44,46 +52,68 @@ class StockHistory:
 
         return history
 
+    def _column(self, adjust: str, name: str):
+        """Return a DataFrame column as a NumPy array, extracted once per frame."""
+        df = self.df_hfq if adjust == "hfq" else self.df
+        key = (adjust, name)
+        cached = self._columns.get(key)
+        if cached is None or cached[0] is not df:
+            cached = (df, df[name].to_numpy(dtype=float))
+            self._columns[key] = cached
+        return cached[1]
+
     def get_recent_prices(self, days: int = 30, adjust: str = "qfq") -> List[dict]:
         df = self.df_hfq if adjust == "hfq" else self.df
         if df is None or df.empty:
             return []
 
-        recent = df.tail(days)
-        result = []
-        for idx, row in recent.iterrows():
-            date_str = idx.strftime("%Y-%m-%d") if hasattr(idx, "strftime") else str(idx)
-            result.append(
-                {
-                    "date": date_str,
-                    "open": float(row["open"]),
-                    "high": float(row["high"]),
-                    "low": float(row["low"]),
-                    "close": float(row["close"]),
-                    "volume": int(row["volume"]) if row["volume"] else 0,
-                }
-            )
-        return result
+        rows = _tail(days)
+        index = df.index[rows]
+        if hasattr(index, "strftime"):
+            dates = index.strftime("%Y-%m-%d").tolist()
+        else:
+            dates = [str(idx) for idx in index]
+
+        columns = zip(
+            dates,
+            self._column(adjust, "open")[rows].tolist(),
+            self._column(adjust, "high")[rows].tolist(),
+            self._column(adjust, "low")[rows].tolist(),
+            self._column(adjust, "close")[rows].tolist(),
+            self._column(adjust, "volume")[rows].tolist(),
+        )
+        return [
+            {
+                "date": date_str,
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": int(volume) if volume else 0,
+            }
+            for date_str, open_, high, low, close, volume in columns
+        ]
 
     def get_price_stats(self, days: int = 30, adjust: str = "qfq") -> dict:
         df = self.df_hfq if adjust == "hfq" else self.df
         if df is None or df.empty:
             return {}
 
-        recent = df.tail(days)
-        closes = recent["close"]
+        closes = self._column(adjust, "close")[_tail(days)]
+        if closes.size == 0:
+            return {}
 
         return {
-            "period_days": len(recent),
+            "period_days": len(closes),
             "high": float(closes.max()),
             "low": float(closes.min()),
             "avg": float(closes.mean()),
-            "latest": float(closes.iloc[-1]),
-            "change_pct": float((closes.iloc[-1] - closes.iloc[0]) / closes.iloc[0] * 100),
+            "latest": float(closes[-1]),
+            "change_pct": float((closes[-1] - closes[0]) / closes[0] * 100),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Stock:
     ticker: str
     name: str = ""
@@ -1,8 +1,10 @@
 """
 Valuation Engine - Unified interface for all valuation methods.
 """
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from itertools import repeat
+from typing import Any, Dict, List, Optional
 
 from .base import ValuationResult
 from .graham import GrahamNumber, GrahamFormula, NCAV
@@ -148,6 +150,9 @@ class ValuationEngine:
     # Methods that require CyclicalStock (not compatible with regular Stock)
     _CYCLICAL_STOCK_METHODS = set(CYCLICAL_METHODS)
 
+    # Below this many methods, run_parallel always runs serially
+    MIN_PARALLEL_METHODS = 4
+
     def __init__(self):
         self._methods = {
             "graham_number": GrahamNumber(),
@@ -294,42 +299,92 @@ class ValuationEngine:
         if methods is None:
             methods = self.DEFAULT_METHODS
 
-        results = []
-        for method in methods:
-            try:
-                result = self.run_single(stock, method, **kwargs)
-                results.append(result)
-            except ValueError as e:
-                results.append(
-                    ValuationResult(
-                        method=method,
-                        fair_value=0,
-                        current_price=stock.current_price,
-                        premium_discount=0,
-                        assessment=f"Error: {e}",
-                        missing_fields=[],
-                        confidence="N/A",
-                        applicability="Not Applicable",
-                        details={"error_type": "ValueError"},
-                    )
-                )
-            except Exception as e:
-                error_type = type(e).__name__
-                results.append(
-                    ValuationResult(
-                        method=method,
-                        fair_value=0,
-                        current_price=stock.current_price,
-                        premium_discount=0,
-                        assessment=f"Error ({error_type}): {e}",
-                        missing_fields=[],
-                        confidence="N/A",
-                        applicability="Not Applicable",
-                        details={"error_type": error_type},
-                    )
-                )
+        return [self._run_guarded(stock, method, kwargs) for method in methods]
 
-        return results
+    def run_parallel(
+        self,
+        stock,
+        methods: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> List[ValuationResult]:
+        """Run methods, optionally on a thread pool; results keep the order of ``methods``.
+
+        Each method takes microseconds, so by default this is ``run_multiple``.
+        A thread pool is only used when ``max_workers`` > 1 and there are at
+        least ``MIN_PARALLEL_METHODS`` methods, e.g. for methods that block on I/O.
+
+        Args:
+            stock: Stock to value
+            methods: Method names (default: DEFAULT_METHODS)
+            max_workers: Thread pool size (default: run serially)
+            **kwargs: Passed to valuation methods, as in run_multiple
+        """
+        if methods is None:
+            methods = self.DEFAULT_METHODS
+        if not max_workers or max_workers < 2 or len(methods) < self.MIN_PARALLEL_METHODS:
+            return self.run_multiple(stock, methods, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(methods))) as executor:
+            return list(executor.map(self._run_guarded, repeat(stock), methods, repeat(kwargs)))
+
+    def _run_guarded(self, stock, method: str, kwargs: Dict[str, Any]) -> ValuationResult:
+        """Run one method, converting exceptions into an error ValuationResult."""
+        try:
+            return self.run_single(stock, method, **kwargs)
+        except ValueError as e:
+            return ValuationResult(
+                method=method,
+                fair_value=0,
+                current_price=stock.current_price,
+                premium_discount=0,
+                assessment=f"Error: {e}",
+                missing_fields=[],
+                confidence="N/A",
+                applicability="Not Applicable",
+                details={"error_type": "ValueError"},
+            )
+        except Exception as e:
+            error_type = type(e).__name__
+            return ValuationResult(
+                method=method,
+                fair_value=0,
+                current_price=stock.current_price,
+                premium_discount=0,
+                assessment=f"Error ({error_type}): {e}",
+                missing_fields=[],
+                confidence="N/A",
+                applicability="Not Applicable",
+                details={"error_type": error_type},
+            )
+
+    def run_batch(
+        self, stocks: List[Any], methods: Optional[List[str]] = None, **kwargs
+    ) -> Dict[str, List]:
+        """Fair values for many stocks as parallel columns (structure of arrays).
+
+        Returns ``{"ticker": [...], "current_price": [...], <method>: [...]}``
+        with one entry per stock in every column, ready for
+        ``pandas.DataFrame``/``numpy.asarray``. Failed or inapplicable methods
+        contribute 0, as in run_multiple.
+
+        Args:
+            stocks: Stocks to value
+            methods: Method names (default: DEFAULT_METHODS)
+            **kwargs: Passed to valuation methods, as in run_multiple
+        """
+        # One column per method, so duplicates are dropped
+        methods = list(dict.fromkeys(self.DEFAULT_METHODS if methods is None else methods))
+
+        columns: Dict[str, List] = {
+            "ticker": [s.ticker for s in stocks],
+            "current_price": [s.current_price for s in stocks],
+        }
+        fair_values = [columns.setdefault(m, []) for m in methods]
+        for stock in stocks:
+            for column, result in zip(fair_values, self.run_multiple(stock, methods, **kwargs)):
+                column.append(result.fair_value)
+        return columns
 
     def run_bank(self, stock, **kwargs) -> List[ValuationResult]:
         return self.run_multiple(stock, self.BANK_METHODS, **kwargs)
@@ -352,6 +407,18 @@ class ValuationEngine:
     def run_all(self, stock, **kwargs) -> List[ValuationResult]:
         return self.run_multiple(stock, list(self._methods.keys()), **kwargs)
 
+    def list_methods(self, company_type: str = "all") -> List[str]:
+        """Method names run for a company type ("bank", "dividend", "growth",
+        "value", "cyclical"); anything else means every registered method."""
+        by_type = {
+            "bank": self.BANK_METHODS,
+            "dividend": self.DIVIDEND_METHODS,
+            "growth": self.GROWTH_METHODS,
+            "value": self.VALUE_METHODS,
+            "cyclical": self.CYCLICAL_METHODS if CYCLICAL_AVAILABLE else [],
+        }
+        return list(by_type.get(company_type, self._methods.keys()))
+
     def get_recommended_methods(self, stock) -> Dict[str, List[str]]:
         recommendations = {
             "primary": [],
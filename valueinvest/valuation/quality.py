@@ -5,11 +5,35 @@ Includes:
 - Owner Earnings: Warren Buffett's method for calculating true distributable earnings
 - Altman Z-Score: Bankruptcy prediction model
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from dataclasses import dataclass
 from .base import BaseValuation, ValuationResult, ValuationRange, FieldRequirement
 
 
+def _compute_z(
+    working_capital: float,
+    retained_earnings: float,
+    ebit: float,
+    market_cap: float,
+    revenue: float,
+    total_assets: float,
+    total_liabilities: float,
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Altman Z-Score from already-estimated inputs.
+
+    Returns (z, x1, x2, x3, x4, x5). Shared by AltmanZScore and
+    ValueTrapDetector, which each decide how to fill in missing inputs.
+    """
+    x1 = working_capital / total_assets if total_assets > 0 else 0
+    x2 = retained_earnings / total_assets if total_assets > 0 else 0
+    x3 = ebit / total_assets if total_assets > 0 else 0
+    x4 = market_cap / total_liabilities if total_liabilities > 0 else 0
+    x5 = revenue / total_assets if total_assets > 0 else 0
+    z = 1.2 * x1 + 1.4 * x2 + 3.3 * x3 + 0.6 * x4 + 1.0 * x5
+    return z, x1, x2, x3, x4, x5
+
+
 class OwnerEarnings(BaseValuation):
     """
     Warren Buffett's Owner Earnings calculation.
@@ -270,25 +294,23 @@ class AltmanZScore(BaseValuation):
                 f"Total liabilities estimated at 50% of assets: {total_liabilities/1e9:.2f}B"
             )
 
-        # X1: Working Capital / Total Assets
+        # X1: Working Capital
         # Use current_assets - total_liabilities as approximation if net_working_capital available
         nwc = stock.net_working_capital
         if nwc == 0 and stock.current_assets > 0:
             # Estimate: Current Assets - Current Liabilities (assume CL = 30% of total liabilities)
             nwc = stock.current_assets - (total_liabilities * 0.3)
             warnings.append("Working Capital estimated from current assets")
-        x1 = nwc / total_assets if total_assets > 0 else 0
 
-        # X2: Retained Earnings / Total Assets
+        # X2: Retained Earnings
         retained_earnings = stock.retained_earnings
         if retained_earnings == 0 or (isinstance(retained_earnings, float) and retained_earnings != retained_earnings):
             # Estimate: Assume 30% of equity is retained earnings
             equity = total_assets - total_liabilities
             retained_earnings = equity * 0.3
             warnings.append("Retained earnings estimated at 30% of equity")
-        x2 = retained_earnings / total_assets if total_assets > 0 else 0
 
-        # X3: EBIT / Total Assets (operating performance)
+        # X3: EBIT (operating performance)
         ebit = stock.ebit
         if ebit == 0 and stock.operating_margin > 0 and stock.revenue > 0:
             ebit = stock.revenue * (stock.operating_margin / 100)
@@ -298,22 +320,21 @@ class AltmanZScore(BaseValuation):
             ebit = stock.net_income * 1.3 if stock.net_income > 0 else 0
             if ebit > 0:
                 warnings.append("EBIT estimated from net income")
-        x3 = ebit / total_assets if total_assets > 0 else 0
 
         # X4: Market Cap / Total Liabilities
         market_cap = stock.market_cap
-        x4 = market_cap / total_liabilities if total_liabilities > 0 else 0
 
-        # X5: Revenue / Total Assets (asset turnover)
+        # X5: Revenue (asset turnover)
         revenue = stock.revenue
         if revenue == 0:
             # Estimate from net income assuming 10% margin
             revenue = stock.net_income * 10 if stock.net_income > 0 else total_assets * 0.8
             warnings.append("Revenue estimated from net income")
-        x5 = revenue / total_assets if total_assets > 0 else 0
 
-        # Calculate Z-Score
-        z_score = 1.2 * x1 + 1.4 * x2 + 3.3 * x3 + 0.6 * x4 + 1.0 * x5
+        # Calculate Z-Score (each ratio is divided by total assets, X4 by liabilities)
+        z_score, x1, x2, x3, x4, x5 = _compute_z(
+            nwc, retained_earnings, ebit, market_cap, revenue, total_assets, total_liabilities
+        )
 
         # Determine zone and assessment
         if z_score >= self.zone_safe:
@@ -22,6 +22,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from enum import Enum
 from .base import BaseValuation, ValuationResult, FieldRequirement
+from .quality import _compute_z
 
 
 class TrapRiskLevel(Enum):
@@ -380,35 +381,28 @@ class ValueTrapDetector(BaseValuation):
         if total_liabilities <= 0:
             total_liabilities = total_assets * 0.5  # Estimate
 
-        # X1: Working Capital / Total Assets
+        # X1: Working Capital
         nwc = stock.net_working_capital
         if nwc == 0 and stock.current_assets > 0:
             nwc = stock.current_assets - (total_liabilities * 0.3)
-        x1 = nwc / total_assets if total_assets > 0 else 0
 
-        # X2: Retained Earnings / Total Assets
+        # X2: Retained Earnings
         re = stock.retained_earnings
         if re == 0:
             equity = total_assets - total_liabilities
             re = equity * 0.3  # Estimate
-        x2 = re / total_assets if total_assets > 0 else 0
 
-        # X3: EBIT / Total Assets
+        # X3: EBIT
         ebit = stock.ebit
         if ebit == 0 and stock.operating_margin > 0 and stock.revenue > 0:
             ebit = stock.revenue * (stock.operating_margin / 100)
         elif ebit == 0 and stock.net_income > 0:
             ebit = stock.net_income * 1.3
-        x3 = ebit / total_assets if total_assets > 0 else 0
 
-        # X4: Market Cap / Total Liabilities
-        x4 = stock.market_cap / total_liabilities if total_liabilities > 0 else 0
-
-        # X5: Revenue / Total Assets
-        x5 = stock.revenue / total_assets if total_assets > 0 else 0
-
-        # Calculate Z-Score
-        z_score = 1.2 * x1 + 1.4 * x2 + 3.3 * x3 + 0.6 * x4 + 1.0 * x5
+        # Calculate Z-Score (X4 = market cap / liabilities, X5 = revenue / assets)
+        z_score = _compute_z(
+            nwc, re, ebit, stock.market_cap, stock.revenue, total_assets, total_liabilities
+        )[0]
 
         # Z-Score indicator
         if z_score < self.Z_DISTRESS: